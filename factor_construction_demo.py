@@ -187,6 +187,11 @@ report = q.validate_factor(
     plot_title="Investment Factor: user vs reference",
 )
 
+# 플롯은 지연 렌더링: report.figure에 처음 접근할 때 그려지고 pyplot에 등록됨
+if report.figure is not None:
+    import matplotlib.pyplot as plt
+    plt.show()
+
 
 # %%
 print("\n검증 리포트:")
@@ -0,0 +1,461 @@
+"""
+qdl.benchmark
+
+Benchmark suite for the loaders, pivoting, factor construction and validation,
+run on synthetic data (qdl.synthetic), plus a startup (import-time) budget.
+
+Cases (each parameterized by data size, see SIZES):
+- `load_factors`       QDL.load_factors (factor CSV → wide)
+- `load_char_dataset`  QDL.load_char_dataset (projected Parquet read)
+- `load_char`          QDL.load_char (read + pivot of one characteristic)
+- `to_wide`            transformer.to_wide on a pre-loaded long frame
+- `validate_factor`    validator.validate_factor on pre-loaded wide frames
+- `replicate`          QDL.build_factors for every reference factor + validate_factor
+
+Facade cases use `QDL(cache=False)` so each repetition does the full work.
+Each case is timed `repeat` times, then run once more under tracemalloc for
+the Python-heap peak. By default every case × size runs in a fresh
+interpreter, so the process RSS high-water mark (`rss_peak_bytes`, the only
+view of Arrow buffers) belongs to that case alone; `rss_setup_bytes` is the
+mark before the first timed call (interpreter, imports and case setup).
+`run_suite(isolate=False)` / `--in-process` runs everything in the calling
+process and records no RSS.
+
+Results are machine-readable JSON (environment, git commit, import timing and
+one record per case × size) so runs can be compared across commits:
+
+    python -m qdl.benchmark --sizes small,medium --output bench.json
+    python -m qdl.benchmark --compare bench_before.json --output bench_after.json
+    python -m qdl.benchmark --import-only      # exit code 1 over the import budget
+
+Startup: `measure_import` times `import <module>` in fresh interpreters, on top
+of a numpy + pandas baseline that every qdl process pays anyway, and records
+which optional heavy dependencies the import itself pulled in.
+`check_import_budget` enforces that qdl's own import cost stays under
+`IMPORT_BUDGET_MS` and that matplotlib does not load until a figure is rendered.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from qdl import config as _config
+from qdl.config import PROJ_PATH
+
+
+# qdl's own import time on top of numpy + pandas (median over fresh interpreters)
+IMPORT_BUDGET_MS = 150.0
+
+# Optional dependencies that must only load on first use
+HEAVY_MODULES: Tuple[str, ...] = ("matplotlib", "pyarrow", "scipy")
+FORBIDDEN_AT_IMPORT: Tuple[str, ...] = ("matplotlib",)
+
+_IMPORT_SNIPPET = """
+import json, sys, time
+t0 = time.perf_counter()
+import numpy, pandas
+t1 = time.perf_counter()
+before = set(sys.modules)
+import importlib
+importlib.import_module({module!r})
+t2 = time.perf_counter()
+heavy = {heavy!r}
+new = set(sys.modules) - before
+print(json.dumps({{
+    "baseline_ms": (t1 - t0) * 1e3,
+    "module_ms": (t2 - t1) * 1e3,
+    "loaded": sorted(m for m in heavy if m in new),
+}}))
+"""
+
+
+@dataclass
+class ImportTiming:
+    """Median timings (milliseconds) of importing `module` in fresh interpreters."""
+
+    module: str
+    baseline_ms: float
+    module_ms: float
+    repeat: int
+    loaded: List[str]
+
+
+def _subprocess_env() -> Dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (str(PROJ_PATH), env.get("PYTHONPATH")) if p)
+    return env
+
+
+def measure_import(module: str = "qdl.facade", *, repeat: int = 5) -> ImportTiming:
+    """Import `module` in `repeat` fresh interpreters and return median timings."""
+    if repeat < 1:
+        raise ValueError("repeat must be >= 1")
+    env = _subprocess_env()
+    code = _IMPORT_SNIPPET.format(module=module, heavy=HEAVY_MODULES)
+    runs = []
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True
+        )
+        runs.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    return ImportTiming(
+        module=module,
+        baseline_ms=statistics.median(r["baseline_ms"] for r in runs),
+        module_ms=statistics.median(r["module_ms"] for r in runs),
+        repeat=repeat,
+        loaded=sorted({m for r in runs for m in r["loaded"]}),
+    )
+
+
+def check_import_budget(
+    module: str = "qdl.facade",
+    *,
+    budget_ms: float = IMPORT_BUDGET_MS,
+    forbidden: Sequence[str] = FORBIDDEN_AT_IMPORT,
+    repeat: int = 5,
+) -> ImportTiming:
+    """Measure `module`'s import; raise RuntimeError when over budget or a forbidden module loads."""
+    timing = measure_import(module, repeat=repeat)
+    eager = [m for m in forbidden if m in timing.loaded]
+    if eager:
+        raise RuntimeError(f"import {module} eagerly loads {eager}")
+    if timing.module_ms > budget_ms:
+        raise RuntimeError(
+            f"import {module} took {timing.module_ms:.1f} ms (budget {budget_ms:.1f} ms)"
+        )
+    return timing
+
+
+# ---------------- Suite -----------------
+
+@dataclass(frozen=True)
+class BenchmarkSize:
+    """Synthetic data shape for one benchmark tier."""
+
+    name: str
+    n_stocks: int
+    n_months: int
+    n_extra_chars: int = 0
+
+
+SIZES: Dict[str, BenchmarkSize] = {
+    "small": BenchmarkSize("small", n_stocks=500, n_months=60),
+    "medium": BenchmarkSize("medium", n_stocks=2_000, n_months=240, n_extra_chars=10),
+    "large": BenchmarkSize("large", n_stocks=5_000, n_months=600, n_extra_chars=40),
+}
+
+CASES: Tuple[str, ...] = ("load_factors", "load_char_dataset", "load_char", "to_wide", "validate_factor", "replicate")
+
+_COUNTRY = "usa"
+_VINTAGE = "2020-"
+_WEIGHTING = "vw"
+_CHAR = "be_me"
+
+
+@dataclass
+class BenchmarkResult:
+    """Timings (seconds) and memory high-water marks (bytes) of one case at one size."""
+
+    case: str
+    size: str
+    params: Dict[str, Any]
+    repeat: int
+    times_s: List[float]
+    median_s: float
+    min_s: float
+    tracemalloc_peak_bytes: int
+    rss_peak_bytes: Optional[int]
+    rss_setup_bytes: Optional[int] = None
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+
+def _rss_peak_bytes() -> Optional[int]:
+    try:
+        import resource
+    except ImportError:  # pragma: no cover - non-POSIX
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return int(peak) if sys.platform == "darwin" else int(peak) * 1024
+
+
+def _measure(fn: Callable[[], Any], *, repeat: int) -> Tuple[List[float], int, Any]:
+    times = []
+    out = None
+    for _ in range(repeat):
+        out = None
+        gc.collect()
+        t0 = time.perf_counter()
+        out = fn()
+        times.append(time.perf_counter() - t0)
+    del out
+    gc.collect()
+    tracemalloc.start()
+    try:
+        out = fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return times, int(peak), out
+
+
+def _prepare_data(size: BenchmarkSize, root: Path, *, seed: int) -> None:
+    from qdl import synthetic
+
+    marker = root / f".qdl_benchmark_{size.name}_{seed}"
+    if marker.exists():
+        return
+    synthetic.write_synthetic_data(
+        root,
+        countries=(_COUNTRY,),
+        vintages=(_VINTAGE,),
+        datasets=("factor",),
+        weightings=(_WEIGHTING,),
+        n_stocks=size.n_stocks,
+        n_months=size.n_months,
+        n_extra_chars=size.n_extra_chars,
+        duplicate_rate=0.0,
+        seed=seed,
+    )
+    marker.touch()
+
+
+def _case_functions(case: str) -> Tuple[Callable[[], Any], Dict[str, Any]]:
+    """Return (timed function, extra info) for `case`; setup work happens here, untimed."""
+    import numpy as np
+
+    from qdl import dataloader, transformer, validator
+    from qdl.facade import QDL
+
+    if case == "load_factors":
+        return (lambda: QDL(cache=False).load_factors(country=_COUNTRY, dataset="factor", weighting=_WEIGHTING)), {}
+    if case == "load_char_dataset":
+        columns = ["size_grp", "market_equity", "ret_exc", _CHAR]
+        return (
+            lambda: QDL(cache=False).load_char_dataset(country=_COUNTRY, vintage=_VINTAGE, columns=columns)
+        ), {"columns": columns}
+    if case == "load_char":
+        return (lambda: QDL(cache=False).load_char(country=_COUNTRY, vintage=_VINTAGE, char=_CHAR)), {"char": _CHAR}
+    if case == "to_wide":
+        long_df = dataloader.load_chars(file_name=f"jkp_{_VINTAGE}_{_COUNTRY}.parquet", columns=["eom", "id", _CHAR])
+        return (
+            lambda: transformer.to_wide(long_df, index_cols=["eom"], column_col="id", value_col=_CHAR)
+        ), {"rows": int(len(long_df))}
+    if case == "validate_factor":
+        ref = QDL(cache=False).load_factors(country=_COUNTRY, dataset="factor", weighting=_WEIGHTING)
+        noise = np.random.default_rng(0).normal(0.0, 1e-3, size=ref.shape)
+        user = ref + noise
+        return (
+            lambda: validator.validate_factor(user=user, reference=ref, return_plot=False)
+        ), {"shape": list(ref.shape)}
+    if case == "replicate":
+        def _replicate() -> Any:
+            q = QDL(cache=False)
+            built = q.build_factors(country=_COUNTRY, vintage=_VINTAGE, weighting=_WEIGHTING, max_workers=1)
+            return q.validate_factor(user=built, weighting=_WEIGHTING, return_plot=False)
+
+        return _replicate, {}
+    raise ValueError(f"Unknown benchmark case: {case} (choose from {list(CASES)})")
+
+
+_CASE_SNIPPET = """
+import json
+from dataclasses import asdict
+from pathlib import Path
+from qdl import benchmark
+result = benchmark._run_case({case!r}, {size!r}, Path({root!r}), repeat={repeat!r}, rss=True)
+print(json.dumps(asdict(result)))
+"""
+
+
+def _run_case(case: str, size_name: str, root: Path, *, repeat: int, rss: bool) -> BenchmarkResult:
+    """Set up and time `case` on the data under `root`; `rss` records this process's high-water marks."""
+    with _config.data_root(root):
+        fn, extra = _case_functions(case)
+        rss_setup = _rss_peak_bytes() if rss else None
+        times, traced_peak, out = _measure(fn, repeat=repeat)
+        rss_peak = _rss_peak_bytes() if rss else None
+    if case == "replicate":
+        extra = {**extra, "rmse": out.rmse, "n_factors": out.diagnostics["num_factors"]}
+    del out
+    return BenchmarkResult(
+        case=case,
+        size=size_name,
+        params=asdict(SIZES[size_name]),
+        repeat=repeat,
+        times_s=times,
+        median_s=statistics.median(times),
+        min_s=min(times),
+        tracemalloc_peak_bytes=traced_peak,
+        rss_peak_bytes=rss_peak,
+        rss_setup_bytes=rss_setup,
+        extra=extra,
+    )
+
+
+def _run_case_isolated(case: str, size_name: str, root: Path, *, repeat: int) -> BenchmarkResult:
+    """`_run_case` in a fresh interpreter, so the RSS high-water mark is this case's own."""
+    code = _CASE_SNIPPET.format(case=case, size=size_name, root=str(root), repeat=repeat)
+    out = subprocess.run([sys.executable, "-c", code], env=_subprocess_env(), capture_output=True, text=True)
+    if out.returncode != 0:
+        raise RuntimeError(f"benchmark case {case} [{size_name}] failed:\n{out.stderr.strip()}")
+    return BenchmarkResult(**json.loads(out.stdout.strip().splitlines()[-1]))
+
+
+def run_suite(
+    *,
+    sizes: Sequence[str] = ("small",),
+    cases: Sequence[str] = CASES,
+    repeat: int = 3,
+    data_root: Optional[Path] = None,
+    seed: int = 0,
+    isolate: bool = True,
+) -> List[BenchmarkResult]:
+    """
+    Generate (or reuse) synthetic data per size and run every case.
+
+    `data_root` keeps generated data between runs (`<data_root>/<size>`); by
+    default a temporary directory is used and removed afterwards. With
+    `isolate` (default) each case × size runs in its own interpreter and
+    records its RSS high-water mark; `isolate=False` runs in this process
+    and leaves `rss_peak_bytes` as None.
+    """
+    unknown = [s for s in sizes if s not in SIZES]
+    if unknown:
+        raise ValueError(f"Unknown sizes: {unknown} (choose from {list(SIZES)})")
+    bad_cases = [c for c in cases if c not in CASES]
+    if bad_cases:
+        raise ValueError(f"Unknown benchmark cases: {bad_cases} (choose from {list(CASES)})")
+    if repeat < 1:
+        raise ValueError("repeat must be >= 1")
+
+    results: List[BenchmarkResult] = []
+    with tempfile.TemporaryDirectory(prefix="qdl_bench_") as tmp:
+        base = Path(data_root) if data_root is not None else Path(tmp)
+        for size_name in sizes:
+            size = SIZES[size_name]
+            root = base / size.name
+            _prepare_data(size, root, seed=seed)
+            for case in cases:
+                if isolate:
+                    results.append(_run_case_isolated(case, size.name, root, repeat=repeat))
+                else:
+                    results.append(_run_case(case, size.name, root, repeat=repeat, rss=False))
+    return results
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=PROJ_PATH, capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def environment() -> Dict[str, Any]:
+    """Interpreter, library versions, platform and git commit of this run."""
+    import numpy as np
+    import pandas as pd
+
+    try:
+        import pyarrow as pa
+
+        pyarrow_version: Optional[str] = pa.__version__
+    except ImportError:  # pragma: no cover - pyarrow is optional for some paths
+        pyarrow_version = None
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "pyarrow": pyarrow_version,
+    }
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Per (case, size) median-time and memory ratios current / baseline for two JSON reports."""
+    before = {(r["case"], r["size"]): r for r in baseline.get("results", [])}
+    rows = []
+    for r in current.get("results", []):
+        b = before.get((r["case"], r["size"]))
+        if b is None:
+            continue
+        rows.append(
+            {
+                "case": r["case"],
+                "size": r["size"],
+                "median_s": r["median_s"],
+                "baseline_median_s": b["median_s"],
+                "time_ratio": r["median_s"] / b["median_s"] if b["median_s"] else None,
+                "tracemalloc_ratio": (
+                    r["tracemalloc_peak_bytes"] / b["tracemalloc_peak_bytes"] if b["tracemalloc_peak_bytes"] else None
+                ),
+            }
+        )
+    return rows
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m qdl.benchmark", description=__doc__.split("\n\n")[1])
+    parser.add_argument("--sizes", default="small", help=f"comma-separated subset of {list(SIZES)}")
+    parser.add_argument("--cases", default=",".join(CASES), help="comma-separated subset of the cases")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--data-root", type=Path, default=None, help="reuse generated data under this directory")
+    parser.add_argument("--output", type=Path, default=None, help="write the JSON report here (default: stdout)")
+    parser.add_argument("--compare", type=Path, default=None, help="baseline JSON report to compare against")
+    parser.add_argument("--import-only", action="store_true", help="only measure and enforce the import budget")
+    parser.add_argument("--in-process", action="store_true", help="run all cases in this interpreter (no RSS)")
+    args = parser.parse_args(argv)
+
+    timing = measure_import()
+    over_budget = timing.module_ms > IMPORT_BUDGET_MS or any(m in timing.loaded for m in FORBIDDEN_AT_IMPORT)
+    report: Dict[str, Any] = {"environment": environment(), "import": asdict(timing)}
+    if not args.import_only:
+        results = run_suite(
+            sizes=[s for s in args.sizes.split(",") if s],
+            cases=[c for c in args.cases.split(",") if c],
+            repeat=args.repeat,
+            data_root=args.data_root,
+            seed=args.seed,
+            isolate=not args.in_process,
+        )
+        report["results"] = [asdict(r) for r in results]
+        if args.compare is not None:
+            baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+            report["comparison"] = {
+                "baseline_commit": baseline.get("environment", {}).get("git_commit"),
+                "rows": compare_results(baseline, report),
+            }
+
+    text = json.dumps(report, indent=2, default=str)
+    if args.output is not None:
+        args.output.write_text(text, encoding="utf-8")
+        for row in report.get("comparison", {}).get("rows", []):
+            ratio = f"x{row['time_ratio']:.2f}" if row["time_ratio"] is not None else "n/a"
+            print(f"{row['case']:>18} [{row['size']}] {row['median_s']:.4f}s  {ratio} vs baseline")
+    else:
+        print(text)
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
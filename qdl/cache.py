@@ -0,0 +1,304 @@
+"""
+qdl.cache
+
+In-process, byte-size-aware LRU cache for frames produced by the facade.
+
+Entries are keyed on a caller-provided hashable key (typically the resolved
+file path plus projection/date column) and carry a file fingerprint
+(`st_mtime_ns`, `st_size`). A lookup whose fingerprint no longer matches the
+stored one is treated as a miss and the stale entry is dropped, so edits to
+the underlying CSV/Parquet are picked up without manual invalidation.
+
+All operations take an internal lock, so one cache can be shared by threads
+(e.g. `QDL.load_many`); loaders run outside the lock.
+
+Loads are single-flight: concurrent `get_or_load` calls for the same key and
+fingerprint run the loader once; the other callers wait for that result (or
+re-raise its exception). `single_flight` offers the same deduplication for
+work whose result is not stored as one entry. Waiting blocks the calling
+thread, so asyncio code should call the facade from a worker thread
+(`QDL.aload`, `QDL.aload_many`).
+
+Frames handed out by the cache are protected against caller mutation:
+- With pandas Copy-on-Write active (pandas >= 3, or `mode.copy_on_write=True`),
+  a shallow copy is returned; writes trigger a private copy.
+- Otherwise, a deep copy is returned.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Literal, Optional, Tuple, Union
+
+import pandas as pd
+
+
+Fingerprint = Tuple[int, int]
+
+DEFAULT_MAX_BYTES = 2 * 1024**3  # 2 GiB
+
+
+@dataclass
+class CacheStats:
+    """Snapshot of cache counters and occupancy."""
+
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    entries: int
+    current_bytes: int
+    max_bytes: int
+    coalesced: int = 0  # calls that waited on another thread's in-flight load
+
+
+FetchStatus = Literal["hit", "miss", "shared"]
+
+
+def file_fingerprint(path: Union[str, Path]) -> Fingerprint:
+    """Return (mtime_ns, size) for `path`; used to detect on-disk changes."""
+    st = Path(path).stat()
+    return (int(st.st_mtime_ns), int(st.st_size))
+
+
+def frame_nbytes(obj: Any) -> int:
+    """Approximate in-memory size of a DataFrame/Series (including index)."""
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        usage = obj.memory_usage(index=True, deep=True)
+        return int(usage.sum()) if isinstance(usage, pd.Series) else int(usage)
+    if isinstance(obj, dict):
+        return sum(frame_nbytes(v) for v in obj.values())
+    nbytes = getattr(obj, "nbytes", None)
+    return int(nbytes) if nbytes is not None else 0
+
+
+def _copy_on_write_enabled() -> bool:
+    if int(pd.__version__.split(".")[0]) >= 3:
+        return True
+    try:
+        return pd.get_option("mode.copy_on_write") is True
+    except (KeyError, pd.errors.OptionError):  # pragma: no cover - very old pandas
+        return False
+
+
+def protect(obj: Any) -> Any:
+    """Return a view of `obj` that callers may mutate without corrupting the cache."""
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        return obj.copy(deep=not _copy_on_write_enabled())
+    if isinstance(obj, dict):
+        return {k: protect(v) for k, v in obj.items()}
+    return obj
+
+
+class _Flight:
+    """Result slot of one in-flight load, awaited by concurrent callers."""
+
+    def __init__(self) -> None:
+        self._done = threading.Event()
+        self._value: Any = None
+        self._error: Optional[BaseException] = None
+
+    def set_result(self, value: Any) -> None:
+        self._value = value
+        self._done.set()
+
+    def set_error(self, error: BaseException) -> None:
+        self._error = error
+        self._done.set()
+
+    def wait(self) -> Any:
+        self._done.wait()
+        if self._error is not None:
+            raise self._error
+        return self._value
+
+
+class FrameCache:
+    """
+    Bounded LRU cache for pandas frames.
+
+    Parameters
+    ----------
+    max_bytes : int
+        Upper bound on the summed `frame_nbytes` of all entries. Least recently
+        used entries are evicted first. A single frame larger than `max_bytes`
+        is returned to the caller but not stored.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be non-negative")
+        self.max_bytes = int(max_bytes)
+        self._entries: "OrderedDict[Hashable, Tuple[Fingerprint, Any, int]]" = OrderedDict()
+        self._current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.coalesced = 0
+        self._lock = threading.RLock()
+        self._inflight: Dict[Hashable, _Flight] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    @property
+    def current_bytes(self) -> int:
+        return self._current_bytes
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                invalidations=self.invalidations,
+                entries=len(self._entries),
+                current_bytes=self._current_bytes,
+                max_bytes=self.max_bytes,
+                coalesced=self.coalesced,
+            )
+
+    def get(self, key: Hashable, fingerprint: Optional[Fingerprint]) -> Optional[Any]:
+        """Return a protected copy of the cached value, or None on miss/stale entry."""
+        with self._lock:
+            value = self._lookup(key, fingerprint)
+        return protect(value) if value is not None else None
+
+    def _lookup(self, key: Hashable, fingerprint: Optional[Fingerprint]) -> Optional[Any]:
+        # Caller holds the lock; returns the stored (unprotected) value.
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        stored_fp, value, _ = entry
+        if stored_fp != fingerprint:
+            self._drop(key)
+            self.invalidations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, fingerprint: Optional[Fingerprint], value: Any) -> None:
+        """Store `value` under `key`, evicting least recently used entries as needed."""
+        nbytes = frame_nbytes(value)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            if nbytes > self.max_bytes:
+                return
+            self._entries[key] = (fingerprint, value, nbytes)
+            self._current_bytes += nbytes
+            while self._current_bytes > self.max_bytes and self._entries:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self.evictions += 1
+
+    def get_or_load(
+        self,
+        key: Hashable,
+        fingerprint: Optional[Fingerprint],
+        loader: Callable[[], Any],
+    ) -> Any:
+        """Return the cached value for `key`, calling `loader()` and storing its result on miss."""
+        return self.fetch(key, fingerprint, loader)[0]
+
+    def fetch(
+        self,
+        key: Hashable,
+        fingerprint: Optional[Fingerprint],
+        loader: Callable[[], Any],
+    ) -> Tuple[Any, FetchStatus]:
+        """
+        `get_or_load` that also reports how the value was obtained.
+
+        Status is "hit" (cached), "miss" (this call ran `loader`) or "shared"
+        (waited for a concurrent call loading the same key and fingerprint).
+        """
+        flight_key = ("get_or_load", key, fingerprint)
+        with self._lock:
+            value = self._lookup(key, fingerprint)
+            if value is not None:
+                return protect(value), "hit"
+            flight = self._inflight.get(flight_key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[flight_key] = _Flight()
+            else:
+                self.coalesced += 1
+        if not leader:
+            return protect(flight.wait()), "shared"
+        try:
+            value = loader()
+            # Store before releasing the flight so later callers hit the cache
+            self.put(key, fingerprint, value)
+        except BaseException as exc:
+            flight.set_error(exc)
+            raise
+        else:
+            flight.set_result(value)
+        finally:
+            with self._lock:
+                self._inflight.pop(flight_key, None)
+        return protect(value), "miss"
+
+    def single_flight(self, key: Hashable, work: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Run `work()` unless an identical `key` is already running; then wait for its result.
+
+        Returns (result, shared). Results are not stored or protected; `work`
+        is expected to populate the cache itself (e.g. several entries at once).
+        """
+        flight_key = ("single_flight", key)
+        with self._lock:
+            flight = self._inflight.get(flight_key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[flight_key] = _Flight()
+            else:
+                self.coalesced += 1
+        if not leader:
+            return flight.wait(), True
+        try:
+            value = work()
+        except BaseException as exc:
+            flight.set_error(exc)
+            raise
+        else:
+            flight.set_result(value)
+        finally:
+            with self._lock:
+                self._inflight.pop(flight_key, None)
+        return value, False
+
+    def invalidate(self, predicate: Optional[Callable[[Hashable], bool]] = None) -> int:
+        """Drop entries whose key satisfies `predicate` (all when None). Returns the count dropped."""
+        with self._lock:
+            keys = [k for k in self._entries if predicate is None or predicate(k)]
+            for k in keys:
+                self._drop(k)
+            self.invalidations += len(keys)
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.invalidations = 0
+            self.coalesced = 0
+
+    def _drop(self, key: Hashable) -> None:
+        _, _, nbytes = self._entries.pop(key)
+        self._current_bytes -= nbytes
@@ -0,0 +1,361 @@
+"""
+qdl.catalog
+
+Metadata catalog of the data directory, persisted under `qdl.config.META_PATH`.
+
+`build_catalog` scans `data/chars/*.parquet` and `data/factors/*.csv` once and
+records, per file:
+- file fingerprint (`st_mtime_ns`, `st_size`) and row count
+- column names and types (Parquet: from the footer; CSV: header + inferred dtypes)
+- Parquet row-group statistics (row counts and min/max) for key columns
+  (`eom`, `date`, `id` when present) and file-level min/max of those columns
+- number of distinct ids (chars) and distinct factor names (factors)
+
+Parquet files are described from their footers plus a single-column read of
+`id_col` for the distinct count; factor CSVs read only `date` and `name`.
+Rebuilding reuses entries whose fingerprint is unchanged.
+
+When a file has an up-to-date partitioned copy (see `qdl.partition`), or only
+the copy is left, its entry describes the copy the loaders actually read:
+`path` is the dataset directory, `partitioned_from` the source file, and the
+row groups are those of every part file in year order. Such an entry goes
+stale when the copy is rewritten or stops matching its source; a plain file's
+entry goes stale once a partitioned copy takes over.
+
+The catalog is a JSON file (`META_PATH / "catalog.json"`). Entries are only
+trusted while the file's fingerprint still matches (`FileEntry.is_fresh`);
+callers fall back to reading the file otherwise.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union
+
+import pandas as pd
+
+from qdl import config as _config
+from qdl import dataloader as _dataloader
+from qdl.cache import file_fingerprint
+
+
+CATALOG_FILE_NAME = "catalog.json"
+CATALOG_VERSION = 1
+
+# Columns whose row-group statistics are recorded (when present)
+STATS_COLUMNS: Tuple[str, ...] = ("eom", "date", "id")
+
+FileKind = Literal["chars", "factors"]
+
+
+def _as_timestamp(value: Any) -> pd.Timestamp:
+    # Date statistics are ISO strings, or YYYYMMDD integers for int-coded date columns
+    if isinstance(value, int):
+        return pd.to_datetime(str(value), format="%Y%m%d")
+    return pd.Timestamp(value)
+
+
+@dataclass
+class RowGroupInfo:
+    """Row count and {column: [min, max]} statistics of one Parquet row group."""
+
+    num_rows: int
+    stats: Dict[str, List[Any]] = field(default_factory=dict)
+
+
+@dataclass
+class FileEntry:
+    """Catalog record for one data file. Date bounds are ISO strings."""
+
+    kind: FileKind
+    name: str
+    path: str
+    fingerprint: List[int]
+    num_rows: int
+    columns: List[str]
+    dtypes: Dict[str, str]
+    ranges: Dict[str, List[Any]] = field(default_factory=dict)
+    num_row_groups: Optional[int] = None
+    row_groups: List[RowGroupInfo] = field(default_factory=list)
+    n_ids: Optional[int] = None
+    factor_names: Optional[List[str]] = None
+    partitioned_from: Optional[str] = None
+
+    def is_fresh(self) -> bool:
+        """True while the file on disk still matches the recorded fingerprint (and is what the loaders read)."""
+        path = Path(self.path)
+        try:
+            if self.partitioned_from is not None:
+                if _dataloader.partitioned_chars_dir(Path(self.partitioned_from)) != path:
+                    return False
+                return list(file_fingerprint(path / _dataloader.PARTITION_MANIFEST)) == list(self.fingerprint)
+            if self.kind == "chars" and _dataloader.partitioned_chars_dir(path) is not None:
+                return False
+            return list(file_fingerprint(path)) == list(self.fingerprint)
+        except OSError:
+            return False
+
+    def date_range(self, date_col: str) -> Optional[Tuple[pd.Timestamp, pd.Timestamp]]:
+        bounds = self.ranges.get(date_col)
+        if not bounds or bounds[0] is None:
+            return None
+        return _as_timestamp(bounds[0]), _as_timestamp(bounds[1])
+
+    def plan_row_groups(
+        self,
+        *,
+        date_col: str,
+        start: Optional[Any] = None,
+        end: Optional[Any] = None,
+    ) -> List[int]:
+        """Row groups whose `date_col` statistics overlap [start, end] (all when unknown)."""
+        lo = pd.Timestamp(start) if start is not None else None
+        hi = pd.Timestamp(end) if end is not None else None
+        selected = []
+        for i, rg in enumerate(self.row_groups):
+            bounds = rg.stats.get(date_col)
+            if bounds is None or bounds[0] is None:
+                selected.append(i)
+                continue
+            rg_lo, rg_hi = _as_timestamp(bounds[0]), _as_timestamp(bounds[1])
+            if (hi is None or rg_lo <= hi) and (lo is None or rg_hi >= lo):
+                selected.append(i)
+        return selected
+
+
+@dataclass
+class Catalog:
+    """Catalog of data files keyed by "<kind>/<file name>"."""
+
+    files: Dict[str, FileEntry] = field(default_factory=dict)
+    version: int = CATALOG_VERSION
+
+    def entry(self, kind: FileKind, name: str, *, fresh: bool = True) -> Optional[FileEntry]:
+        """Entry for `name`, or None when unknown (or stale, with `fresh=True`)."""
+        entry = self.files.get(f"{kind}/{name}")
+        if entry is None or (fresh and not entry.is_fresh()):
+            return None
+        return entry
+
+    def names(self, kind: FileKind) -> List[str]:
+        return sorted(e.name for e in self.files.values() if e.kind == kind)
+
+    def resolve(
+        self,
+        kind: FileKind,
+        *,
+        file_name: Optional[str] = None,
+        patterns: Optional[List[str]] = None,
+    ) -> Optional[Path]:
+        """
+        Resolve one file from the catalog without touching the directory.
+
+        Mirrors `dataloader.resolve_chars_path` (exact name, or glob patterns that
+        must match exactly one file). Returns None when the catalog cannot answer
+        (unknown or stale entry); raises ValueError when patterns are ambiguous.
+        """
+        if file_name:
+            entry = self.entry(kind, file_name)
+            return Path(entry.path) if entry is not None else None
+        if not patterns:
+            raise ValueError("Provide either 'file_name' or one or more 'patterns' to locate a file")
+        matched = sorted({n for n in self.names(kind) for pat in patterns if fnmatch.fnmatchcase(n, pat)})
+        if len(matched) > 1:
+            raise ValueError(f"Ambiguous patterns; matched multiple files: {', '.join(matched)}")
+        if not matched:
+            return None
+        entry = self.entry(kind, matched[0])
+        return Path(entry.path) if entry is not None else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"version": self.version, "files": {k: asdict(v) for k, v in self.files.items()}}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Catalog":
+        files = {}
+        for key, raw in data.get("files", {}).items():
+            raw = dict(raw)
+            raw["row_groups"] = [RowGroupInfo(**rg) for rg in raw.get("row_groups", [])]
+            files[key] = FileEntry(**raw)
+        return cls(files=files, version=int(data.get("version", CATALOG_VERSION)))
+
+
+def catalog_path(meta_path: Optional[Union[str, Path]] = None) -> Path:
+    return Path(meta_path if meta_path is not None else _config.META_PATH) / CATALOG_FILE_NAME
+
+
+def _jsonable(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if hasattr(value, "isoformat"):
+        return pd.Timestamp(value).isoformat()
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+def _merge_range(current: Optional[List[Any]], lo: Any, hi: Any) -> List[Any]:
+    if current is None:
+        return [lo, hi]
+    return [min(current[0], lo), max(current[1], hi)]
+
+
+def _describe_parquet(path: Path, *, id_col: str, source: Optional[Path] = None) -> FileEntry:
+    """Entry for a Parquet file, or for the partitioned copy `path` of `source` (all part files, year order)."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    parts = sorted(path.glob("*/*/*.parquet")) if source is not None else [path]
+    schema = None
+    num_rows = 0
+    row_groups: List[RowGroupInfo] = []
+    ranges: Dict[str, List[Any]] = {}
+    ids = []
+    for part in parts:
+        pf = pq.ParquetFile(part)
+        schema = schema or pf.schema_arrow
+        meta = pf.metadata
+        num_rows += int(meta.num_rows)
+        positions = {name: i for i, name in enumerate(pf.schema.names)}
+        stats_cols = [c for c in STATS_COLUMNS if c in positions]
+        for i in range(meta.num_row_groups):
+            rg = meta.row_group(i)
+            info = RowGroupInfo(num_rows=int(rg.num_rows))
+            for col in stats_cols:
+                st = rg.column(positions[col]).statistics
+                if st is None or not st.has_min_max:
+                    info.stats[col] = [None, None]
+                    continue
+                lo, hi = _jsonable(st.min), _jsonable(st.max)
+                info.stats[col] = [lo, hi]
+                ranges[col] = _merge_range(ranges.get(col), lo, hi)
+            row_groups.append(info)
+        if id_col in pf.schema_arrow.names:
+            ids.append(pc.unique(pf.read(columns=[id_col]).column(0)))
+    if schema is None:
+        raise ValueError(f"No Parquet files under {path}")
+
+    n_ids = int(pc.count_distinct(pa.chunked_array(ids)).as_py()) if ids else None
+
+    return FileEntry(
+        kind="chars",
+        name=(source or path).name,
+        path=str(path.resolve()),
+        fingerprint=list(file_fingerprint(path / _dataloader.PARTITION_MANIFEST if source is not None else path)),
+        num_rows=num_rows,
+        columns=list(schema.names),
+        dtypes={f.name: str(f.type) for f in schema},
+        ranges=ranges,
+        num_row_groups=len(row_groups),
+        row_groups=row_groups,
+        n_ids=n_ids,
+        partitioned_from=str(source.resolve()) if source is not None else None,
+    )
+
+
+def _describe_factors_csv(path: Path, *, encoding: str) -> FileEntry:
+    sample = pd.read_csv(path, encoding=encoding, nrows=1000)
+    header = sample.columns
+    # Only the key columns are read in full (the first column when neither exists)
+    keys = [c for c in ("date", "name") if c in header] or list(header[:1])
+    df = pd.read_csv(path, encoding=encoding, usecols=keys)
+
+    ranges: Dict[str, List[Any]] = {}
+    factor_names = None
+    if "date" in df.columns and len(df):
+        dates = pd.to_datetime(df["date"], errors="raise")
+        ranges["date"] = [_jsonable(dates.min()), _jsonable(dates.max())]
+    if "name" in df.columns:
+        factor_names = sorted(df["name"].dropna().astype(str).unique().tolist())
+
+    return FileEntry(
+        kind="factors",
+        name=path.name,
+        path=str(path.resolve()),
+        fingerprint=list(file_fingerprint(path)),
+        num_rows=len(df),
+        columns=[str(c) for c in header],
+        dtypes={str(c): str(t) for c, t in sample.dtypes.items()},
+        ranges=ranges,
+        factor_names=factor_names,
+    )
+
+
+def load_catalog(meta_path: Optional[Union[str, Path]] = None) -> Optional[Catalog]:
+    """Read the persisted catalog, or None when absent, unreadable or of another version."""
+    path = catalog_path(meta_path)
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if data.get("version") != CATALOG_VERSION:
+        return None
+    try:
+        return Catalog.from_dict(data)
+    except TypeError:
+        return None
+
+
+def save_catalog(catalog: Catalog, meta_path: Optional[Union[str, Path]] = None) -> Path:
+    """Write `catalog` atomically (tmp file + rename) and return its path."""
+    path = catalog_path(meta_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(catalog.to_dict(), indent=1), encoding="utf-8")
+    os.replace(tmp, path)
+    return path
+
+
+def build_catalog(
+    *,
+    chars_path: Optional[Union[str, Path]] = None,
+    factors_path: Optional[Union[str, Path]] = None,
+    meta_path: Optional[Union[str, Path]] = None,
+    refresh: bool = False,
+    id_col: str = "id",
+    encoding: str = "utf-8",
+) -> Catalog:
+    """
+    Scan the characteristics and factors directories and persist the catalog.
+
+    Parameters
+    ----------
+    chars_path, factors_path, meta_path : path-like, optional
+        Directories to scan and to write `catalog.json` into; default to
+        `qdl.config.CHARS_PATH`, `FACTORS_PATH` and `META_PATH`.
+    refresh : bool, default False
+        Re-describe every file. Otherwise entries whose fingerprint is unchanged
+        are kept from the existing catalog.
+    """
+    chars_dir = Path(chars_path if chars_path is not None else _config.CHARS_PATH)
+    factors_dir = Path(factors_path if factors_path is not None else _config.FACTORS_PATH)
+    previous = None if refresh else load_catalog(meta_path)
+
+    files: Dict[str, FileEntry] = {}
+    chars_files = {p.name: p for p in chars_dir.glob("*.parquet")}
+    # Partitioned copies whose source file was removed still serve the loaders
+    for d in chars_dir.iterdir() if chars_dir.is_dir() else ():
+        if d.is_dir() and _dataloader.read_partition_manifest(d) is not None:
+            chars_files.setdefault(f"{d.name}.parquet", d.with_suffix(".parquet"))
+    sources = [("chars", chars_files[n]) for n in sorted(chars_files)]
+    sources += [("factors", p) for p in sorted(factors_dir.glob("*.csv"))]
+    for kind, path in sources:
+        key = f"{kind}/{path.name}"
+        copy = _dataloader.partitioned_chars_dir(path) if kind == "chars" else None
+        target = copy if copy is not None else path
+        old = previous.files.get(key) if previous is not None else None
+        if old is not None and old.path == str(target.resolve()) and old.is_fresh():
+            files[key] = old
+        elif kind == "chars":
+            files[key] = _describe_parquet(target, id_col=id_col, source=path if copy is not None else None)
+        else:
+            files[key] = _describe_factors_csv(path, encoding=encoding)
+
+    catalog = Catalog(files=files)
+    save_catalog(catalog, meta_path)
+    return catalog
@@ -1,8 +1,37 @@
+import os
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Iterator, Union
 
 PROJ_PATH = Path(__file__).resolve().parent.parent
-DATA_PATH = PROJ_PATH / 'data'
+# Data root; override with the QDL_DATA_PATH environment variable or set_data_root()
+DATA_PATH = Path(os.environ.get('QDL_DATA_PATH', PROJ_PATH / 'data'))
 
 CHARS_PATH = DATA_PATH / 'chars'
 FACTORS_PATH = DATA_PATH / 'factors'
 META_PATH = DATA_PATH / 'meta'
+
+
+def set_data_root(path: Union[str, Path]) -> None:
+    """Point DATA_PATH and the chars/factors/meta directories at `path`.
+
+    Loaders read these module attributes at call time, so the change applies to
+    subsequent loads. Facade caches are keyed on resolved file paths.
+    """
+    global DATA_PATH, CHARS_PATH, FACTORS_PATH, META_PATH
+    DATA_PATH = Path(path)
+    CHARS_PATH = DATA_PATH / 'chars'
+    FACTORS_PATH = DATA_PATH / 'factors'
+    META_PATH = DATA_PATH / 'meta'
+
+
+@contextmanager
+def data_root(path: Union[str, Path]) -> Iterator[Path]:
+    """Temporarily use `path` as the data root (see set_data_root)."""
+    global DATA_PATH, CHARS_PATH, FACTORS_PATH, META_PATH
+    previous = DATA_PATH, CHARS_PATH, FACTORS_PATH, META_PATH
+    set_data_root(path)
+    try:
+        yield DATA_PATH
+    finally:
+        DATA_PATH, CHARS_PATH, FACTORS_PATH, META_PATH = previous
@@ -0,0 +1,456 @@
+"""
+qdl.construction
+
+Vectorized JKP factor construction (data spec, section 2 "Factor Portfolio
+Construction").
+
+For each month t and characteristic:
+- Breakpoints: tercile cut-offs from non-micro stocks (`size_grp` in
+  {"mega", "large", "small"}, i.e. above the NYSE 20th percentile).
+- Assignment: every stock (micro/nano included) is placed with the same
+  breakpoints, following the JKP empirical-CDF rule
+  `pf = max(1, ceil(3 * F_bp(x)))` where `F_bp` is the CDF of the breakpoint
+  stocks' characteristic values.
+- Returns: month t+1 excess returns of the low and high terciles, weighted
+  equally (`ew`), by market equity (`vw`), or by market equity winsorized at
+  the NYSE 80th percentile (`vw_cap`). The NYSE 80th percentile is taken as the
+  smallest market equity among `size_grp == "mega"` stocks in the month.
+- Factor: high minus low tercile, times `direction` (+1 keeps high-minus-low,
+  -1 flips to low-minus-high for characteristics whose original paper goes long
+  the low tercile).
+
+Sorting inputs (characteristic, size group, market equity) are lagged by one
+row of the shared date axis, matching `mask.shift(1)` in the demo notebook, so
+rows should be consecutive months (e.g. `date_col="eom"`).
+
+All weightings come out of one pass over NumPy arrays on shared
+(date × id) axes, as produced by `QDL.load_chars_wide`.
+"""
+
+from __future__ import annotations
+
+import tempfile
+import warnings
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Literal, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from qdl import config as _config
+
+
+Weighting = Literal["ew", "vw", "vw_cap"]
+
+WEIGHTINGS: Tuple[Weighting, ...] = ("ew", "vw", "vw_cap")
+BREAKPOINT_GROUPS: Tuple[str, ...] = ("mega", "large", "small")
+CAP_GROUP = "mega"
+
+# Long/short orientation of the assignment factors (docs/assignment_ff5.md):
+# +1 = high tercile minus low tercile, -1 = low minus high.
+KNOWN_DIRECTIONS: Dict[str, int] = {
+    "market_equity": -1,  # Size: small minus big
+    "be_me": 1,           # Value: high minus low
+    "ope_be": 1,          # Profitability: robust minus weak
+    "at_gr1": -1,         # Investment: conservative minus aggressive
+    "ret_12_1": 1,        # Momentum: winners minus losers
+    "ret_1_0": -1,        # Short-term reversal: losers minus winners
+}
+
+# Panels required besides the characteristic itself
+REQUIRED_PANELS: Tuple[str, ...] = ("ret_exc", "market_equity", "size_grp")
+
+
+def resolve_direction(char: str, direction: Optional[int] = None) -> int:
+    """Explicit `direction` wins; otherwise use KNOWN_DIRECTIONS, defaulting to +1."""
+    if direction is None:
+        direction = KNOWN_DIRECTIONS.get(char, 1)
+    if direction not in (1, -1):
+        raise ValueError("direction must be +1 or -1")
+    return int(direction)
+
+
+def _lag(arr: np.ndarray) -> np.ndarray:
+    """Shift float/bool rows down by one (first row becomes NaN/False)."""
+    out = np.empty_like(arr)
+    out[0] = np.nan if arr.dtype.kind == "f" else False
+    out[1:] = arr[:-1]
+    return out
+
+
+def _as_float(frame: pd.DataFrame) -> np.ndarray:
+    return frame.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _group_mask(size_grp: pd.DataFrame, groups: Optional[Iterable[str]]) -> np.ndarray:
+    """Boolean (date × id) mask of stocks whose size group is in `groups` (any non-null when None)."""
+    values = size_grp.to_numpy(dtype=object)
+    if groups is None:
+        return pd.notna(values)
+    return np.isin(values, list(groups))
+
+
+def tercile_assignments(x: np.ndarray, bp_mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Low/high tercile masks for a (date × id) characteristic array.
+
+    With `n` breakpoint stocks in a row and their values sorted as `s`, the JKP
+    rule `ceil(3 * F(x))` gives low iff `#(s <= x) <= floor(n/3)`, i.e.
+    `x < s[floor(n/3)]`, and high iff `#(s <= x) > 2n/3`, i.e.
+    `x >= s[floor(2n/3)]`. Rows without breakpoint stocks get no assignments.
+    """
+    bp_values = np.where(bp_mask & ~np.isnan(x), x, np.nan)
+    sorted_bp = np.sort(bp_values, axis=1)  # NaNs sort last
+    n = np.sum(~np.isnan(bp_values), axis=1)
+    has_bp = n > 0
+    k_low = np.where(has_bp, n // 3, 0)
+    k_high = np.where(has_bp, (2 * n) // 3, 0)
+    low_cut = np.take_along_axis(sorted_bp, k_low[:, None], axis=1)
+    high_cut = np.take_along_axis(sorted_bp, k_high[:, None], axis=1)
+
+    valid = ~np.isnan(x) & has_bp[:, None]
+    with np.errstate(invalid="ignore"):
+        low = valid & (x < low_cut)
+        high = valid & (x >= high_cut)
+    return low, high
+
+
+def _portfolio_return(
+    ret: np.ndarray,
+    member: np.ndarray,
+    weights: np.ndarray,
+    min_stocks: int,
+) -> np.ndarray:
+    use = member & ~np.isnan(ret) & ~np.isnan(weights) & (weights > 0)
+    w = np.where(use, weights, 0.0)
+    total = w.sum(axis=1)
+    count = use.sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        out = np.where(use, w * ret, 0.0).sum(axis=1) / total
+    out[(count < min_stocks) | (total <= 0)] = np.nan
+    return out
+
+
+@dataclass
+class SortPanels:
+    """
+    Characteristic-independent inputs of the tercile sort on shared (date × id) axes.
+
+    `bp_mask`, `universe` and `weights` are already lagged one row; `ret` is the
+    holding-month return. `weights` holds only the market-equity based schemes
+    ("vw", "vw_cap"); equal weights are implied.
+    """
+
+    index: pd.Index
+    columns: pd.Index
+    ret: np.ndarray
+    bp_mask: np.ndarray
+    universe: np.ndarray
+    weights: Dict[str, np.ndarray]
+
+
+def prepare_sort_panels(
+    *,
+    ret_exc: pd.DataFrame,
+    market_equity: pd.DataFrame,
+    size_grp: pd.DataFrame,
+    weightings: Sequence[Weighting] = WEIGHTINGS,
+    breakpoint_groups: Iterable[str] = BREAKPOINT_GROUPS,
+    universe_groups: Optional[Iterable[str]] = None,
+    index: Optional[pd.Index] = None,
+    columns: Optional[pd.Index] = None,
+) -> SortPanels:
+    """Lag and mask the shared panels once; reused across characteristics."""
+    unknown = [w for w in weightings if w not in WEIGHTINGS]
+    if unknown:
+        raise ValueError(f"Unknown weightings: {unknown}")
+    index = ret_exc.index if index is None else index
+    columns = ret_exc.columns if columns is None else columns
+
+    def _on_axes(frame: pd.DataFrame) -> pd.DataFrame:
+        if frame.index.equals(index) and frame.columns.equals(columns):
+            return frame
+        return frame.reindex(index=index, columns=columns)
+
+    ret = _as_float(_on_axes(ret_exc))
+    me = _lag(_as_float(_on_axes(market_equity)))
+    grp = _on_axes(size_grp)
+
+    weights: Dict[str, np.ndarray] = {}
+    if "vw" in weightings:
+        weights["vw"] = me
+    if "vw_cap" in weightings:
+        cap_mask = _lag(_group_mask(grp, [CAP_GROUP]))
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)  # months without mega stocks
+            cap = np.nanmin(np.where(cap_mask, me, np.nan), axis=1)
+        cap = np.where(np.isnan(cap), np.inf, cap)  # no mega stocks → no capping
+        weights["vw_cap"] = np.minimum(me, cap[:, None])
+
+    return SortPanels(
+        index=index,
+        columns=columns,
+        ret=ret,
+        bp_mask=_lag(_group_mask(grp, breakpoint_groups)),
+        universe=_lag(_group_mask(grp, universe_groups)),
+        weights=weights,
+    )
+
+
+def factor_returns_from_panels(
+    x: np.ndarray,
+    panels: SortPanels,
+    *,
+    direction: int = 1,
+    weightings: Sequence[Weighting] = WEIGHTINGS,
+    min_stocks: int = 1,
+    return_legs: bool = False,
+) -> Dict[str, np.ndarray]:
+    """Long-short returns for an unlagged characteristic array `x` on the panels' axes."""
+    if direction not in (1, -1):
+        raise ValueError("direction must be +1 or -1")
+    low, high = tercile_assignments(_lag(x), panels.bp_mask)
+    low &= panels.universe
+    high &= panels.universe
+
+    out: Dict[str, np.ndarray] = {}
+    for w in weightings:
+        weights = panels.weights[w] if w != "ew" else np.ones_like(panels.ret)
+        low_ret = _portfolio_return(panels.ret, low, weights, min_stocks)
+        high_ret = _portfolio_return(panels.ret, high, weights, min_stocks)
+        out[w] = direction * (high_ret - low_ret)
+        if return_legs:
+            out[f"{w}_low"] = low_ret
+            out[f"{w}_high"] = high_ret
+    return out
+
+
+def build_factor_returns(
+    char: pd.DataFrame,
+    *,
+    ret_exc: pd.DataFrame,
+    market_equity: pd.DataFrame,
+    size_grp: pd.DataFrame,
+    direction: int = 1,
+    weightings: Sequence[Weighting] = WEIGHTINGS,
+    breakpoint_groups: Iterable[str] = BREAKPOINT_GROUPS,
+    universe_groups: Optional[Iterable[str]] = None,
+    min_stocks: int = 1,
+    return_legs: bool = False,
+) -> pd.DataFrame:
+    """
+    Build long-short tercile factor returns for one characteristic.
+
+    Parameters
+    ----------
+    char, ret_exc, market_equity, size_grp : pd.DataFrame
+        Wide (date × id) panels. `ret_exc`, `market_equity` and `size_grp` are
+        reindexed to `char`'s axes when they differ.
+    direction : {1, -1}, default 1
+        +1 for high-minus-low, -1 for low-minus-high.
+    weightings : sequence of {"ew","vw","vw_cap"}
+        Weightings to compute; all share the same tercile assignments.
+    breakpoint_groups : iterable of str
+        `size_grp` values whose stocks define the breakpoints (non-micro).
+    universe_groups : iterable of str, optional
+        `size_grp` values eligible for the portfolios; None keeps every stock
+        with a size group (micro and nano are distributed with the same breakpoints).
+    min_stocks : int, default 1
+        Minimum stocks with a valid return and weight per tercile; months below
+        it are NaN.
+    return_legs : bool, default False
+        Also return `<weighting>_low` / `<weighting>_high` tercile returns.
+
+    Returns
+    -------
+    pd.DataFrame
+        Date-indexed frame with one column per weighting (plus legs when requested).
+        The first row is NaN because sorting inputs are lagged.
+    """
+    if char.empty:
+        raise ValueError("char must be a non-empty wide DataFrame")
+    panels = prepare_sort_panels(
+        ret_exc=ret_exc,
+        market_equity=market_equity,
+        size_grp=size_grp,
+        weightings=weightings,
+        breakpoint_groups=breakpoint_groups,
+        universe_groups=universe_groups,
+        index=char.index,
+        columns=char.columns,
+    )
+    columns = factor_returns_from_panels(
+        _as_float(char),
+        panels,
+        direction=direction,
+        weightings=weightings,
+        min_stocks=min_stocks,
+        return_legs=return_legs,
+    )
+    return pd.DataFrame(columns, index=char.index)
+
+
+# --------------- Batch construction (process pool) -----------------
+
+# Pool-worker process state: shared panels memory-mapped from .npy files written
+# by the parent, so the OS page cache backs every worker with the same pages.
+# The in-process path passes panels and job explicitly (thread-safe).
+_WORKER: Dict[str, Any] = {}
+
+
+def _save_shared_panels(panels: SortPanels, directory: Path) -> Dict[str, Any]:
+    arrays = {"ret": panels.ret, "bp_mask": panels.bp_mask, "universe": panels.universe}
+    arrays.update({f"weights_{k}": v for k, v in panels.weights.items()})
+    for name, arr in arrays.items():
+        np.save(directory / f"{name}.npy", arr)
+    return {
+        "directory": str(directory),
+        "arrays": list(arrays),
+        "index": panels.index,
+        "columns": panels.columns,
+    }
+
+
+def _load_shared_panels(meta: Mapping[str, Any]) -> SortPanels:
+    directory = Path(meta["directory"])
+    arrays = {name: np.load(directory / f"{name}.npy", mmap_mode="r") for name in meta["arrays"]}
+    return SortPanels(
+        index=meta["index"],
+        columns=meta["columns"],
+        ret=arrays["ret"],
+        bp_mask=arrays["bp_mask"],
+        universe=arrays["universe"],
+        weights={k[len("weights_"):]: v for k, v in arrays.items() if k.startswith("weights_")},
+    )
+
+
+def _init_worker(meta: Mapping[str, Any], job: Mapping[str, Any]) -> None:
+    # Spawned workers re-import qdl.config; carry over an overridden data root
+    _config.set_data_root(job["data_root"])
+    _WORKER["panels"] = _load_shared_panels(meta)
+    _WORKER["job"] = dict(job)
+
+
+def _char_on_axes(char: str, panels: SortPanels, job: Mapping[str, Any]) -> np.ndarray:
+    from qdl import dataloader, transformer
+
+    if job.get("char_panels") is not None:
+        return _as_float(job["char_panels"][char].reindex(index=panels.index, columns=panels.columns))
+    date_col, id_col = job["date_col"], job["id_col"]
+    load_chars = job["load_chars"] or dataloader.load_chars
+    df = load_chars(
+        file_name=job["file_name"],
+        columns=[date_col, id_col, char],
+        **job["read_kwargs"],
+    )
+    wide = transformer.to_wide(df, index_cols=[date_col], column_col=id_col, value_col=char)
+    return _as_float(wide.reindex(index=panels.index, columns=panels.columns))
+
+
+def _build_char(char: str, panels: SortPanels, job: Mapping[str, Any]) -> Tuple[str, Dict[str, np.ndarray]]:
+    x = _char_on_axes(char, panels, job)
+    returns = factor_returns_from_panels(
+        x,
+        panels,
+        direction=resolve_direction(char, job["directions"].get(char)),
+        weightings=job["weightings"],
+        min_stocks=job["min_stocks"],
+    )
+    return char, returns
+
+
+def _build_one(char: str) -> Tuple[str, Dict[str, np.ndarray]]:
+    # Pool-worker entry point (state set up by _init_worker)
+    return _build_char(char, _WORKER["panels"], _WORKER["job"])
+
+
+def build_factor_zoo(
+    *,
+    file_name: str,
+    chars: Sequence[str],
+    ret_exc: pd.DataFrame,
+    market_equity: pd.DataFrame,
+    size_grp: pd.DataFrame,
+    weightings: Sequence[Weighting] = WEIGHTINGS,
+    directions: Optional[Mapping[str, int]] = None,
+    date_col: str = "eom",
+    id_col: str = "id",
+    breakpoint_groups: Iterable[str] = BREAKPOINT_GROUPS,
+    universe_groups: Optional[Iterable[str]] = None,
+    min_stocks: int = 1,
+    max_workers: Optional[int] = None,
+    read_kwargs: Optional[Mapping[str, Any]] = None,
+    load_chars: Optional[Callable[..., pd.DataFrame]] = None,
+    char_panels: Optional[Mapping[str, pd.DataFrame]] = None,
+) -> Dict[str, pd.DataFrame]:
+    """
+    Build long-short returns for many characteristics of one characteristics file.
+
+    The shared panels (returns, lagged size-group masks and market-equity weights)
+    are prepared once and memory-mapped into worker processes; each worker only
+    reads its characteristic column (plus keys) from `file_name`.
+
+    Parameters
+    ----------
+    max_workers : int, optional
+        Process pool size (None = os.cpu_count()). `max_workers=1` runs in-process.
+    read_kwargs : mapping, optional
+        Extra keyword arguments for the characteristic reads (e.g. `start`, `end`,
+        `dtype_policy`).
+    load_chars : callable, optional
+        Picklable replacement for `qdl.dataloader.load_chars`.
+    char_panels : mapping of str to DataFrame, optional
+        Already pivoted characteristic panels (e.g. fetched from a panel
+        server); nothing is read from `file_name` and the build runs in-process.
+
+    Returns
+    -------
+    dict[str, pd.DataFrame]
+        `{weighting: wide frame}` with date index and one column per characteristic
+        (in `chars` order), the shape of `QDL.load_factors`.
+    """
+    chars = list(dict.fromkeys(chars))
+    panels = prepare_sort_panels(
+        ret_exc=ret_exc,
+        market_equity=market_equity,
+        size_grp=size_grp,
+        weightings=weightings,
+        breakpoint_groups=breakpoint_groups,
+        universe_groups=universe_groups,
+    )
+    job = {
+        "file_name": file_name,
+        "date_col": date_col,
+        "id_col": id_col,
+        "directions": dict(directions or {}),
+        "weightings": tuple(weightings),
+        "min_stocks": min_stocks,
+        "read_kwargs": dict(read_kwargs or {}),
+        "load_chars": load_chars,
+        "data_root": _config.DATA_PATH,
+    }
+    if char_panels is not None:
+        missing = [c for c in chars if c not in char_panels]
+        if missing:
+            raise KeyError(f"char_panels lacks characteristics: {missing}")
+        job["char_panels"] = char_panels
+
+    results: Dict[str, Dict[str, np.ndarray]] = {}
+    if max_workers == 1 or len(chars) <= 1 or char_panels is not None:
+        results = dict(_build_char(c, panels, job) for c in chars)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with tempfile.TemporaryDirectory(prefix="qdl_zoo_") as tmp:
+            meta = _save_shared_panels(panels, Path(tmp))
+            del panels
+            with ProcessPoolExecutor(
+                max_workers=max_workers, initializer=_init_worker, initargs=(meta, job)
+            ) as pool:
+                results = dict(pool.map(_build_one, chars))
+
+    return {
+        w: pd.DataFrame({c: results[c][w] for c in chars}, index=ret_exc.index, columns=pd.Index(chars))
+        for w in weightings
+    }
@@ -19,7 +19,9 @@ renaming, or dtype normalization is the responsibility of `qdl.transformer`.
 
 Design policies (from PRD v0.2):
 - Do not invent schemas or column names.
-- Use absolute imports and centralized path config from `qdl.config`.
+- Use absolute imports and centralized path config from `qdl.config`. Paths are
+  read from `qdl.config` at call time, so `qdl.config.set_data_root()` (or the
+  `QDL_DATA_PATH` environment variable) redirects every loader.
 - Raise explicit errors; do not synthesize data on failure.
 
 Factor reader spec (factors CSV)
@@ -51,23 +53,40 @@ Notes:
 - Any column parsing/renaming/typing happens in `qdl.transformer` later
 - Future: expose optional usecols/dtype hints if needed for performance
 
+Columnar sidecar cache (factors CSV):
+- On first read, a typed Arrow IPC copy of the parsed CSV is written to
+  `qdl.config.META_PATH / "sidecar" / "<csv file name>.arrow"` (date as
+  timestamp, `name` dictionary-encoded, numeric columns as float/int).
+- Later reads memory-map the sidecar instead of re-parsing the CSV. The CSV's
+  size, mtime and the requested encoding are stored in the sidecar metadata;
+  any mismatch triggers a rebuild.
+- Returned frames are identical to the plain CSV path (dictionary columns are
+  decoded back to strings). Sidecar failures never fail the load; the CSV is
+  authoritative.
+
 Usage examples:
 - load_factors(country="usa", dataset="mkt", weighting="vw")
 - load_factors(country="kor", dataset="factor", weighting="ew")
 """
 
+import os
+import threading
 from pathlib import Path
-from typing import Literal, Optional, List, Set
+from typing import Any, Iterable, Iterator, Literal, Optional, List, Sequence, Set, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
-from qdl.config import FACTORS_PATH, CHARS_PATH
+from qdl import config as _config
+from qdl import profiling as _profiling
+from qdl.dtypes import DtypePolicyLike, arrow_to_pandas, resolve_dtype_policy
 
 Country = Literal["usa", "kor"]
 DatasetKind = Literal["factor", "theme", "mkt"]
 Weighting = Literal["ew", "vw", "vw_cap"]
 Frequency = Literal["monthly"]
 Vintage = Literal["1972-", "2000-", "2020-"]
+DateLike = Union[str, pd.Timestamp]
 
 
 _DATASET_TOKEN_BY_KIND = {
@@ -86,6 +105,49 @@ def _build_factors_filename(
     return f"[{country}]_[{dataset_token}]_[{frequency}]_[{weighting}].csv"
 
 
+def resolve_factors_path(
+    *,
+    country: Country,
+    dataset: DatasetKind,
+    weighting: Weighting,
+    frequency: Frequency = "monthly",
+) -> Path:
+    """
+    Validate factor file parameters and return the existing CSV path under
+    `qdl.config.FACTORS_PATH`.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the composed file does not exist.
+    ValueError
+        If any of the provided parameters are invalid for the naming convention.
+    """
+    # Validate allowed values explicitly to provide clear error messages.
+    if country not in ("usa", "kor"):
+        raise ValueError("country must be one of {'usa','kor'}")
+    if dataset not in _DATASET_TOKEN_BY_KIND:
+        raise ValueError("dataset must be one of {'factor','theme','mkt'}")
+    if frequency != "monthly":
+        raise ValueError("frequency must be 'monthly'")
+    if weighting not in ("ew", "vw", "vw_cap"):
+        raise ValueError("weighting must be one of {'ew','vw','vw_cap'}")
+
+    file_name = _build_factors_filename(
+        country=country, dataset=dataset, frequency=frequency, weighting=weighting
+    )
+    file_path: Path = _config.FACTORS_PATH / file_name
+
+    if not file_path.exists():
+        # Provide a helpful hint listing the directory contents for debugging.
+        available = sorted(p.name for p in _config.FACTORS_PATH.glob("*.csv"))
+        raise FileNotFoundError(
+            "Factors file not found: "
+            f"{file_path} (available: {', '.join(available) if available else 'none'})"
+        )
+    return file_path
+
+
 def load_factors(
     *,
     country: Country,
@@ -93,6 +155,8 @@ def load_factors(
     weighting: Weighting,
     frequency: Frequency = "monthly",
     encoding: str = "utf-8",
+    sidecar: bool = True,
+    refresh_sidecar: bool = False,
 ) -> pd.DataFrame:
     """
     Load factors CSV from `data/factors/` based on naming convention.
@@ -109,11 +173,17 @@ def load_factors(
         Only "monthly" is supported at the moment.
     encoding : str, default "utf-8"
         CSV file encoding.
+    sidecar : bool, default True
+        Read from (and maintain) the columnar sidecar copy under `META_PATH`.
+        When False, always parse the CSV and leave any sidecar untouched.
+    refresh_sidecar : bool, default False
+        Re-parse the CSV and rewrite the sidecar even if it is up to date.
 
     Returns
     -------
     pd.DataFrame
-        Raw DataFrame loaded via pandas.read_csv. No schema assumptions are made.
+        Raw DataFrame loaded via pandas.read_csv (or its sidecar copy). No schema
+        assumptions are made.
 
     Raises
     ------
@@ -122,38 +192,131 @@ def load_factors(
     ValueError
         If any of the provided parameters are invalid for the naming convention.
     """
-    # Validate allowed values explicitly to provide clear error messages.
-    if country not in ("usa", "kor"):
-        raise ValueError("country must be one of {'usa','kor'}")
-    if dataset not in _DATASET_TOKEN_BY_KIND:
-        raise ValueError("dataset must be one of {'factor','theme','mkt'}")
-    if frequency != "monthly":
-        raise ValueError("frequency must be 'monthly'")
-    if weighting not in ("ew", "vw", "vw_cap"):
-        raise ValueError("weighting must be one of {'ew','vw','vw_cap'}")
-
-    file_name = _build_factors_filename(
-        country=country, dataset=dataset, frequency=frequency, weighting=weighting
+    file_path = resolve_factors_path(
+        country=country, dataset=dataset, weighting=weighting, frequency=frequency
     )
-    file_path: Path = FACTORS_PATH / file_name
 
-    if not file_path.exists():
-        # Provide a helpful hint listing the directory contents for debugging.
-        available = sorted(p.name for p in FACTORS_PATH.glob("*.csv"))
-        raise FileNotFoundError(
-            "Factors file not found: "
-            f"{file_path} (available: {', '.join(available) if available else 'none'})"
-        )
+    sidecar_path = _sidecar_path(file_path)
+    if sidecar and not refresh_sidecar:
+        with _profiling.stage("read_sidecar") as st:
+            cached = _read_sidecar(sidecar_path, csv_path=file_path, encoding=encoding)
+            st.detail["hit"] = cached is not None
+            if cached is not None:
+                st.bytes_read = _file_size(sidecar_path)
+                st.output(cached, measure_bytes=False)
+        if cached is not None:
+            return cached
 
+    # Stamp before parsing so a concurrent CSV edit leaves the sidecar stale, not wrong.
+    stamp = _source_stamp(file_path, encoding)
+    df = _read_factors_csv(file_path, encoding=encoding)
+    if sidecar:
+        with _profiling.stage("write_sidecar"):
+            _write_sidecar(df, sidecar_path, stamp=stamp)
+    return df
+
+
+def _file_size(path: Path) -> Optional[int]:
+    try:
+        return int(path.stat().st_size)
+    except OSError:
+        return None
+
+
+def _read_factors_csv(file_path: Path, *, encoding: str) -> pd.DataFrame:
     # Schema-agnostic load. Any parsing/normalization belongs in transformer.
-    df = pd.read_csv(file_path, encoding=encoding)
+    with _profiling.stage("read_csv") as st:
+        df = pd.read_csv(file_path, encoding=encoding)
+        st.bytes_read = _file_size(file_path)
+        st.output(df, measure_bytes=False)
     # Ensure 'date' is datetime for downstream comparisons/joins
     if "date" in df.columns and not pd.api.types.is_datetime64_any_dtype(df["date"]):
-        df = df.copy()
-        df["date"] = pd.to_datetime(df["date"], errors="raise")
+        with _profiling.stage("parse_dates", rows=len(df), columns=1):
+            df = df.copy()
+            df["date"] = pd.to_datetime(df["date"], errors="raise")
     return df
 
 
+# --------------- Factors sidecar (Arrow IPC) -----------------
+
+_SIDECAR_DIRNAME = "sidecar"
+_SIDECAR_DICT_COLUMNS = ("name",)
+_SIDECAR_META_SIZE = b"qdl.source_size"
+_SIDECAR_META_MTIME = b"qdl.source_mtime_ns"
+_SIDECAR_META_ENCODING = b"qdl.source_encoding"
+
+
+def _sidecar_path(csv_path: Path) -> Path:
+    return _config.META_PATH / _SIDECAR_DIRNAME / f"{csv_path.name}.arrow"
+
+
+def _source_stamp(csv_path: Path, encoding: str) -> dict:
+    st = csv_path.stat()
+    return {
+        _SIDECAR_META_SIZE: str(st.st_size).encode(),
+        _SIDECAR_META_MTIME: str(st.st_mtime_ns).encode(),
+        _SIDECAR_META_ENCODING: encoding.encode(),
+    }
+
+
+def _read_sidecar(sidecar_path: Path, *, csv_path: Path, encoding: str) -> Optional[pd.DataFrame]:
+    """Return the sidecar frame when it exists and matches the CSV stamp; otherwise None."""
+    if not sidecar_path.exists():
+        return None
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        with pa.memory_map(str(sidecar_path), "r") as source:
+            table = pa.ipc.open_file(source).read_all()
+        metadata = table.schema.metadata or {}
+        expected = _source_stamp(csv_path, encoding)
+        if any(metadata.get(k) != v for k, v in expected.items()):
+            return None
+        # Decode dictionary columns so the frame matches the plain CSV path exactly.
+        for i, field in enumerate(table.schema):
+            if pa.types.is_dictionary(field.type):
+                decoded = pc.cast(table.column(i), field.type.value_type)
+                table = table.set_column(i, field.name, decoded)
+        return table.to_pandas()
+    except Exception:
+        # A corrupt or unreadable sidecar falls back to the CSV.
+        return None
+
+
+def _write_sidecar(df: pd.DataFrame, sidecar_path: Path, *, stamp: dict) -> None:
+    """Best-effort atomic write of `df` as an uncompressed (memory-mappable) Arrow IPC file."""
+    # Unique per thread: concurrent loads (QDL.load_many) may rebuild the same sidecar
+    tmp_path = sidecar_path.with_name(f"{sidecar_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        for col in _SIDECAR_DICT_COLUMNS:
+            i = table.schema.get_field_index(col)
+            if i < 0:
+                continue
+            col_type = table.schema.field(i).type
+            if pa.types.is_string(col_type) or pa.types.is_large_string(col_type):
+                table = table.set_column(i, col, pc.dictionary_encode(table.column(i)))
+        metadata = dict(table.schema.metadata or {})
+        metadata.update(stamp)
+        table = table.replace_schema_metadata(metadata)
+
+        sidecar_path.parent.mkdir(parents=True, exist_ok=True)
+        with pa.OSFile(str(tmp_path), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, sidecar_path)
+    except Exception:
+        # Sidecar is an optimization only; never fail the load because of it.
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
 # --------------- Characteristics (Parquet) loader -----------------
 
 def _resolve_single_parquet(
@@ -197,12 +360,187 @@ def _resolve_single_parquet(
     return next(iter(matched))
 
 
+def resolve_chars_path(
+    *,
+    file_name: Optional[str] = None,
+    patterns: Optional[List[str]] = None,
+) -> Path:
+    """
+    Resolve the single characteristics parquet file under `qdl.config.CHARS_PATH`
+    that `load_chars` would read for the same arguments.
+
+    When a current hive-partitioned copy exists (see `qdl.partition`), its
+    directory is returned instead; the copy stays usable after the source
+    file is removed.
+    """
+    if file_name:
+        partitioned = partitioned_chars_dir(_config.CHARS_PATH / file_name)
+        if partitioned is not None:
+            return partitioned
+    path = _resolve_single_parquet(_config.CHARS_PATH, file_name=file_name, patterns=patterns)
+    return partitioned_chars_dir(path) or path
+
+
+# --------------- Hive-partitioned characteristics -----------------
+
+PARTITION_MANIFEST = "_qdl_partitioned.json"  # "_" prefix: ignored by pyarrow dataset discovery
+PARTITION_FIELDS: Tuple[str, ...] = ("country", "year")
+
+
+def read_partition_manifest(directory: Path) -> Optional[dict]:
+    """Manifest written by `qdl.partition.repartition_chars`, or None when `directory` is not a partitioned copy."""
+    import json
+
+    try:
+        return json.loads((Path(directory) / PARTITION_MANIFEST).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def partitioned_chars_dir(file_path: Path) -> Optional[Path]:
+    """
+    Partitioned copy `<name without .parquet>/` next to `file_path` when it was
+    written from the file's current version (size and mtime match the manifest)
+    or the file no longer exists; None otherwise.
+    """
+    directory = file_path.with_suffix("")
+    manifest = read_partition_manifest(directory)
+    if manifest is None:
+        return None
+    try:
+        st = file_path.stat()
+    except FileNotFoundError:
+        return directory
+    if (int(st.st_size), int(st.st_mtime_ns)) != (manifest.get("source_size"), manifest.get("source_mtime_ns")):
+        return None
+    return directory
+
+
+def _open_chars(file_path: Path) -> Tuple[Any, List[str], Optional[dict]]:
+    """(pyarrow dataset, data column names, partition manifest) for a chars file or partitioned copy."""
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    if not file_path.is_dir():
+        dataset = ds.dataset(str(file_path), format="parquet")
+        return dataset, list(dataset.schema.names), None
+    manifest = read_partition_manifest(file_path) or {}
+    fields = manifest.get("partitioning", list(PARTITION_FIELDS))
+    partitioning = ds.partitioning(
+        pa.schema([(f, pa.int32() if f == "year" else pa.string()) for f in fields]), flavor="hive"
+    )
+    dataset = ds.dataset(str(file_path), format="parquet", partitioning=partitioning)
+    return dataset, [c for c in dataset.schema.names if c not in fields], manifest
+
+
+def _partition_filter(
+    manifest: Optional[dict], *, date_col: str, start: Optional[DateLike], end: Optional[DateLike]
+) -> Any:
+    """Year-partition predicate for a [start, end] range on the partitioning date column (None if not applicable)."""
+    import pyarrow.dataset as ds
+
+    if not manifest or manifest.get("date_col") != date_col or "year" not in manifest.get("partitioning", ()):
+        return None
+    parts = []
+    if start is not None:
+        parts.append(ds.field("year") >= pd.Timestamp(start).year)
+    if end is not None:
+        parts.append(ds.field("year") <= pd.Timestamp(end).year)
+    if not parts:
+        return None
+    return parts[0] if len(parts) == 1 else parts[0] & parts[1]
+
+
+def _and_filters(*exprs: Any) -> Any:
+    present = [e for e in exprs if e is not None]
+    if not present:
+        return None
+    expr = present[0]
+    for e in present[1:]:
+        expr = expr & e
+    return expr
+
+
+def _date_scalar(value: Any, arrow_type: Any) -> Any:
+    """Convert a user-supplied date bound into a pyarrow scalar comparable with `arrow_type`."""
+    import pyarrow as pa
+
+    ts = pd.Timestamp(value)
+    if pa.types.is_timestamp(arrow_type):
+        if arrow_type.tz is not None and ts.tzinfo is None:
+            ts = ts.tz_localize(arrow_type.tz)
+        return pa.scalar(ts, type=arrow_type)
+    if pa.types.is_date(arrow_type):
+        return pa.scalar(ts.date(), type=arrow_type)
+    if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+        # ISO-8601 strings order lexicographically like dates
+        return pa.scalar(ts.strftime("%Y-%m-%d"), type=arrow_type)
+    if pa.types.is_integer(arrow_type):
+        # Integer-encoded dates (YYYYMMDD)
+        return pa.scalar(int(ts.strftime("%Y%m%d")), type=arrow_type)
+    raise TypeError(f"Cannot compare date bounds against column of type {arrow_type}")
+
+
+def build_row_filter(
+    schema: Any,
+    *,
+    date_col: str = "eom",
+    id_col: str = "id",
+    start: Optional[DateLike] = None,
+    end: Optional[DateLike] = None,
+    ids: Optional[Iterable[Any]] = None,
+    filters: Any = None,
+) -> Any:
+    """
+    Build a pyarrow dataset expression from date-range/id predicates and an optional
+    generic filter, typed against the file `schema`. Returns None when no predicate is given.
+
+    `filters` may be a `pyarrow.compute.Expression` or DNF tuples as accepted by
+    `pandas.read_parquet(filters=...)` (e.g. [("size_grp", "in", ["large", "mega"])]).
+    Bounds are inclusive.
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+
+    parts = []
+    if start is not None or end is not None:
+        if date_col not in schema.names:
+            raise KeyError(f"Date column '{date_col}' not found in parquet schema")
+        date_type = schema.field(date_col).type
+        if start is not None:
+            parts.append(ds.field(date_col) >= _date_scalar(start, date_type))
+        if end is not None:
+            parts.append(ds.field(date_col) <= _date_scalar(end, date_type))
+    if ids is not None:
+        if id_col not in schema.names:
+            raise KeyError(f"Id column '{id_col}' not found in parquet schema")
+        id_values = pa.array(list(ids), type=schema.field(id_col).type)
+        parts.append(ds.field(id_col).isin(id_values))
+    if filters is not None:
+        parts.append(filters if isinstance(filters, ds.Expression) else pq.filters_to_expression(filters))
+
+    if not parts:
+        return None
+    expr = parts[0]
+    for part in parts[1:]:
+        expr = expr & part
+    return expr
+
+
 def load_chars(
     *,
     file_name: Optional[str] = None,
     patterns: Optional[List[str]] = None,
     columns: Optional[List[str]] = None,
     engine: str = "pyarrow",
+    start: Optional[DateLike] = None,
+    end: Optional[DateLike] = None,
+    ids: Optional[Iterable[Any]] = None,
+    filters: Any = None,
+    date_col: str = "eom",
+    id_col: str = "id",
+    dtype_policy: DtypePolicyLike = None,
 ) -> pd.DataFrame:
     """
     Load a characteristics parquet file from `data/chars/`.
@@ -221,20 +559,562 @@ def load_chars(
         Column projection to speed up reads.
     engine : str, default "pyarrow"
         Parquet engine to use.
+    start, end : date-like, optional
+        Inclusive bounds on `date_col`. Pushed down to a pyarrow dataset scan so
+        row groups outside the range are skipped using Parquet statistics.
+    ids : iterable, optional
+        Keep only rows whose `id_col` is in `ids` (also pushed down).
+    filters : pyarrow.compute.Expression or list of tuples, optional
+        Additional generic row predicate (see `build_row_filter`).
+    date_col : str, default "eom"
+        Column that `start`/`end` apply to.
+    id_col : str, default "id"
+        Column that `ids` applies to.
+    dtype_policy : None, "lean" or qdl.dtypes.DtypePolicy, optional
+        Narrow dtypes (float32 characteristics, int32/categorical id, categorical
+        and small-int group columns) during the Arrow→pandas conversion.
 
     Returns
     -------
     pd.DataFrame
-        Raw DataFrame loaded via pandas.read_parquet.
+        Raw DataFrame loaded via pandas.read_parquet, or via a pyarrow dataset
+        scan when any row predicate or dtype policy is given.
     """
-    file_path = _resolve_single_parquet(CHARS_PATH, file_name=file_name, patterns=patterns)
-    df = pd.read_parquet(file_path, columns=columns, engine=engine)
+    file_path = resolve_chars_path(file_name=file_name, patterns=patterns)
+    policy = resolve_dtype_policy(dtype_policy)
+    has_predicate = start is not None or end is not None or ids is not None or filters is not None
+    with _profiling.stage("read_parquet", detail={"file": file_path.name, "pushdown": has_predicate}) as st:
+        if not has_predicate and policy is None and not file_path.is_dir():
+            df = pd.read_parquet(file_path, columns=columns, engine=engine)
+        else:
+            if engine != "pyarrow":
+                raise ValueError("Row predicates, dtype_policy and partitioned files require engine='pyarrow'")
+            dataset, names, manifest = _open_chars(file_path)
+            if columns is not None:
+                missing = [c for c in columns if c not in names]
+                if missing:
+                    raise KeyError(f"Requested columns not found: {missing}")
+            expr = build_row_filter(
+                dataset.schema,
+                date_col=date_col,
+                id_col=id_col,
+                start=start,
+                end=end,
+                ids=ids,
+                filters=filters,
+            )
+            expr = _and_filters(expr, _partition_filter(manifest, date_col=date_col, start=start, end=end))
+            df = arrow_to_pandas(dataset.to_table(columns=columns if columns is not None else names, filter=expr), policy)
+        if _profiling.enabled():
+            st.bytes_read = _profiling.parquet_projection_nbytes(file_path, columns)
+            st.output(df)
+    return _parse_time_columns(df)
+
+
+def read_chars_columns(
+    *,
+    file_name: Optional[str] = None,
+    patterns: Optional[List[str]] = None,
+) -> List[str]:
+    """Column names of a characteristics parquet file (footer read only, no data)."""
+    import pyarrow.parquet as pq
+
+    file_path = resolve_chars_path(file_name=file_name, patterns=patterns)
+    if file_path.is_dir():
+        return _open_chars(file_path)[1]
+    return list(pq.read_schema(file_path).names)
+
+
+def _parse_time_columns(df: pd.DataFrame) -> pd.DataFrame:
     # Ensure 'date' and 'eom' are datetime for downstream comparisons/joins
     # Parse independently when present to support either time key downstream.
-    if "date" in df.columns and not pd.api.types.is_datetime64_any_dtype(df["date"]):
-        df = df.copy()
-        df["date"] = pd.to_datetime(df["date"], errors="raise")
-    if "eom" in df.columns and not pd.api.types.is_datetime64_any_dtype(df["eom"]):
-        df = df.copy()
-        df["eom"] = pd.to_datetime(df["eom"], errors="raise")
+    # `df` is always freshly read here, so columns are replaced in place rather
+    # than copying the whole frame per parsed column.
+    to_parse = [c for c in ("date", "eom") if c in df.columns and not pd.api.types.is_datetime64_any_dtype(df[c])]
+    if to_parse:
+        with _profiling.stage("parse_dates", rows=len(df), columns=len(to_parse)):
+            for col in to_parse:
+                df[col] = pd.to_datetime(df[col], errors="raise")
     return df
+
+
+# --------------- Characteristics (Parquet) streaming -----------------
+
+DEFAULT_BATCH_ROWS = 500_000
+
+
+def _month_keys(values: Any) -> np.ndarray:
+    """Calendar-month ordinal (year * 12 + month - 1) per row; -1 for null dates."""
+    import pyarrow.compute as pc
+
+    keys = pc.add(pc.multiply(pc.year(values), 12), pc.subtract(pc.month(values), 1))
+    return pc.fill_null(keys, -1).to_numpy().astype(np.int64)
+
+
+def _stat_month(value: Any) -> int:
+    ts = pd.Timestamp(value)
+    return ts.year * 12 + ts.month - 1
+
+
+def _month_start(key: int) -> pd.Timestamp:
+    return pd.Timestamp(year=key // 12, month=key % 12 + 1, day=1)
+
+
+def _row_group_fragments(dataset: Any) -> List[Any]:
+    frags = []
+    for fragment in dataset.get_fragments():
+        frags.extend(fragment.split_by_row_group())
+    return frags
+
+
+def _ordered_month_bounds(frags: List[Any], date_col: str) -> Optional[List[Tuple[int, int]]]:
+    """
+    (min, max) month per row group when row groups are ordered by `date_col`
+    (each group starts no earlier than the previous one ends); None otherwise
+    or when statistics are unavailable.
+    """
+    bounds: List[Tuple[int, int]] = []
+    for frag in frags:
+        frag.ensure_complete_metadata()
+        stats = frag.row_groups[0].statistics.get(date_col) if frag.row_groups else None
+        if not stats or stats.get("min") is None or stats.get("max") is None:
+            return None
+        lo, hi = _stat_month(stats["min"]), _stat_month(stats["max"])
+        if bounds and lo < bounds[-1][1]:
+            return None
+        bounds.append((lo, hi))
+    return bounds
+
+
+def _sort_by_month(table: Any, date_col: str) -> Tuple[Any, np.ndarray]:
+    """Drop null dates and stably sort rows by calendar month."""
+    keys = _month_keys(table.column(date_col))
+    order = np.argsort(keys, kind="stable")
+    order = order[keys[order] >= 0]
+    return table.take(order), keys[order]
+
+
+def _split_whole_months(table: Any, keys: np.ndarray, batch_rows: int, *, final: bool) -> Tuple[List[Any], Any]:
+    """
+    Split a month-sorted table into chunks of whole months with at most
+    `batch_rows` rows each (a single larger month forms its own chunk). Unless
+    `final`, the trailing chunk is returned separately so later rows can top it up.
+    """
+    chunks = []
+    if table.num_rows == 0:
+        return chunks, table
+    # Row offsets where each month ends
+    ends = np.concatenate([np.flatnonzero(np.diff(keys)) + 1, [len(keys)]])
+    begin = 0
+    prev_end = 0
+    for end in ends:
+        if prev_end > begin and end - begin > batch_rows:
+            chunks.append(table.slice(begin, prev_end - begin))
+            begin = prev_end
+        prev_end = end
+    remainder = table.slice(begin)
+    if final:
+        chunks.append(remainder)
+        remainder = table.slice(table.num_rows)
+    return chunks, remainder
+
+
+def _iter_months_ordered(
+    frags: List[Any],
+    bounds: List[Tuple[int, int]],
+    *,
+    columns: Optional[List[str]],
+    expr: Any,
+    date_col: str,
+    batch_rows: int,
+) -> Iterator[Any]:
+    import pyarrow as pa
+
+    carry = None  # rows of months that may continue into the next row group
+    pending = None  # complete months not yet emitted
+    for i, frag in enumerate(frags):
+        table = frag.to_table(columns=columns, filter=expr)
+        if carry is not None:
+            table = pa.concat_tables([carry, table])
+        table, keys = _sort_by_month(table, date_col)
+        if i + 1 < len(frags):
+            cut = int(np.searchsorted(keys, bounds[i + 1][0], side="left"))
+        else:
+            cut = len(keys)
+        ready, carry = table.slice(0, cut), table.slice(cut)
+        if pending is not None:
+            ready = pa.concat_tables([pending, ready])
+        ready_keys = _month_keys(ready.column(date_col))
+        chunks, pending = _split_whole_months(ready, ready_keys, batch_rows, final=False)
+        yield from chunks
+    if pending is not None and pending.num_rows:
+        pending_keys = _month_keys(pending.column(date_col))
+        chunks, _ = _split_whole_months(pending, pending_keys, batch_rows, final=True)
+        yield from chunks
+
+
+def _iter_months_windowed(
+    dataset: Any,
+    *,
+    columns: Optional[List[str]],
+    expr: Any,
+    date_col: str,
+    batch_rows: int,
+) -> Iterator[Any]:
+    """Plan month windows from a date-only scan, then read each window with a pushed-down range filter."""
+    import pyarrow.dataset as ds
+
+    keys = _month_keys(dataset.to_table(columns=[date_col], filter=expr).column(date_col))
+    months, counts = np.unique(keys[keys >= 0], return_counts=True)
+    # Greedy windows of consecutive months with at most `batch_rows` rows
+    windows: List[Tuple[int, int]] = []
+    begin, acc = 0, 0
+    for i, count in enumerate(counts):
+        if acc and acc + int(count) > batch_rows:
+            windows.append((begin, i - 1))
+            begin, acc = i, 0
+        acc += int(count)
+    if len(counts):
+        windows.append((begin, len(counts) - 1))
+
+    date_type = dataset.schema.field(date_col).type
+    for first, last in windows:
+        lo = _date_scalar(_month_start(int(months[first])), date_type)
+        hi = _date_scalar(_month_start(int(months[last]) + 1), date_type)
+        window = (ds.field(date_col) >= lo) & (ds.field(date_col) < hi)
+        table = dataset.to_table(columns=columns, filter=window if expr is None else expr & window)
+        table, _ = _sort_by_month(table, date_col)
+        yield table
+
+
+def iter_chars(
+    *,
+    file_name: Optional[str] = None,
+    patterns: Optional[List[str]] = None,
+    columns: Optional[List[str]] = None,
+    batch_rows: int = DEFAULT_BATCH_ROWS,
+    by: Optional[Literal["month"]] = None,
+    output: Literal["pandas", "arrow"] = "pandas",
+    start: Optional[DateLike] = None,
+    end: Optional[DateLike] = None,
+    ids: Optional[Iterable[Any]] = None,
+    filters: Any = None,
+    date_col: str = "eom",
+    id_col: str = "id",
+    dtype_policy: DtypePolicyLike = None,
+) -> Iterator[Any]:
+    """
+    Stream a characteristics parquet file in bounded-memory chunks.
+
+    Parameters mirror `load_chars`. Additionally:
+
+    batch_rows : int, default 500_000
+        Target rows per chunk.
+    by : {None, "month"}, default None
+        None yields scanner batches of at most `batch_rows` rows in file order.
+        "month" regroups rows so every chunk holds complete calendar months of
+        `date_col` (sorted by month; a single month may exceed `batch_rows`;
+        rows with a null date are skipped). When row groups are ordered by date
+        (checked from Parquet statistics) this is a single streaming pass;
+        otherwise month windows are planned from a date-only scan and each
+        window is read with a pushed-down range filter.
+    output : {"pandas", "arrow"}, default "pandas"
+        Yield pandas DataFrames (time columns parsed as in `load_chars`) or
+        pyarrow RecordBatch/Table objects.
+    dtype_policy : None, "lean" or qdl.dtypes.DtypePolicy, optional
+        Applied to pandas chunks as in `load_chars`.
+    """
+    if batch_rows <= 0:
+        raise ValueError("batch_rows must be positive")
+    if by not in (None, "month"):
+        raise ValueError("by must be one of {None,'month'}")
+    if output not in ("pandas", "arrow"):
+        raise ValueError("output must be one of {'pandas','arrow'}")
+
+    file_path = resolve_chars_path(file_name=file_name, patterns=patterns)
+    policy = resolve_dtype_policy(dtype_policy)
+    dataset, names, manifest = _open_chars(file_path)
+    if columns is not None:
+        missing = [c for c in columns if c not in names]
+        if missing:
+            raise KeyError(f"Requested columns not found: {missing}")
+    elif manifest is not None:
+        columns = names  # keep partition fields out of the chunks
+    expr = build_row_filter(
+        dataset.schema,
+        date_col=date_col,
+        id_col=id_col,
+        start=start,
+        end=end,
+        ids=ids,
+        filters=filters,
+    )
+    expr = _and_filters(expr, _partition_filter(manifest, date_col=date_col, start=start, end=end))
+
+    if by is None:
+        chunks: Iterator[Any] = iter(dataset.to_batches(columns=columns, filter=expr, batch_size=batch_rows))
+    else:
+        if date_col not in dataset.schema.names:
+            raise KeyError(f"Date column '{date_col}' not found in parquet schema")
+        if columns is not None and date_col not in columns:
+            columns = [*columns, date_col]
+        frags = _row_group_fragments(dataset)
+        bounds = _ordered_month_bounds(frags, date_col)
+        if bounds is not None:
+            chunks = _iter_months_ordered(
+                frags, bounds, columns=columns, expr=expr, date_col=date_col, batch_rows=batch_rows
+            )
+        else:
+            chunks = _iter_months_windowed(
+                dataset, columns=columns, expr=expr, date_col=date_col, batch_rows=batch_rows
+            )
+
+    for chunk in chunks:
+        if chunk.num_rows == 0:
+            continue
+        if output == "arrow":
+            yield chunk
+        else:
+            if not hasattr(chunk, "drop_columns"):  # RecordBatch → Table for a uniform conversion
+                import pyarrow as pa
+
+                chunk = pa.Table.from_batches([chunk])
+            yield _parse_time_columns(arrow_to_pandas(chunk, policy))
+
+
+# --------------- Characteristics (Parquet) across vintages -----------------
+
+Precedence = Union[Literal["newest", "oldest"], Sequence[str]]
+OverlapResolution = Literal["row", "period"]
+
+
+def chars_vintages(*, country: str) -> List[str]:
+    """
+    Vintages with a `jkp_<vintage>_<country>.parquet` file (or a partitioned
+    copy of one) under `qdl.config.CHARS_PATH`, oldest first.
+    """
+    suffix = f"_{country}"
+    found = {p.name[len("jkp_") : -len(suffix + ".parquet")] for p in _config.CHARS_PATH.glob(f"jkp_*{suffix}.parquet")}
+    found.update(
+        p.name[len("jkp_") : -len(suffix)]
+        for p in _config.CHARS_PATH.glob(f"jkp_*{suffix}")
+        if read_partition_manifest(p) is not None
+    )
+    return sorted(found)
+
+
+def stitch_order(*, country: str, precedence: Precedence = "newest") -> List[str]:
+    """
+    Vintages of `country` in precedence order (highest first).
+
+    "newest"/"oldest" order every available vintage by its start year; an
+    explicit sequence (e.g. ["2020-", "1972-"]) selects and orders vintages.
+    """
+    available = chars_vintages(country=country)
+    if isinstance(precedence, str):
+        if precedence not in ("newest", "oldest"):
+            raise ValueError("precedence must be 'newest', 'oldest' or a sequence of vintages")
+        order = available[::-1] if precedence == "newest" else available
+    else:
+        order = list(dict.fromkeys(precedence))
+        missing = [v for v in order if v not in available]
+        if missing:
+            raise FileNotFoundError(
+                f"No characteristics file for vintages {missing} of {country} (available: {', '.join(available) or 'none'})"
+            )
+    if not order:
+        raise FileNotFoundError(f"No jkp_<vintage>_{country}.parquet files under {_config.CHARS_PATH}")
+    return order
+
+
+def _stat_timestamp(value: Any) -> pd.Timestamp:
+    if isinstance(value, (int, np.integer)):  # integer-encoded dates (YYYYMMDD)
+        return pd.to_datetime(str(value), format="%Y%m%d")
+    return pd.Timestamp(value)
+
+
+def _parquet_date_span(path: Path, date_col: str) -> Optional[Tuple[pd.Timestamp, pd.Timestamp]]:
+    """(min, max) of `date_col` from the row-group statistics in the footer; None when unavailable."""
+    import pyarrow.parquet as pq
+
+    if path.is_dir():
+        manifest = read_partition_manifest(path)
+        if not manifest or manifest.get("date_col") != date_col or manifest.get("min_date") is None:
+            return None
+        return pd.Timestamp(manifest["min_date"]), pd.Timestamp(manifest["max_date"])
+    meta = pq.ParquetFile(path).metadata
+    names = [meta.schema.column(i).path for i in range(meta.num_columns)]
+    if date_col not in names or meta.num_row_groups == 0:
+        return None
+    idx = names.index(date_col)
+    lows, highs = [], []
+    for i in range(meta.num_row_groups):
+        stats = meta.row_group(i).column(idx).statistics
+        if stats is None or not stats.has_min_max:
+            return None
+        lows.append(stats.min)
+        highs.append(stats.max)
+    try:
+        return _stat_timestamp(min(lows)).tz_localize(None), _stat_timestamp(max(highs)).tz_localize(None)
+    except (TypeError, ValueError):
+        return None
+
+
+def _span_mask(column: Any, spans: List[Tuple[pd.Timestamp, pd.Timestamp]]) -> Any:
+    """Boolean array: `column` falls in any of the inclusive `spans`."""
+    import pyarrow.compute as pc
+
+    mask = None
+    for lo, hi in spans:
+        inside = pc.and_(
+            pc.greater_equal(column, _date_scalar(lo, column.type)),
+            pc.less_equal(column, _date_scalar(hi, column.type)),
+        )
+        mask = inside if mask is None else pc.or_(mask, inside)
+    return pc.fill_null(mask, False)
+
+
+def _span_expr(spans: List[Tuple[pd.Timestamp, pd.Timestamp]], date_col: str, date_type: Any) -> Any:
+    import pyarrow.dataset as ds
+
+    expr = None
+    for lo, hi in spans:
+        inside = (ds.field(date_col) >= _date_scalar(lo, date_type)) & (ds.field(date_col) <= _date_scalar(hi, date_type))
+        expr = inside if expr is None else expr | inside
+    return expr
+
+
+def load_chars_stitched(
+    *,
+    country: str,
+    precedence: Precedence = "newest",
+    resolve: OverlapResolution = "row",
+    columns: Optional[List[str]] = None,
+    start: Optional[DateLike] = None,
+    end: Optional[DateLike] = None,
+    ids: Optional[Iterable[Any]] = None,
+    filters: Any = None,
+    date_col: str = "eom",
+    id_col: str = "id",
+    dtype_policy: DtypePolicyLike = None,
+    source_col: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    Load one logical characteristics dataset spanning every vintage file of `country`.
+
+    Files are scanned in precedence order (see `stitch_order`). Date-range
+    pushdown happens at two levels: files whose `date_col` span (from footer
+    statistics) misses [`start`, `end`] are never opened, and the remaining
+    scans skip row groups outside the range.
+
+    Parameters
+    ----------
+    precedence : {"newest", "oldest"} or sequence of str, default "newest"
+        Which vintage wins where files overlap.
+    resolve : {"row", "period"}, default "row"
+        "row": an (`date_col`, `id_col`) row of a lower-precedence file is
+        dropped when a higher-precedence file has the same key; only rows
+        inside a higher file's date span are checked, so non-overlapping
+        periods pass through untouched. Rows missing from the newer vintage
+        (e.g. stocks it dropped) are filled from older ones.
+        "period": each date inside a higher-precedence file's span comes only
+        from that file; the exclusion is pushed down, so lower-precedence row
+        groups in covered periods are not read.
+    columns, start, end, ids, filters, date_col, id_col, dtype_policy
+        As in `load_chars`. `filters` applies after precedence, so a row
+        filtered out of the newer vintage is not replaced by its older copy.
+        Every requested column must exist in each file read.
+    source_col : str, optional
+        Add a categorical column with the vintage each row came from.
+
+    Returns
+    -------
+    pd.DataFrame
+        Rows sorted by (`date_col`, `id_col`) when more than one file contributes.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if resolve not in ("row", "period"):
+        raise ValueError("resolve must be one of {'row','period'}")
+    order = stitch_order(country=country, precedence=precedence)
+    policy = resolve_dtype_policy(dtype_policy)
+    keys = [date_col, id_col]
+    projection = None if columns is None else list(dict.fromkeys([*columns, *keys]))
+    lo_req = pd.Timestamp(start) if start is not None else None
+    hi_req = pd.Timestamp(end) if end is not None else None
+
+    parts: List[Any] = []
+    claimed: List[Any] = []  # key columns of rows kept from higher-precedence files ("row")
+    covered: List[Tuple[pd.Timestamp, pd.Timestamp]] = []  # date spans of higher-precedence files
+    for i, vintage in enumerate(order):
+        path = resolve_chars_path(file_name=f"jkp_{vintage}_{country}.parquet")
+        span = _parquet_date_span(path, date_col)
+        if span is not None and ((hi_req is not None and span[0] > hi_req) or (lo_req is not None and span[1] < lo_req)):
+            _profiling.record("read_parquet", rows=0, detail={"file": path.name, "skipped": "date range"})
+            continue
+        dataset, names, manifest = _open_chars(path)
+        wanted = projection or names
+        missing = [c for c in wanted if c not in names]
+        if missing:
+            raise KeyError(f"Requested columns not found in {path.name}: {missing}")
+        date_type = dataset.schema.field(date_col).type
+        by_year = _partition_filter(manifest, date_col=date_col, start=start, end=end)
+        key_expr = _and_filters(
+            build_row_filter(dataset.schema, date_col=date_col, id_col=id_col, start=start, end=end, ids=ids), by_year
+        )
+        expr = _and_filters(
+            build_row_filter(dataset.schema, date_col=date_col, id_col=id_col, start=start, end=end, ids=ids, filters=filters),
+            by_year,
+        )
+        if resolve == "period" and covered:
+            outside = ~_span_expr(covered, date_col, date_type)
+            expr = outside if expr is None else expr & outside
+        last = i + 1 == len(order)
+
+        with _profiling.stage("read_parquet", detail={"file": path.name, "pushdown": True, "vintage": vintage}) as st:
+            table = dataset.to_table(columns=wanted, filter=expr)
+            if _profiling.enabled():
+                st.bytes_read = _profiling.parquet_projection_nbytes(path, wanted)
+                st.output(table, measure_bytes=False)
+
+        if resolve == "row" and claimed and table.num_rows:
+            with _profiling.stage("stitch", detail={"vintage": vintage}) as st:
+                in_overlap = _span_mask(table.column(date_col), covered)
+                overlap = table.filter(in_overlap)
+                if overlap.num_rows:
+                    prior = pa.concat_tables(claimed).cast(pa.schema([table.schema.field(k) for k in keys]))
+                    kept = overlap.join(prior, keys=keys, join_type="left anti", use_threads=False)
+                    table = pa.concat_tables([table.filter(pc.invert(in_overlap)), kept.select(table.column_names)])
+                st.rows = overlap.num_rows
+        if resolve == "row" and not last:
+            if filters is None:
+                claimed.append(table.select(keys))
+            else:
+                claimed.append(dataset.to_table(columns=keys, filter=key_expr))
+        if not last:
+            if span is None:
+                dates = pc.min_max(dataset.to_table(columns=[date_col]).column(date_col)).as_py()
+                span = None if dates["min"] is None else (_stat_timestamp(dates["min"]), _stat_timestamp(dates["max"]))
+            if span is not None:
+                covered.append(span)
+        if source_col is not None:
+            codes = pa.array(np.zeros(table.num_rows, dtype=np.int32))
+            table = table.append_column(source_col, pa.DictionaryArray.from_arrays(codes, pa.array([vintage])))
+        parts.append(table)
+
+    if not parts:
+        # Nothing overlaps [start, end]: empty frame with the projected schema
+        dataset, names, _ = _open_chars(resolve_chars_path(file_name=f"jkp_{order[0]}_{country}.parquet"))
+        table = dataset.schema.empty_table().select(projection or names)
+        if source_col is not None:
+            table = table.append_column(source_col, pa.array([], type=pa.dictionary(pa.int32(), pa.string())))
+        parts.append(table)
+    if len(parts) == 1:
+        result = parts[0]
+    else:
+        result = pa.concat_tables(parts, promote_options="permissive")
+        result = result.sort_by([(date_col, "ascending"), (id_col, "ascending")])
+    if columns is not None:
+        result = result.select([*dict.fromkeys(columns), *([source_col] if source_col else [])])
+    return _parse_time_columns(arrow_to_pandas(result, policy))
@@ -0,0 +1,147 @@
+"""
+qdl.dtypes
+
+Memory-lean dtype policy applied while converting Arrow tables to pandas.
+
+The JKP characteristics files store every characteristic as float64 and `id`
+as int64. For the large vintages (2000-, 1972-) that doubles the resident
+size compared to what factor construction needs. A `DtypePolicy` narrows
+types on the Arrow side, before `Table.to_pandas`, so the wide float64 copy
+never materializes:
+
+- float64 characteristics → float32 (except `keep_float64` columns)
+- `id` → int32 (when every value fits) or categorical
+- string group columns (e.g. `size_grp`) → categorical
+- integer-coded group columns (e.g. `gics`) → smallest nullable pandas Int dtype
+
+Casts that would lose information (int overflow, non-integral codes) leave
+the column as stored instead of failing the load.
+
+The policy is opt-in (`dtype_policy=None` keeps pandas defaults). Pass
+`"lean"` for the preset below or a custom `DtypePolicy`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Literal, Optional, Tuple, Union
+
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class DtypePolicy:
+    """Target dtypes for characteristics frames (hashable; used in cache keys)."""
+
+    float_dtype: Literal["float64", "float32"] = "float32"
+    id_dtype: Literal["keep", "int32", "category"] = "int32"
+    category_cols: Tuple[str, ...] = ("size_grp", "excntry")
+    small_int_cols: Tuple[str, ...] = ("gics", "sic", "naics", "ff49")
+    keep_float64: Tuple[str, ...] = ()
+    id_col: str = "id"
+
+
+LEAN = DtypePolicy()
+
+DtypePolicyLike = Union[None, Literal["lean"], DtypePolicy]
+
+
+def resolve_dtype_policy(policy: DtypePolicyLike) -> Optional[DtypePolicy]:
+    if policy is None or isinstance(policy, DtypePolicy):
+        return policy
+    if policy == "lean":
+        return LEAN
+    raise ValueError("dtype_policy must be None, 'lean' or a DtypePolicy instance")
+
+
+def _smallest_int_type(min_value: int, max_value: int) -> Any:
+    import pyarrow as pa
+
+    for arrow_type, bits in ((pa.int8(), 8), (pa.int16(), 16), (pa.int32(), 32)):
+        if -(2 ** (bits - 1)) <= min_value and max_value < 2 ** (bits - 1):
+            return arrow_type
+    return pa.int64()
+
+
+def _try_cast(column: Any, target: Any) -> Optional[Any]:
+    """Safe Arrow cast; None when it would truncate or overflow."""
+    import pyarrow as pa
+
+    try:
+        return column.cast(target, safe=True)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        return None
+
+
+def _small_int_series(column: Any) -> Optional[pd.Series]:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if not (pa.types.is_integer(column.type) or pa.types.is_floating(column.type)):
+        return None
+    bounds = pc.min_max(column).as_py()
+    if bounds["min"] is None:
+        return None
+    target = _smallest_int_type(int(bounds["min"]), int(bounds["max"]))
+    cast = _try_cast(column, target)
+    if cast is None:
+        return None
+    nullable = {
+        pa.int8(): pd.Int8Dtype(),
+        pa.int16(): pd.Int16Dtype(),
+        pa.int32(): pd.Int32Dtype(),
+        pa.int64(): pd.Int64Dtype(),
+    }
+    return cast.to_pandas(types_mapper=nullable.get)
+
+
+def arrow_to_pandas(table: Any, policy: Optional[DtypePolicy]) -> pd.DataFrame:
+    """
+    Convert `table` to pandas applying `policy` on the Arrow side.
+
+    Conversion uses `split_blocks`/`self_destruct` so Arrow buffers are released
+    column by column; `table` must not be used afterwards.
+    """
+    if policy is None:
+        return table.to_pandas(split_blocks=True, self_destruct=True)
+
+    import pyarrow as pa
+
+    names = table.column_names
+    # Integer-coded group columns become nullable pandas Int columns; convert separately.
+    small_int = {}
+    for name in policy.small_int_cols:
+        if name in names:
+            series = _small_int_series(table.column(name))
+            if series is not None:
+                small_int[name] = series
+
+    for i, field in enumerate(table.schema):
+        name = field.name
+        if name in small_int:
+            continue
+        column = table.column(i)
+        cast = None
+        if name == policy.id_col:
+            if policy.id_dtype == "int32" and pa.types.is_integer(field.type):
+                cast = _try_cast(column, pa.int32())
+            elif policy.id_dtype == "category":
+                cast = column.dictionary_encode()
+        elif name in policy.category_cols and (pa.types.is_string(field.type) or pa.types.is_large_string(field.type)):
+            cast = column.dictionary_encode()
+        elif (
+            policy.float_dtype == "float32"
+            and pa.types.is_float64(field.type)
+            and name not in policy.keep_float64
+        ):
+            # Narrowing floats is lossy by design; no safety check.
+            cast = column.cast(pa.float32(), safe=False)
+        if cast is not None:
+            table = table.set_column(i, name, cast)
+
+    rest = table.drop_columns(list(small_int))
+    df = rest.to_pandas(split_blocks=True, self_destruct=True)
+    # Insert in ascending original position so earlier inserts don't shift later ones
+    for name in sorted(small_int, key=names.index):
+        df.insert(names.index(name), name, small_int[name].array)
+    return df
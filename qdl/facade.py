@@ -9,13 +9,170 @@ Minimal facade exposing only load and validate_factor per PRD v0.2.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Literal, Optional, Union
+import contextvars
+import functools
+import threading
+import time
+import warnings
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Literal, Mapping, Optional, Sequence, Tuple, Union
 
 import pandas as pd
 
 from qdl import dataloader as _dataloader  # absolute import per project policy
 from qdl import validator as _validator    # validator API expected to be defined later
 from qdl import transformer as _transformer
+from qdl import construction as _construction
+from qdl import catalog as _catalog
+from qdl import profiling as _profiling
+from qdl import panel_store as _panel_store
+from qdl.cache import DEFAULT_MAX_BYTES, CacheStats, FrameCache, file_fingerprint, protect
+from qdl.dataloader import DateLike, OverlapResolution, Precedence
+from qdl.dtypes import DtypePolicyLike, resolve_dtype_policy
+
+
+class MissingColumnsWarning(UserWarning):
+    """Non-strict projection skipped columns absent from the file; names in `missing`."""
+
+    def __init__(self, message: str, missing: Sequence[str]) -> None:
+        super().__init__(message)
+        self.missing = list(missing)
+
+
+def _warn_missing_columns(file_name: str, missing: Optional[Sequence[str]]) -> None:
+    if missing:
+        warnings.warn(
+            MissingColumnsWarning(f"Columns not found in {file_name}; skipped: {list(missing)}", missing),
+            stacklevel=3,
+        )
+
+
+def _row_predicates(
+    *,
+    start: Optional[DateLike],
+    end: Optional[DateLike],
+    ids: Optional[Iterable[Any]],
+    filters: Any,
+    date_col: str,
+    id_col: str,
+) -> Dict[str, Any]:
+    """Collect row-predicate kwargs for dataloader.load_chars; empty when none are set."""
+    if start is None and end is None and ids is None and filters is None:
+        return {}
+    return {
+        "start": start,
+        "end": end,
+        "ids": list(ids) if ids is not None else None,
+        "filters": filters,
+        "date_col": date_col,
+        "id_col": id_col,
+    }
+
+
+def _read_key(read_kwargs: Dict[str, Any]) -> Optional[Tuple[Hashable, ...]]:
+    """Hashable cache-key part for row predicates and dtype policy."""
+    if not read_kwargs:
+        return None
+    return (
+        pd.Timestamp(read_kwargs["start"]) if read_kwargs.get("start") is not None else None,
+        pd.Timestamp(read_kwargs["end"]) if read_kwargs.get("end") is not None else None,
+        tuple(read_kwargs["ids"]) if read_kwargs.get("ids") is not None else None,
+        # Expressions and DNF tuples are keyed by their textual form
+        str(read_kwargs["filters"]) if read_kwargs.get("filters") is not None else None,
+        read_kwargs.get("dtype_policy"),
+    )
+
+
+# Facade methods that `QDL.load_many` may dispatch to
+LOAD_METHODS: Tuple[str, ...] = (
+    "load_factor_dataset",
+    "load_factors",
+    "load_char_dataset",
+    "load_chars",
+    "load_char",
+    "load_chars_wide",
+    "load_char_history",
+)
+
+# Thread-pool bound of `QDL.load_many` when `max_workers` is not given
+DEFAULT_LOAD_WORKERS = 8
+
+
+@dataclass(frozen=True)
+class LoadRequest:
+    """One facade load for `QDL.load_many`: a method in LOAD_METHODS and its keyword arguments."""
+
+    method: str
+    kwargs: Mapping[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def coerce(cls, request: Union["LoadRequest", Mapping[str, Any], Tuple[str, Mapping[str, Any]]]) -> "LoadRequest":
+        """Accept a LoadRequest, a `{"method": ..., **kwargs}` mapping or a `(method, kwargs)` pair."""
+        if isinstance(request, LoadRequest):
+            return request
+        if isinstance(request, Mapping):
+            if "method" not in request:
+                raise ValueError(f"Load request mappings need a 'method' key (one of {list(LOAD_METHODS)})")
+            return cls(method=request["method"], kwargs={k: v for k, v in request.items() if k != "method"})
+        if isinstance(request, tuple) and len(request) == 2:
+            return cls(method=request[0], kwargs=dict(request[1]))
+        raise TypeError("Load requests must be LoadRequest, a mapping with 'method', or a (method, kwargs) pair")
+
+
+@dataclass
+class LoadResult:
+    """Outcome of one LoadRequest: `value` on success, else the raised `error`."""
+
+    request: LoadRequest
+    value: Any = None
+    error: Optional[BaseException] = None
+    wall_s: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def result(self) -> Any:
+        """Return `value`, re-raising `error` when the load failed."""
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+def _remotable(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Forward a keyword-only load method to the panel server when the facade is remote."""
+
+    @functools.wraps(method)
+    def wrapper(self: "QDL", *args: Any, **kwargs: Any) -> Any:
+        if self.remote is None:
+            return method(self, *args, **kwargs)
+        result = self.remote.call(method.__name__, **kwargs)
+        if isinstance(result, pd.DataFrame) and "vintage" in kwargs:
+            _warn_missing_columns(f"jkp_{kwargs['vintage']}_{kwargs.get('country')}.parquet", result.attrs.get("missing_columns"))
+        return result
+
+    return wrapper
+
+
+def _profiled(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Record a "call" event for `method` when the facade (or an enclosing block) is profiled."""
+
+    @functools.wraps(method)
+    def wrapper(self: "QDL", *args: Any, **kwargs: Any) -> Any:
+        profiler = self.profiler
+        if profiler is None:
+            active = _profiling.current()
+            if active is None:
+                return method(self, *args, **kwargs)
+            profiler = active.profiler
+        # Cache counts come from this call's own "cache" events (see _record_cache), nested calls included
+        with profiler.call(method.__name__) as event:
+            out = method(self, *args, **kwargs)
+            event.output(out)
+            return out
+
+    return wrapper
 
 
 class QDL:
@@ -27,13 +184,284 @@ class QDL:
     - This class delegates to qdl.dataloader and qdl.validator.
     - No schema assumptions are made here; callers must provide keys explicitly
       or rely on later config-driven resolution when available.
+    - Loaded frames are kept in a bounded in-process LRU cache keyed on the
+      resolved file path, file fingerprint (mtime/size), projection and date
+      column. Frames returned from the cache are copy-on-write (or deep copies
+      on pandas without CoW), so callers cannot corrupt cached entries.
+      Disable with `cache=False`; inspect counters via `cache_stats()`.
+    - Factor CSVs are read through a columnar sidecar copy under `META_PATH`
+      (see qdl.dataloader). `factor_sidecar="refresh"` rewrites the sidecar on
+      every (uncached) load; `factor_sidecar="off"` always parses the CSV.
+    - When a metadata catalog exists under `META_PATH` (see `build_catalog` and
+      qdl.catalog), column/factor-name validation and file resolution are
+      answered from it without opening the data files; entries whose file
+      changed on disk are ignored. `catalog="off"` never consults it.
+    - One instance may serve many threads: the cache is locked and loads are
+      single-flight, so concurrent identical requests parse the file once
+      while the other callers wait for that result (see qdl.cache). From
+      asyncio, use `aload`/`aload_many`, which wait in worker threads.
+    - `remote="unix:///path.sock"` (or "tcp://127.0.0.1:<port>", or a
+      qdl.server.RemotePanels) sends the load methods to a local panel server
+      (`python -m qdl.server`) that loads and pivots once for all clients;
+      validation and build_factor run locally on the received frames.
+      `remote_transport="shm"` maps results from shared memory instead of
+      streaming them over the socket.
+    - `profile=True` (or a qdl.profiling.Profiler with its own sinks) records
+      per-call and per-stage events (wall time, bytes read, rows/columns,
+      output memory, cache hits) on `profiler`; see `profile_summary()`.
+    - `panel_store="auto"` (or a qdl.panel_store.PanelStore) persists pivoted
+      numeric panels of full-file `load_char`/`load_chars_wide` calls under
+      `META_PATH/panels` and serves later loads, across restarts, as
+      memory-mapped frames; manage it via `panel_store.list()`/`purge()`.
     """
 
-    def __init__(self, *, loader: Any = None, validator: Any = None) -> None:
+    def __init__(
+        self,
+        *,
+        loader: Any = None,
+        validator: Any = None,
+        cache: bool = True,
+        cache_max_bytes: int = DEFAULT_MAX_BYTES,
+        factor_sidecar: Literal["auto", "refresh", "off"] = "auto",
+        catalog: Literal["auto", "off"] = "auto",
+        profile: Union[bool, _profiling.Profiler] = False,
+        remote: Any = None,
+        remote_transport: Literal["ipc", "shm"] = "ipc",
+        panel_store: Union[Literal["off", "auto"], _panel_store.PanelStore] = "off",
+    ) -> None:
+        if factor_sidecar not in ("auto", "refresh", "off"):
+            raise ValueError("factor_sidecar must be one of {'auto','refresh','off'}")
+        if catalog not in ("auto", "off"):
+            raise ValueError("catalog must be one of {'auto','off'}")
+        if not isinstance(panel_store, _panel_store.PanelStore) and panel_store not in ("auto", "off"):
+            raise ValueError("panel_store must be one of {'auto','off'} or a PanelStore")
         # Allow dependency injection for tests/extensibility
         self._loader = loader or _dataloader
         self._validator = validator or _validator
+        self.cache: Optional[FrameCache] = FrameCache(max_bytes=cache_max_bytes) if cache else None
+        # Only non-default sidecar modes are forwarded, keeping injected loaders compatible.
+        self._factor_load_kwargs: Dict[str, Any] = {
+            "auto": {},
+            "refresh": {"refresh_sidecar": True},
+            "off": {"sidecar": False},
+        }[factor_sidecar]
+        self._use_catalog = catalog == "auto"
+        self._catalog: Optional[_catalog.Catalog] = None
+        self._catalog_stamp: Optional[Tuple[int, int]] = None
+        self._catalog_lock = threading.Lock()
+        self.profiler: Optional[_profiling.Profiler] = (
+            profile if isinstance(profile, _profiling.Profiler) else _profiling.Profiler() if profile else None
+        )
+        self.remote: Any = None
+        if remote is not None:
+            from qdl import server as _server
+
+            self.remote = _server.connect(remote, transport=remote_transport)
+        self.panel_store: Optional[_panel_store.PanelStore] = (
+            panel_store
+            if isinstance(panel_store, _panel_store.PanelStore)
+            else _panel_store.PanelStore() if panel_store == "auto" else None
+        )
 
+    # ---------------- Profiling -----------------
+
+    def profile_events(self) -> pd.DataFrame:
+        """Recorded profiling events, one row each (see qdl.profiling.ProfileEvent)."""
+        if self.profiler is None:
+            raise RuntimeError("Profiling is disabled; construct QDL(profile=True)")
+        return self.profiler.to_frame()
+
+    def profile_summary(self) -> pd.DataFrame:
+        """Per (call, stage) totals of the recorded profiling events."""
+        if self.profiler is None:
+            raise RuntimeError("Profiling is disabled; construct QDL(profile=True)")
+        return self.profiler.summary()
+
+    # ---------------- Cache helpers -----------------
+
+    def cache_stats(self) -> Optional[CacheStats]:
+        """Return hit/miss/eviction counters and occupancy, or None when caching is disabled."""
+        return self.cache.stats() if self.cache is not None else None
+
+    def clear_cache(self) -> None:
+        """Drop all cached frames and reset counters."""
+        if self.cache is not None:
+            self.cache.clear()
+
+    def _resolve_path(self, resolver_name: str, **kwargs: Any) -> Optional[Path]:
+        # Injected loaders may not expose path resolution; caching is skipped for them.
+        resolver = getattr(self._loader, resolver_name, None)
+        if resolver is None:
+            return None
+        return Path(resolver(**kwargs)).resolve()
+
+    def _cached(self, key: Tuple[Hashable, ...], path: Optional[Path], load: Callable[[], Any]) -> Any:
+        if self.cache is None or path is None:
+            return load()
+        value, status = self.cache.fetch((*key, str(path)), file_fingerprint(path), load)
+        self._record_cache(key, hit=status != "miss", status=status)
+        return value
+
+    def _cache_lookup(self, key: Tuple[Hashable, ...], path: Optional[Path]) -> Optional[Any]:
+        if self.cache is None or path is None:
+            return None
+        value = self.cache.get((*key, str(path)), file_fingerprint(path))
+        self._record_cache(key, hit=value is not None)
+        return value
+
+    def _single_flight(self, key: Tuple[Hashable, ...], path: Optional[Path], work: Callable[[], Any]) -> Any:
+        # Deduplicates concurrent identical multi-entry loads (e.g. load_chars_wide scans)
+        if self.cache is None or path is None:
+            return work()
+        value, shared = self.cache.single_flight((*key, str(path), file_fingerprint(path)), work)
+        if shared:
+            self._record_cache(key, hit=True, status="shared")
+        return value
+
+    @staticmethod
+    def _record_cache(key: Tuple[Hashable, ...], *, hit: bool, status: Optional[str] = None) -> None:
+        _profiling.record(
+            "cache",
+            cache_hits=int(hit),
+            cache_misses=int(not hit),
+            detail={"kind": key[0], "status": status or ("hit" if hit else "miss")},
+        )
+
+    def _cache_store(self, key: Tuple[Hashable, ...], path: Optional[Path], value: Any) -> None:
+        if self.cache is not None and path is not None:
+            self.cache.put((*key, str(path)), file_fingerprint(path), value)
+
+    # ---------------- Persistent panel store -----------------
+
+    def _panel_key(
+        self, path: Optional[Path], char: str, date_col: str, id_col: str, read_kwargs: Dict[str, Any]
+    ) -> Optional[_panel_store.PanelKey]:
+        # Only full-file panels read through the default loader are persisted
+        if self.panel_store is None or path is None or self._loader is not _dataloader:
+            return None
+        if any(read_kwargs.get(k) is not None for k in ("start", "end", "ids", "filters")):
+            return None
+        policy = read_kwargs.get("dtype_policy")
+        return _panel_store.PanelKey(
+            source=str(path),
+            fingerprint=file_fingerprint(path),
+            char=char,
+            date_col=date_col,
+            id_col=id_col,
+            variant=None if policy is None else repr(policy),
+        )
+
+    def _stored_panel(self, key: Optional[_panel_store.PanelKey]) -> Optional[pd.DataFrame]:
+        if key is None:
+            return None
+        with _profiling.stage("panel_store", detail={"char": key.char}) as event:
+            wide = self.panel_store.get(key)
+            event.detail["status"] = "miss" if wide is None else "hit"
+            if wide is not None:
+                event.output(wide, measure_bytes=False)
+        return wide
+
+    def _store_panel(self, key: Optional[_panel_store.PanelKey], wide: pd.DataFrame) -> None:
+        if key is not None:
+            with _profiling.stage("panel_store", detail={"char": key.char, "status": "write"}) as event:
+                self.panel_store.put(key, wide)
+                event.output(wide, measure_bytes=False)
+
+    # ---------------- Metadata catalog -----------------
+
+    @_profiled
+    def build_catalog(self, *, refresh: bool = False) -> _catalog.Catalog:
+        """Scan the data directories and persist the metadata catalog (see qdl.catalog.build_catalog)."""
+        catalog = _catalog.build_catalog(refresh=refresh)
+        with self._catalog_lock:
+            self._catalog, self._catalog_stamp = catalog, file_fingerprint(_catalog.catalog_path())
+        return catalog
+
+    def catalog(self) -> Optional[_catalog.Catalog]:
+        """The persisted catalog (re-read when the catalog file changes), or None."""
+        if not self._use_catalog:
+            return None
+        path = _catalog.catalog_path()
+        with self._catalog_lock:
+            try:
+                stamp = file_fingerprint(path)
+            except OSError:
+                self._catalog, self._catalog_stamp = None, None
+                return None
+            if stamp != self._catalog_stamp:
+                self._catalog, self._catalog_stamp = _catalog.load_catalog(), stamp
+            return self._catalog
+
+    def _catalog_entry(self, kind: Literal["chars", "factors"], name: str) -> Optional[_catalog.FileEntry]:
+        # Only the default loader reads the directories the catalog describes
+        if self._loader is not _dataloader or self.remote is not None:
+            return None
+        catalog = self.catalog()
+        return catalog.entry(kind, name) if catalog is not None else None
+
+    def _chars_path(self, file_name: str) -> Optional[Path]:
+        entry = self._catalog_entry("chars", file_name)
+        if entry is not None:
+            return Path(entry.path)
+        return self._resolve_path("resolve_chars_path", file_name=file_name)
+
+    def _char_columns(self, file_name: str) -> Optional[List[str]]:
+        """Column names of a chars file from the catalog or the Parquet footer (None if unknown)."""
+        if self.remote is not None:
+            return self.remote.call("char_columns", file_name=file_name)
+        entry = self._catalog_entry("chars", file_name)
+        if entry is not None:
+            return list(entry.columns)
+        reader = getattr(self._loader, "read_chars_columns", None)
+        return reader(file_name=file_name) if reader is not None else None
+
+    def describe_chars(
+        self,
+        *,
+        country: Literal["usa", "kor"],
+        vintage: Literal["1972-", "2000-", "2020-"],
+    ) -> Optional[_catalog.FileEntry]:
+        """Catalog entry (columns, dtypes, row counts, date/id ranges, row-group stats) or None."""
+        return self._catalog_entry("chars", f"jkp_{vintage}_{country}.parquet")
+
+    def plan_char_query(
+        self,
+        *,
+        country: Literal["usa", "kor"],
+        vintage: Literal["1972-", "2000-", "2020-"],
+        columns: Optional[List[str]] = None,
+        date_col: Literal["eom", "date"] = "eom",
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+    ) -> Dict[str, Any]:
+        """
+        Plan a characteristics read from the catalog without opening the file.
+
+        Returns a dict with the resolved `path`, `columns` that exist,
+        `missing_columns`, the `row_groups` whose `date_col` statistics overlap
+        [start, end], the `estimated_rows` in them and whether the plan is for
+        a `partitioned` copy (then `path` is its directory and row groups run
+        over its part files in year order). Raises KeyError when no fresh
+        catalog entry exists (run `build_catalog` first, and again after
+        repartitioning).
+        """
+        file_name = f"jkp_{vintage}_{country}.parquet"
+        entry = self._catalog_entry("chars", file_name)
+        if entry is None:
+            raise KeyError(f"No up-to-date catalog entry for {file_name}; run build_catalog()")
+        requested = entry.columns if columns is None else list(dict.fromkeys([date_col, "id", *columns]))
+        row_groups = entry.plan_row_groups(date_col=date_col, start=start, end=end)
+        return {
+            "path": Path(entry.path),
+            "columns": [c for c in requested if c in entry.columns],
+            "missing_columns": [c for c in requested if c not in entry.columns],
+            "row_groups": row_groups,
+            "estimated_rows": sum(entry.row_groups[i].num_rows for i in row_groups),
+            "partitioned": entry.partitioned_from is not None,
+        }
+
+    @_profiled
+    @_remotable
     def load_factor_dataset(
         self,
         *,
@@ -56,12 +484,21 @@ class QDL:
         - Regardless of the requested `columns`, the composite identifier ["date","name"]
           is always included to support downstream operations.
         """
-        df = self._loader.load_factors(
-            country=country,
-            dataset=dataset,
-            weighting=weighting,
-            frequency=frequency,
-            encoding=encoding,
+        path = self._resolve_path(
+            "resolve_factors_path",
+            country=country, dataset=dataset, weighting=weighting, frequency=frequency,
+        )
+        df = self._cached(
+            ("factor_dataset", encoding),
+            path,
+            lambda: self._loader.load_factors(
+                country=country,
+                dataset=dataset,
+                weighting=weighting,
+                frequency=frequency,
+                encoding=encoding,
+                **self._factor_load_kwargs,
+            ),
         )
         if columns is None:
             return df
@@ -79,6 +516,8 @@ class QDL:
         rest = [c for c in requested_with_required if c in df.columns and c not in required_keys]
         return df[keys_first + rest]
 
+    @_profiled
+    @_remotable
     def load_factors(
         self,
         *,
@@ -100,16 +539,33 @@ class QDL:
             raise when any requested factor is missing. If `strict=False`, return the
             intersection silently.
         """
-        long_df = self.load_factor_dataset(
-            country=country,
-            dataset=dataset,
-            weighting=weighting,
-            frequency=frequency,
-            encoding=encoding,
-            columns=["date", "name", "ret"],
-            strict=True,
+        path = self._resolve_path(
+            "resolve_factors_path",
+            country=country, dataset=dataset, weighting=weighting, frequency=frequency,
         )
-        wide = _transformer.to_wide_factors(long_df)
+
+        def _load_wide() -> pd.DataFrame:
+            long_df = self._loader.load_factors(
+                country=country,
+                dataset=dataset,
+                weighting=weighting,
+                frequency=frequency,
+                encoding=encoding,
+                **self._factor_load_kwargs,
+            )
+            missing_keys = [c for c in ("date", "name", "ret") if c not in long_df.columns]
+            if missing_keys:
+                raise KeyError(f"Requested columns not found: {missing_keys}")
+            return _transformer.to_wide_factors(long_df[["date", "name", "ret"]])
+
+        entry = self._catalog_entry("factors", path.name) if path is not None else None
+        if factors is not None and strict and entry is not None and entry.factor_names is not None:
+            missing = [f for f in factors if f not in entry.factor_names]
+            if missing:
+                raise KeyError(f"Requested factors not found: {missing}")
+
+        # Cache the full wide frame; factor subsets are cheap column selections on top.
+        wide = self._cached(("factors_wide", encoding), path, _load_wide)
         if factors is None:
             return wide
         missing = [f for f in factors if f not in wide.columns]
@@ -118,6 +574,8 @@ class QDL:
         present_in_order = [f for f in factors if f in wide.columns]
         return wide[present_in_order]
 
+    @_profiled
+    @_remotable
     def load_char_dataset(
         self,
         *,
@@ -128,6 +586,11 @@ class QDL:
         strict: bool = True,
         id_col: Literal["id"] = "id",
         date_col: Literal["eom", "date"] = "eom",
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        ids: Optional[Iterable[Any]] = None,
+        filters: Any = None,
+        dtype_policy: DtypePolicyLike = None,
     ) -> pd.DataFrame:
         """
         Load JKP characteristics datasets (Parquet) via the public API.
@@ -140,8 +603,56 @@ class QDL:
           [date_col, id_col] is always included in the returned frame to support
           downstream operations (e.g., pivoting). `date_col` must be one of {"eom","date"};
           `id_col` is fixed to "id".
+        - `start`/`end` (inclusive, on `date_col`), `ids` (on `id_col`) and a generic
+          `filters` expression are pushed down to a pyarrow dataset scan, so row groups
+          outside the requested slice are skipped using Parquet statistics.
+        - `dtype_policy` ("lean" or a qdl.dtypes.DtypePolicy) narrows dtypes during the
+          Arrow→pandas conversion (float32 characteristics, int32 id, categorical/small-int
+          group columns) to roughly halve resident memory.
+        - With `strict=False`, the projection is intersected with the file schema (catalog
+          or Parquet footer) before reading. Missing columns are listed in
+          `df.attrs["missing_columns"]` and reported via a `MissingColumnsWarning`.
         """
         file_name = f"jkp_{vintage}_{country}.parquet"
+        path = self._chars_path(file_name)
+        entry = self._catalog_entry("chars", file_name)
+        if entry is not None and columns is not None and strict:
+            missing = [c for c in dict.fromkeys([*columns, date_col, id_col]) if c not in entry.columns]
+            if missing:
+                raise KeyError(f"Requested columns not found: {missing}")
+        read_kwargs = _row_predicates(
+            start=start, end=end, ids=ids, filters=filters, date_col=date_col, id_col=id_col
+        )
+        if dtype_policy is not None:
+            read_kwargs["dtype_policy"] = resolve_dtype_policy(dtype_policy)
+        projection = tuple(columns) if columns is not None else None
+        df = self._cached(
+            ("char_dataset", projection, date_col, id_col, engine, strict, _read_key(read_kwargs)),
+            path,
+            lambda: self._read_char_dataset(
+                file_name=file_name,
+                columns=columns,
+                engine=engine,
+                strict=strict,
+                id_col=id_col,
+                date_col=date_col,
+                read_kwargs=read_kwargs,
+            ),
+        )
+        _warn_missing_columns(file_name, df.attrs.get("missing_columns"))
+        return df
+
+    def _read_char_dataset(
+        self,
+        *,
+        file_name: str,
+        columns: Optional[List[str]],
+        engine: str,
+        strict: bool,
+        id_col: str,
+        date_col: str,
+        read_kwargs: Dict[str, Any],
+    ) -> pd.DataFrame:
         # Always include composite identifier keys for chars
         required_keys = [date_col, id_col]
         if columns is None:
@@ -155,27 +666,46 @@ class QDL:
                 file_name=file_name,
                 columns=requested_with_required,
                 engine=engine,
+                **read_kwargs,
             )
 
-        # Non-strict with projection: try pushdown first; if it fails, load all and filter intersection
-        try:
-            return self._loader.load_chars(
-                file_name=file_name,
-                columns=requested_with_required,
-                engine=engine,
-            )
-        except (KeyError, ValueError):
-            df_all = self._loader.load_chars(
-                file_name=file_name,
-                columns=None,
-                engine=engine,
-            )
-            target_cols = requested_with_required or []
-            keys_first = [c for c in required_keys if c in df_all.columns]
-            rest = [c for c in target_cols if c in df_all.columns and c not in required_keys]
-            return df_all[keys_first + rest]
+        # Non-strict with projection: intersect with the file schema (catalog or Parquet
+        # footer) and read only the columns that exist.
+        available = self._char_columns(file_name)
+        if available is None:
+            # Injected loader without schema access: try the projection, else read all
+            try:
+                return self._loader.load_chars(
+                    file_name=file_name,
+                    columns=requested_with_required,
+                    engine=engine,
+                    **read_kwargs,
+                )
+            except (KeyError, ValueError):
+                df_all = self._loader.load_chars(
+                    file_name=file_name,
+                    columns=None,
+                    engine=engine,
+                    **read_kwargs,
+                )
+                keys_first = [c for c in required_keys if c in df_all.columns]
+                rest = [c for c in requested_with_required if c in df_all.columns and c not in required_keys]
+                df = df_all[keys_first + rest]
+                df.attrs["missing_columns"] = [c for c in requested_with_required if c not in df_all.columns]
+                return df
+
+        present = [c for c in requested_with_required if c in available]
+        df = self._loader.load_chars(
+            file_name=file_name,
+            columns=present,
+            engine=engine,
+            **read_kwargs,
+        )
+        df.attrs["missing_columns"] = [c for c in requested_with_required if c not in available]
+        return df
 
     # Backward-compatible alias to previous API name
+    @_profiled
     def load_chars(
         self,
         *,
@@ -186,6 +716,11 @@ class QDL:
         strict: bool = True,
         id_col: Literal["id"] = "id",
         date_col: Literal["eom", "date"] = "eom",
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        ids: Optional[Iterable[Any]] = None,
+        filters: Any = None,
+        dtype_policy: DtypePolicyLike = None,
     ) -> pd.DataFrame:
         return self.load_char_dataset(
             country=country,
@@ -195,8 +730,15 @@ class QDL:
             strict=strict,
             id_col=id_col,
             date_col=date_col,
+            start=start,
+            end=end,
+            ids=ids,
+            filters=filters,
+            dtype_policy=dtype_policy,
         )
 
+    @_profiled
+    @_remotable
     def load_char(
         self,
         *,
@@ -207,33 +749,494 @@ class QDL:
         strict: bool = True,
         id_col: Literal["id"] = "id",
         date_col: Literal["eom", "date"] = "eom",
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        ids: Optional[Iterable[Any]] = None,
+        filters: Any = None,
+        dtype_policy: DtypePolicyLike = None,
     ) -> pd.DataFrame:
         """
         Load a single characteristic and return a 2D wide DataFrame with `date_col` as index
         and `id_col` as columns, values from the specified `char` column.
+
+        `start`, `end`, `ids` and `filters` restrict the rows read and `dtype_policy`
+        narrows dtypes (see `load_char_dataset`).
+        """
+        file_name = f"jkp_{vintage}_{country}.parquet"
+        path = self._chars_path(file_name)
+        read_kwargs = _row_predicates(
+            start=start, end=end, ids=ids, filters=filters, date_col=date_col, id_col=id_col
+        )
+        if dtype_policy is not None:
+            read_kwargs["dtype_policy"] = resolve_dtype_policy(dtype_policy)
+
+        def _load_wide() -> pd.DataFrame:
+            panel_key = self._panel_key(path, char, date_col, id_col, read_kwargs)
+            stored = self._stored_panel(panel_key)
+            if stored is not None:
+                return stored
+            # Ensure required columns are present (strict load to surface errors early)
+            df = self._read_char_dataset(
+                file_name=file_name,
+                columns=[date_col, id_col, char],
+                engine=engine,
+                strict=True if strict else False,
+                id_col=id_col,
+                date_col=date_col,
+                read_kwargs=read_kwargs,
+            )
+            # Pivot to wide
+            wide = _transformer.to_wide(
+                df,
+                index_cols=[date_col],
+                column_col=id_col,
+                value_col=char,
+                agg="first",
+                sort_index=True,
+                sort_columns=True,
+            )
+            self._store_panel(panel_key, wide)
+            return wide
+
+        # Only the pivoted frame is cached; the long projection is transient.
+        return self._cached(
+            ("char_wide", char, date_col, id_col, engine, _read_key(read_kwargs)), path, _load_wide
+        )
+
+    @_profiled
+    @_remotable
+    def load_chars_wide(
+        self,
+        *,
+        country: Literal["usa", "kor"],
+        vintage: Literal["1972-", "2000-", "2020-"],
+        chars: List[str],
+        engine: str = "pyarrow",
+        strict: bool = True,
+        id_col: Literal["id"] = "id",
+        date_col: Literal["eom", "date"] = "eom",
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        ids: Optional[Iterable[Any]] = None,
+        filters: Any = None,
+        dtype_policy: DtypePolicyLike = None,
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Load several characteristics with one projected Parquet scan and return
+        `{char: wide DataFrame}` on shared, identical `date_col` × `id_col` axes.
+
+        Each frame equals `load_char(..., char=char)` for the same arguments, and is
+        cached under the same key, so mixing both calls never re-reads the file.
+        With `strict=False`, characteristics missing from the file are omitted.
         """
-        # Ensure required columns are present (strict load to surface errors early)
-        df = self.load_char_dataset(
+        if not chars:
+            raise ValueError("chars must contain at least one characteristic name")
+        chars = list(dict.fromkeys(chars))
+        file_name = f"jkp_{vintage}_{country}.parquet"
+        path = self._chars_path(file_name)
+        read_kwargs = _row_predicates(
+            start=start, end=end, ids=ids, filters=filters, date_col=date_col, id_col=id_col
+        )
+        if dtype_policy is not None:
+            read_kwargs["dtype_policy"] = resolve_dtype_policy(dtype_policy)
+
+        def _key(char: str) -> Tuple[Hashable, ...]:
+            return ("char_wide", char, date_col, id_col, engine, _read_key(read_kwargs))
+
+        result: Dict[str, pd.DataFrame] = {}
+        to_scan: List[str] = []
+        for char in chars:
+            cached = self._cache_lookup(_key(char), path)
+            if cached is None:
+                stored = self._stored_panel(self._panel_key(path, char, date_col, id_col, read_kwargs))
+                if stored is None:
+                    to_scan.append(char)
+                    continue
+                self._cache_store(_key(char), path, stored)
+                cached = protect(stored)
+            result[char] = cached
+
+        if to_scan:
+
+            def _scan() -> Tuple[Optional[List[str]], Dict[str, pd.DataFrame]]:
+                df = self._read_char_dataset(
+                    file_name=file_name,
+                    columns=[date_col, id_col, *to_scan],
+                    engine=engine,
+                    strict=strict,
+                    id_col=id_col,
+                    date_col=date_col,
+                    read_kwargs=read_kwargs,
+                )
+                present = [c for c in to_scan if c in df.columns and c not in (date_col, id_col)]
+                scanned = _transformer.to_wide_many(
+                    df, index_col=date_col, column_col=id_col, value_cols=present, agg="first"
+                )
+                for char, wide in scanned.items():
+                    self._cache_store(_key(char), path, wide)
+                    self._store_panel(self._panel_key(path, char, date_col, id_col, read_kwargs), wide)
+                return df.attrs.get("missing_columns"), scanned
+
+            missing, scanned = self._single_flight(
+                ("char_wide_scan", tuple(to_scan), date_col, id_col, engine, strict, _read_key(read_kwargs)),
+                path,
+                _scan,
+            )
+            _warn_missing_columns(file_name, missing)
+            for char, wide in scanned.items():
+                result[char] = protect(wide)
+
+        # Preserve the requested order
+        return {c: result[c] for c in chars if c in result}
+
+    @_profiled
+    @_remotable
+    def load_char_history(
+        self,
+        *,
+        country: Literal["usa", "kor"],
+        columns: Optional[List[str]] = None,
+        precedence: Precedence = "newest",
+        resolve: OverlapResolution = "row",
+        id_col: Literal["id"] = "id",
+        date_col: Literal["eom", "date"] = "eom",
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        ids: Optional[Iterable[Any]] = None,
+        filters: Any = None,
+        dtype_policy: DtypePolicyLike = None,
+        source_col: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        Load characteristics stitched across every vintage file of `country`
+        (see dataloader.load_chars_stitched).
+
+        Where vintages overlap, `precedence` ("newest", "oldest" or an explicit
+        vintage order) decides which file wins, per (`date_col`, `id_col`) row
+        with `resolve="row"` or per date with `resolve="period"`. `start`/`end`
+        skip files and row groups outside the range. `source_col` names an
+        optional column recording each row's vintage. [date_col, id_col] are
+        always included in the projection.
+        """
+        if columns is not None:
+            columns = list(dict.fromkeys([date_col, id_col, *columns]))
+        read_kwargs = _row_predicates(
+            start=start, end=end, ids=ids, filters=filters, date_col=date_col, id_col=id_col
+        )
+        if dtype_policy is not None:
+            read_kwargs["dtype_policy"] = resolve_dtype_policy(dtype_policy)
+
+        def _load() -> pd.DataFrame:
+            return self._loader.load_chars_stitched(
+                country=country,
+                precedence=precedence,
+                resolve=resolve,
+                columns=columns,
+                source_col=source_col,
+                **{"date_col": date_col, "id_col": id_col, **read_kwargs},
+            )
+
+        # Keyed on every vintage file's fingerprint; the highest-precedence file anchors the entry.
+        vintage_paths = self._char_history_paths(country=country, precedence=precedence)
+        if vintage_paths is None:
+            return _load()
+        paths = [p for _, p in vintage_paths]
+        files = tuple((vintage, file_fingerprint(p)) for vintage, p in vintage_paths)
+        projection = tuple(columns) if columns is not None else None
+        return self._cached(
+            ("char_history", files, projection, resolve, date_col, id_col, source_col, _read_key(read_kwargs)),
+            paths[0],
+            _load,
+        )
+
+    def _char_history_paths(self, *, country: str, precedence: Precedence) -> Optional[List[Tuple[str, Path]]]:
+        """(vintage, file) pairs read by `load_char_history`, highest precedence first; None when unknown."""
+        order_fn = getattr(self._loader, "stitch_order", None)
+        if order_fn is None:
+            return None
+        order = order_fn(country=country, precedence=precedence)
+        paths = [self._chars_path(f"jkp_{vintage}_{country}.parquet") for vintage in order]
+        if any(p is None for p in paths):
+            return None
+        return list(zip(order, paths))
+
+    def iter_char_batches(
+        self,
+        *,
+        country: Literal["usa", "kor"],
+        vintage: Literal["1972-", "2000-", "2020-"],
+        columns: Optional[List[str]] = None,
+        batch_rows: int = _dataloader.DEFAULT_BATCH_ROWS,
+        by: Optional[Literal["month"]] = None,
+        output: Literal["pandas", "arrow"] = "pandas",
+        id_col: Literal["id"] = "id",
+        date_col: Literal["eom", "date"] = "eom",
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        ids: Optional[Iterable[Any]] = None,
+        filters: Any = None,
+        dtype_policy: DtypePolicyLike = None,
+    ) -> Iterator[Any]:
+        """
+        Stream JKP characteristics in bounded-memory chunks (see dataloader.iter_chars).
+
+        With `by="month"`, each chunk holds complete calendar months of `date_col`, so
+        month-by-month pipelines (tercile sorts, portfolio returns) can run on large
+        vintages without materializing the whole file. As with `load_char_dataset`,
+        [date_col, id_col] are always included in the projection. Chunks are not cached.
+        """
+        file_name = f"jkp_{vintage}_{country}.parquet"
+        projection = None if columns is None else list(dict.fromkeys([date_col, id_col, *columns]))
+        return self._loader.iter_chars(
+            file_name=file_name,
+            columns=projection,
+            batch_rows=batch_rows,
+            by=by,
+            output=output,
+            start=start,
+            end=end,
+            ids=ids,
+            filters=filters,
+            date_col=date_col,
+            id_col=id_col,
+            **({"dtype_policy": dtype_policy} if dtype_policy is not None else {}),
+        )
+
+    # ---------------- Concurrent loading -----------------
+
+    def _run_request(self, request: LoadRequest) -> LoadResult:
+        t0 = time.perf_counter()
+        try:
+            if request.method not in LOAD_METHODS:
+                raise ValueError(f"Unsupported load method: {request.method} (choose from {list(LOAD_METHODS)})")
+            value = getattr(self, request.method)(**request.kwargs)
+        except Exception as exc:
+            return LoadResult(request=request, error=exc, wall_s=time.perf_counter() - t0)
+        return LoadResult(request=request, value=value, wall_s=time.perf_counter() - t0)
+
+    def load_many(
+        self,
+        requests: Sequence[Union[LoadRequest, Mapping[str, Any], Tuple[str, Mapping[str, Any]]]],
+        *,
+        max_workers: Optional[int] = None,
+        raise_errors: bool = False,
+    ) -> List[LoadResult]:
+        """
+        Run several facade loads concurrently on a bounded thread pool.
+
+        Each request names a method in LOAD_METHODS plus its keyword arguments, e.g.
+        `{"method": "load_factors", "country": "usa", "dataset": "factor", "weighting": "ew"}`
+        or `LoadRequest("load_char", {"country": "usa", "vintage": "2020-", "char": "be_me"})`.
+        CSV parsing and Parquet decoding release the GIL for most of their work, so
+        reads of different files overlap. Loads share this instance's cache.
+
+        Returns one LoadResult per request, in request order. A failing request
+        records its exception in `LoadResult.error` without affecting the others;
+        with `raise_errors=True` the first error (in request order) is raised once
+        all requests have finished.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        parsed = [LoadRequest.coerce(r) for r in requests]
+        if not parsed:
+            return []
+        workers = max_workers if max_workers is not None else min(DEFAULT_LOAD_WORKERS, len(parsed))
+        if workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="qdl-load") as pool:
+            # Each task runs in a copy of the caller's context (keeps an active profiler)
+            futures = [pool.submit(contextvars.copy_context().run, self._run_request, r) for r in parsed]
+            results = [f.result() for f in futures]
+        if raise_errors:
+            for r in results:
+                r.result()
+        return results
+
+    async def aload(self, method: str, **kwargs: Any) -> Any:
+        """
+        Await one facade load (a method in LOAD_METHODS) from asyncio code.
+
+        The load runs in a worker thread, so waiting on a concurrent identical
+        load (single-flight) never blocks the event loop.
+        """
+        import asyncio
+
+        if method not in LOAD_METHODS:
+            raise ValueError(f"Unsupported load method: {method} (choose from {list(LOAD_METHODS)})")
+        return await asyncio.to_thread(getattr(self, method), **kwargs)
+
+    async def aload_many(
+        self,
+        requests: Sequence[Union[LoadRequest, Mapping[str, Any], Tuple[str, Mapping[str, Any]]]],
+        *,
+        max_workers: Optional[int] = None,
+        raise_errors: bool = False,
+    ) -> List[LoadResult]:
+        """
+        Asyncio variant of `load_many`: awaits the loads without blocking the event loop.
+
+        Loads run on a dedicated bounded thread pool (not the loop's default
+        executor); results and error handling are as in `load_many`.
+        """
+        import asyncio
+        from concurrent.futures import ThreadPoolExecutor
+
+        parsed = [LoadRequest.coerce(r) for r in requests]
+        if not parsed:
+            return []
+        workers = max_workers if max_workers is not None else min(DEFAULT_LOAD_WORKERS, len(parsed))
+        if workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        loop = asyncio.get_running_loop()
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="qdl-aload")
+        try:
+            results = list(
+                await asyncio.gather(
+                    *(loop.run_in_executor(pool, contextvars.copy_context().run, self._run_request, r) for r in parsed)
+                )
+            )
+        finally:
+            pool.shutdown(wait=False)
+        if raise_errors:
+            for r in results:
+                r.result()
+        return results
+
+    @_profiled
+    def build_factor(
+        self,
+        *,
+        country: Literal["usa", "kor"],
+        vintage: Literal["1972-", "2000-", "2020-"],
+        char: str,
+        weightings: Sequence[Literal["ew", "vw", "vw_cap"]] = _construction.WEIGHTINGS,
+        direction: Optional[int] = None,
+        date_col: Literal["eom", "date"] = "eom",
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        dtype_policy: DtypePolicyLike = None,
+        **kwargs: Any,
+    ) -> pd.DataFrame:
+        """
+        Build the JKP long-short tercile factor for `char` (see qdl.construction).
+
+        Loads `char`, `ret_exc`, `market_equity` and `size_grp` with one scan via
+        `load_chars_wide` and returns a date-indexed frame with one column per
+        weighting. `direction` defaults to qdl.construction.KNOWN_DIRECTIONS (else +1).
+        Extra keyword arguments go to qdl.construction.build_factor_returns.
+
+        To validate, select a weighting and name it after the factor, e.g.
+        `q.validate_factor(user=f["ew"].rename(char), weighting="ew")`.
+        """
+        panels = self.load_chars_wide(
             country=country,
             vintage=vintage,
-            columns=[date_col, id_col, char],
-            engine=engine,
-            strict=True if strict else False,
-            id_col=id_col,
+            chars=[char, *_construction.REQUIRED_PANELS],
             date_col=date_col,
+            start=start,
+            end=end,
+            dtype_policy=dtype_policy,
         )
-        # Pivot to wide
-        wide = _transformer.to_wide(
-            df,
-            index_cols=[date_col],
-            column_col=id_col,
-            value_col=char,
-            agg="first",
-            sort_index=True,
-            sort_columns=True,
+        with _profiling.stage("construct", detail={"chars": 1}) as st:
+            factors = _construction.build_factor_returns(
+                panels[char],
+                ret_exc=panels["ret_exc"],
+                market_equity=panels["market_equity"],
+                size_grp=panels["size_grp"],
+                direction=_construction.resolve_direction(char, direction),
+                weightings=weightings,
+                **kwargs,
+            )
+            st.output(factors)
+        return factors
+
+    @_profiled
+    def build_factors(
+        self,
+        *,
+        country: Literal["usa", "kor"],
+        vintage: Literal["1972-", "2000-", "2020-"],
+        chars: Union[Literal["all"], Sequence[str]] = "all",
+        weighting: Literal["ew", "vw", "vw_cap"] = "ew",
+        directions: Optional[Dict[str, int]] = None,
+        date_col: Literal["eom", "date"] = "eom",
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        dtype_policy: DtypePolicyLike = None,
+        max_workers: Optional[int] = None,
+        **kwargs: Any,
+    ) -> pd.DataFrame:
+        """
+        Build many JKP factors at once and return them wide (date index, factor names as columns).
+
+        The output has the shape of `load_factors`, so it can be passed directly as
+        `validate_factor(user=..., weighting=weighting)`.
+
+        Parameters
+        ----------
+        chars : "all" or list[str], default "all"
+            Characteristics to build. "all" builds every reference factor
+            (`load_factors(country, "factor", weighting)`) whose characteristic
+            exists in the characteristics file.
+        directions : dict[str, int], optional
+            Per-characteristic overrides of qdl.construction.KNOWN_DIRECTIONS.
+        max_workers : int, optional
+            Process pool size for qdl.construction.build_factor_zoo (1 = in-process).
+            With `remote=...` every panel comes from one server-side
+            `load_chars_wide` scan and the factors are built in-process.
+
+        Extra keyword arguments go to qdl.construction.build_factor_zoo.
+        """
+        file_name = f"jkp_{vintage}_{country}.parquet"
+        available = self._char_columns(file_name)
+        if available is None:
+            raise TypeError("build_factors requires a loader exposing read_chars_columns")
+        if isinstance(chars, str):
+            if chars != "all":
+                raise ValueError("chars must be 'all' or a list of characteristic names")
+            reference = self.load_factors(country=country, dataset="factor", weighting=weighting)
+            chars = [c for c in reference.columns if c in available]
+        else:
+            missing = [c for c in chars if c not in available]
+            if missing:
+                raise KeyError(f"Requested columns not found: {missing}")
+
+        # Pool workers read their characteristic from local files; a remote facade fetches them with the shared panels
+        remote_chars = list(chars) if self.remote is not None else []
+        panels = self.load_chars_wide(
+            country=country,
+            vintage=vintage,
+            chars=list(dict.fromkeys([*_construction.REQUIRED_PANELS, *remote_chars])),
+            date_col=date_col,
+            start=start,
+            end=end,
+            dtype_policy=dtype_policy,
         )
-        return wide
+        read_kwargs = _row_predicates(
+            start=start, end=end, ids=None, filters=None, date_col=date_col, id_col="id"
+        )
+        read_kwargs["dtype_policy"] = resolve_dtype_policy(dtype_policy)
+        # Reads and pivots in pool workers are not profiled; they count towards this stage
+        with _profiling.stage("construct", detail={"chars": len(chars), "max_workers": max_workers}) as st:
+            zoo = _construction.build_factor_zoo(
+                file_name=file_name,
+                chars=chars,
+                ret_exc=panels["ret_exc"],
+                market_equity=panels["market_equity"],
+                size_grp=panels["size_grp"],
+                weightings=(weighting,),
+                directions=directions,
+                date_col=date_col,
+                max_workers=max_workers,
+                read_kwargs=read_kwargs,
+                load_chars=self._loader.load_chars,
+                char_panels=panels if self.remote is not None else None,
+                **kwargs,
+            )
+            st.output(zoo[weighting])
+        return zoo[weighting]
 
+    @_profiled
     def validate_factor(
         self,
         *,
@@ -329,3 +1332,53 @@ class QDL:
             reference=ref_wide,
             **kwargs,
         )
+
+    @_profiled
+    def validate_many(
+        self,
+        *,
+        candidates: Mapping[str, Union[pd.Series, pd.DataFrame]],
+        reference_df: Optional[pd.DataFrame] = None,
+        country: Literal["usa", "kor"] = "usa",
+        dataset: Literal["factor", "theme", "mkt"] = "factor",
+        weighting: Literal["ew", "vw", "vw_cap"] = "ew",
+        frequency: Literal["monthly"] = "monthly",
+        encoding: str = "utf-8",
+        strict: bool = True,
+        **kwargs: Any,
+    ) -> Any:
+        """Score many named candidate factor frames against one reference load.
+
+        Candidates are wide frames (date index, factor names as columns); a named
+        Series counts as a single factor. The reference is loaded once via
+        load_factors(...) for the union of candidate factor names (unless
+        `reference_df` is given) and delegated to qdl.validator.validate_many,
+        which returns a leaderboard plus per-candidate ValidationReports keyed by
+        `str(name)` (names colliding as strings raise ValueError).
+        """
+        wide: Dict[str, pd.DataFrame] = {}
+        for name, cand in candidates.items():
+            if isinstance(cand, pd.Series):
+                if cand.name is None:
+                    raise ValueError(f"Candidate '{name}': set Series.name to the factor name")
+                cand = cand.to_frame(name=str(cand.name))
+            elif not isinstance(cand, pd.DataFrame):
+                raise TypeError("candidates must map names to pandas Series or DataFrames in wide form (date index)")
+            wide[name] = cand
+
+        if reference_df is not None:
+            ref_wide = reference_df
+        else:
+            factors_to_load = list(dict.fromkeys(str(c) for cand in wide.values() for c in cand.columns))
+            ref_wide = self.load_factors(
+                country=country,
+                dataset=dataset,
+                weighting=weighting,
+                frequency=frequency,
+                encoding=encoding,
+                factors=factors_to_load,
+                strict=strict,
+            )
+
+        return self._validator.validate_many(candidates=wide, reference=ref_wide, **kwargs)
+
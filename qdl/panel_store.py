@@ -0,0 +1,257 @@
+"""
+qdl.panel_store
+
+Persistent store of pivoted wide panels (date × id), memory-mapped on read.
+
+`QDL.load_char` spends most of its time reading Parquet and pivoting; the
+result is a plain numeric matrix. With `QDL(panel_store="auto")` each pivoted
+panel is written once under `qdl.config.META_PATH / "panels"`:
+
+    panels/<digest>/values.npy     row-major or column-major value matrix
+    panels/<digest>/index.npy      row labels (e.g. eom, datetime64)
+    panels/<digest>/columns.npy    column labels (e.g. id, int64)
+    panels/<digest>/manifest.json  key, shape, dtype, size, creation time
+
+keyed by (source file, file fingerprint, characteristic, date_col, id_col,
+dtype policy). Later loads, including after a kernel restart, open the
+values with `numpy.load(mmap_mode="c")`: nothing is read until a slice is
+touched, and writes stay private to the process. A changed source file
+changes the fingerprint, so stale panels are never served; `purge(stale=True)`
+removes them.
+
+Only numeric panels of full-file loads are stored (row predicates such as
+`start`/`end`/`ids`/`filters` bypass the store; slice the stored panel
+instead). Use `PanelStore.list`, `total_bytes` and `purge` to manage it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from qdl import config as _config
+from qdl.cache import file_fingerprint
+
+
+PANELS_DIRNAME = "panels"
+MANIFEST_FILE_NAME = "manifest.json"
+STORE_VERSION = 1
+
+# Label dtypes stored as .npy (numeric, bool, datetime/timedelta)
+_NPY_LABEL_KINDS = "biufmM"
+
+
+@dataclass(frozen=True)
+class PanelKey:
+    """Identity of one stored panel; `variant` distinguishes dtype policies."""
+
+    source: str
+    fingerprint: Tuple[int, int]
+    char: str
+    date_col: str
+    id_col: str
+    variant: Optional[str] = None
+
+    @property
+    def digest(self) -> str:
+        payload = json.dumps([STORE_VERSION, *asdict(self).values()], default=list)
+        return hashlib.sha1(payload.encode()).hexdigest()
+
+
+@dataclass
+class StoredPanel:
+    """Manifest of a stored panel (see `PanelStore.list`)."""
+
+    digest: str
+    source: str
+    fingerprint: List[int]
+    char: str
+    date_col: str
+    id_col: str
+    variant: Optional[str]
+    shape: List[int]
+    dtype: str
+    nbytes: int
+    created: str
+    index_name: Optional[str] = None
+    columns_name: Optional[str] = None
+    last_used: Optional[float] = field(default=None, compare=False)
+
+    def is_stale(self) -> bool:
+        """True when the source file changed or disappeared since the panel was written."""
+        try:
+            return list(file_fingerprint(self.source)) != list(self.fingerprint)
+        except OSError:
+            return True
+
+
+def _storable(frame: pd.DataFrame) -> bool:
+    if frame.shape[1] == 0 or isinstance(frame.index, pd.MultiIndex) or isinstance(frame.columns, pd.MultiIndex):
+        return False
+    dtypes = set(frame.dtypes)
+    if len(dtypes) != 1 or not isinstance(next(iter(dtypes)), np.dtype) or next(iter(dtypes)).kind not in "fiu":
+        return False
+    return all(
+        isinstance(labels.dtype, np.dtype) and labels.dtype.kind in _NPY_LABEL_KINDS
+        for labels in (frame.index, frame.columns)
+    )
+
+
+class PanelStore:
+    """
+    Directory of memory-mappable wide panels.
+
+    Parameters
+    ----------
+    root : path-like, optional
+        Store directory; defaults to `qdl.config.META_PATH / "panels"`,
+        resolved at each call so `qdl.config.set_data_root` applies.
+    """
+
+    def __init__(self, root: Optional[Union[str, Path]] = None) -> None:
+        self._root = Path(root) if root is not None else None
+
+    @property
+    def root(self) -> Path:
+        return self._root if self._root is not None else _config.META_PATH / PANELS_DIRNAME
+
+    def _manifest(self, directory: Path) -> Optional[StoredPanel]:
+        path = directory / MANIFEST_FILE_NAME
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            panel = StoredPanel(**data)
+            panel.last_used = path.stat().st_mtime
+        except (OSError, ValueError, TypeError):
+            return None
+        return panel
+
+    def get(self, key: PanelKey) -> Optional[pd.DataFrame]:
+        """Memory-mapped panel for `key` (copy-on-write), or None when not stored."""
+        directory = self.root / key.digest
+        panel = self._manifest(directory)
+        if panel is None:
+            return None
+        try:
+            values = np.load(directory / "values.npy", mmap_mode="c")
+            index = pd.Index(np.load(directory / "index.npy"), name=panel.index_name)
+            columns = pd.Index(np.load(directory / "columns.npy"), name=panel.columns_name)
+        except (OSError, ValueError):
+            return None
+        if list(values.shape) != panel.shape or values.shape != (len(index), len(columns)):
+            return None
+        try:
+            os.utime(directory / MANIFEST_FILE_NAME)  # last-used time for purge(max_bytes=...)
+        except OSError:
+            pass
+        return pd.DataFrame(values, index=index, columns=columns, copy=False)
+
+    def put(self, key: PanelKey, frame: pd.DataFrame) -> Optional[StoredPanel]:
+        """Store `frame` under `key`; returns None (nothing written) for non-numeric panels."""
+        if not _storable(frame):
+            return None
+        final = self.root / key.digest
+        if (final / MANIFEST_FILE_NAME).exists():
+            return self._manifest(final)
+        tmp = self.root / f".tmp-{uuid.uuid4().hex}"
+        tmp.mkdir(parents=True)
+        try:
+            values = frame.to_numpy()
+            np.save(tmp / "values.npy", values, allow_pickle=False)
+            np.save(tmp / "index.npy", frame.index.to_numpy(), allow_pickle=False)
+            np.save(tmp / "columns.npy", frame.columns.to_numpy(), allow_pickle=False)
+            panel = StoredPanel(
+                digest=key.digest,
+                source=key.source,
+                fingerprint=list(key.fingerprint),
+                char=key.char,
+                date_col=key.date_col,
+                id_col=key.id_col,
+                variant=key.variant,
+                shape=list(values.shape),
+                dtype=values.dtype.str,
+                nbytes=int(values.nbytes),
+                created=pd.Timestamp.now().isoformat(timespec="seconds"),
+                index_name=None if frame.index.name is None else str(frame.index.name),
+                columns_name=None if frame.columns.name is None else str(frame.columns.name),
+            )
+            manifest = {k: v for k, v in asdict(panel).items() if k != "last_used"}
+            (tmp / MANIFEST_FILE_NAME).write_text(json.dumps(manifest, indent=1), encoding="utf-8")
+            os.replace(tmp, final)
+        except OSError:
+            # Lost a race with another writer (final exists) or the disk is full: keep whatever is there
+            shutil.rmtree(tmp, ignore_errors=True)
+            return self._manifest(final)
+        return panel
+
+    def list(self) -> List[StoredPanel]:
+        """Manifests of all stored panels, oldest use first."""
+        if not self.root.is_dir():
+            return []
+        panels = [p for d in self.root.iterdir() if d.is_dir() and not d.name.startswith(".") for p in [self._manifest(d)] if p]
+        return sorted(panels, key=lambda p: p.last_used or 0.0)
+
+    def to_frame(self) -> pd.DataFrame:
+        """`list()` as a DataFrame (one row per panel, with a `stale` column)."""
+        rows = [{**asdict(p), "stale": p.is_stale()} for p in self.list()]
+        return pd.DataFrame(rows, columns=[*StoredPanel.__dataclass_fields__, "stale"])
+
+    def total_bytes(self) -> int:
+        """Bytes on disk of all stored panels (values and labels)."""
+        if not self.root.is_dir():
+            return 0
+        return sum(f.stat().st_size for f in self.root.rglob("*") if f.is_file())
+
+    def purge(
+        self,
+        *,
+        stale: bool = False,
+        source: Optional[str] = None,
+        char: Optional[str] = None,
+        older_than: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+    ) -> int:
+        """
+        Delete stored panels and return how many were removed.
+
+        Without arguments every panel is removed. Otherwise a panel is removed
+        when it matches any given criterion: `stale` (source changed or gone),
+        `source` (file name or path), `char`, `older_than` (seconds since last
+        use). `max_bytes` then evicts least recently used panels until the
+        values fit in that budget.
+        """
+        panels = self.list()
+        criteria = stale or source is not None or char is not None or older_than is not None or max_bytes is not None
+        now = time.time()
+        doomed = []
+        keep = []
+        for p in panels:
+            if (
+                not criteria
+                or (stale and p.is_stale())
+                or (source is not None and source in (p.source, Path(p.source).name))
+                or (char is not None and p.char == char)
+                or (older_than is not None and p.last_used is not None and now - p.last_used > older_than)
+            ):
+                doomed.append(p)
+            else:
+                keep.append(p)
+        if max_bytes is not None:
+            size = sum(p.nbytes for p in keep)
+            for p in keep:  # least recently used first
+                if size <= max_bytes:
+                    break
+                doomed.append(p)
+                size -= p.nbytes
+        for p in doomed:
+            shutil.rmtree(self.root / p.digest, ignore_errors=True)
+        return len(doomed)
@@ -0,0 +1,261 @@
+"""
+qdl.partition
+
+Rewrite monolithic characteristics files into hive-partitioned datasets.
+
+`repartition_chars` turns `<CHARS_PATH>/jkp_<vintage>_<country>.parquet` into
+
+    <CHARS_PATH>/jkp_<vintage>_<country>/country=<country>/year=<yyyy>/part-0.parquet
+    <CHARS_PATH>/jkp_<vintage>_<country>/_qdl_partitioned.json
+
+with rows sorted by (`date_col`, `id_col`), row groups holding whole months
+(up to `row_group_rows` rows; a larger month is split into id-ordered row
+groups), and min/max statistics on every column plus the sort order in the
+footer. The manifest records the source file's size and mtime.
+
+The loaders (`qdl.dataloader.load_chars`, `iter_chars`, `load_chars_stitched`
+and through them the facade) read the partitioned copy transparently while it
+matches the source file, or once the source has been removed: date ranges
+prune whole year directories and row groups, id subsets prune row groups
+whose id range misses them (effective when months span several row groups,
+i.e. `row_group_rows` below the monthly cross-section). A rewritten source
+file invalidates the copy until it is repartitioned again.
+
+Command line:
+
+    python -m qdl.partition --country usa --vintage 2020- [--row-group-rows N]
+    python -m qdl.partition --country usa --all --overwrite
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import shutil
+import uuid
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+import pandas as pd
+
+from qdl import config as _config
+from qdl import dataloader as _dataloader
+
+
+# Target rows per row group; pyarrow's default maximum is 1Mi rows
+DEFAULT_ROW_GROUP_ROWS = 131_072
+DEFAULT_COMPRESSION = "zstd"
+
+
+@dataclass
+class PartitionInfo:
+    """Summary of one partitioned copy (also the content of its manifest)."""
+
+    path: str
+    source: str
+    source_size: int
+    source_mtime_ns: int
+    country: str
+    vintage: str
+    date_col: str
+    id_col: str
+    partitioning: List[str]
+    sorted_by: List[str]
+    row_group_rows: int
+    compression: str
+    rows: int
+    row_groups: int
+    years: List[int]
+    min_date: Optional[str]
+    max_date: Optional[str]
+    created: str
+
+
+def _write_year(
+    table, path: Path, *, date_col: str, id_col: str, row_group_rows: int, compression: str
+) -> int:
+    """Write one year's rows as whole-month row groups; returns the number of row groups."""
+    import pyarrow.parquet as pq
+
+    table = table.sort_by([(date_col, "ascending"), (id_col, "ascending")])
+    keys = _dataloader._month_keys(table.column(date_col))
+    chunks, _ = _dataloader._split_whole_months(table, keys, row_group_rows, final=True)
+    sorting = pq.SortingColumn.from_ordering(table.schema, [(date_col, "ascending"), (id_col, "ascending")])
+    row_groups = 0
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with pq.ParquetWriter(
+        path, table.schema, compression=compression, write_statistics=True, sorting_columns=sorting
+    ) as writer:
+        for chunk in chunks:
+            # Each write starts a new row group, so months never share one with the next chunk
+            writer.write_table(chunk, row_group_size=row_group_rows)
+            row_groups += -(-chunk.num_rows // row_group_rows)
+    return row_groups
+
+
+def repartition_chars(
+    *,
+    country: str,
+    vintage: str,
+    row_group_rows: int = DEFAULT_ROW_GROUP_ROWS,
+    compression: str = DEFAULT_COMPRESSION,
+    date_col: str = "eom",
+    id_col: str = "id",
+    overwrite: bool = False,
+) -> PartitionInfo:
+    """
+    Write the hive-partitioned copy of `jkp_<vintage>_<country>.parquet` and return its manifest.
+
+    The source is read one year at a time (a pushed-down date range), so
+    memory stays bounded by the largest year. The copy is assembled in a
+    temporary directory and moved into place at the end.
+
+    Raises
+    ------
+    FileNotFoundError
+        The source file does not exist.
+    FileExistsError
+        A partitioned copy exists and `overwrite` is False.
+    ValueError
+        Invalid `row_group_rows`, missing key columns, null dates, or source
+        columns clashing with the partition fields.
+    """
+    import pyarrow.dataset as ds
+
+    if row_group_rows <= 0:
+        raise ValueError("row_group_rows must be positive")
+    source = _config.CHARS_PATH / f"jkp_{vintage}_{country}.parquet"
+    if not source.is_file():
+        raise FileNotFoundError(f"Characteristics file not found: {source}")
+    target = source.with_suffix("")
+    if target.exists() and not overwrite:
+        raise FileExistsError(f"Partitioned copy already exists: {target} (pass overwrite=True)")
+
+    stat = source.stat()
+    dataset = ds.dataset(str(source), format="parquet")
+    names = dataset.schema.names
+    missing = [c for c in (date_col, id_col) if c not in names]
+    if missing:
+        raise ValueError(f"Key columns not found in {source.name}: {missing}")
+    clashing = [c for c in _dataloader.PARTITION_FIELDS if c in names]
+    if clashing:
+        raise ValueError(f"Columns {clashing} of {source.name} clash with the partition fields")
+    if dataset.count_rows(filter=ds.field(date_col).is_null()):
+        raise ValueError(f"{source.name} has null '{date_col}' values; cannot partition by year")
+
+    span = _dataloader._parquet_date_span(source, date_col)
+    if span is None:
+        dates = dataset.to_table(columns=[date_col]).column(date_col).to_pandas()
+        span = (pd.Timestamp(dates.min()), pd.Timestamp(dates.max())) if len(dates) else None
+    years = list(range(span[0].year, span[1].year + 1)) if span is not None else []
+    date_type = dataset.schema.field(date_col).type
+
+    tmp = target.parent / f".{target.name}.tmp-{uuid.uuid4().hex}"
+    rows = row_groups = 0
+    written: List[int] = []
+    try:
+        for year in years:
+            lo = _dataloader._date_scalar(pd.Timestamp(year=year, month=1, day=1), date_type)
+            hi = _dataloader._date_scalar(pd.Timestamp(year=year + 1, month=1, day=1), date_type)
+            table = dataset.to_table(filter=(ds.field(date_col) >= lo) & (ds.field(date_col) < hi))
+            if table.num_rows == 0:
+                continue
+            row_groups += _write_year(
+                table,
+                tmp / f"country={country}" / f"year={year}" / "part-0.parquet",
+                date_col=date_col,
+                id_col=id_col,
+                row_group_rows=row_group_rows,
+                compression=compression,
+            )
+            rows += table.num_rows
+            written.append(year)
+        if rows != dataset.count_rows():
+            raise ValueError(f"{source.name}: partitioned {rows} of {dataset.count_rows()} rows; dates outside the year span")
+
+        info = PartitionInfo(
+            path=str(target),
+            source=source.name,
+            source_size=int(stat.st_size),
+            source_mtime_ns=int(stat.st_mtime_ns),
+            country=country,
+            vintage=vintage,
+            date_col=date_col,
+            id_col=id_col,
+            partitioning=list(_dataloader.PARTITION_FIELDS),
+            sorted_by=[date_col, id_col],
+            row_group_rows=int(row_group_rows),
+            compression=compression,
+            rows=int(rows),
+            row_groups=int(row_groups),
+            years=written,
+            min_date=span[0].isoformat() if span is not None else None,
+            max_date=span[1].isoformat() if span is not None else None,
+            created=pd.Timestamp.now().isoformat(timespec="seconds"),
+        )
+        tmp.mkdir(parents=True, exist_ok=True)
+        (tmp / _dataloader.PARTITION_MANIFEST).write_text(json.dumps(asdict(info), indent=1), encoding="utf-8")
+        if target.exists():
+            shutil.rmtree(target)
+        tmp.rename(target)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    return info
+
+
+def partition_info(*, country: str, vintage: str) -> Optional[PartitionInfo]:
+    """Manifest of the partitioned copy of `jkp_<vintage>_<country>.parquet`, or None."""
+    manifest = _dataloader.read_partition_manifest(_config.CHARS_PATH / f"jkp_{vintage}_{country}")
+    return PartitionInfo(**manifest) if manifest else None
+
+
+def remove_partitioned(*, country: str, vintage: str) -> bool:
+    """Delete the partitioned copy (the loaders fall back to the source file); True if one existed."""
+    target = _config.CHARS_PATH / f"jkp_{vintage}_{country}"
+    if _dataloader.read_partition_manifest(target) is None:
+        return False
+    shutil.rmtree(target)
+    return True
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m qdl.partition", description="Rewrite JKP characteristics files into hive-partitioned datasets."
+    )
+    parser.add_argument("--country", required=True)
+    which = parser.add_mutually_exclusive_group(required=True)
+    which.add_argument("--vintage", action="append", help="vintage to repartition (repeatable)")
+    which.add_argument("--all", action="store_true", help="every vintage of --country")
+    parser.add_argument("--row-group-rows", type=int, default=DEFAULT_ROW_GROUP_ROWS)
+    parser.add_argument("--compression", default=DEFAULT_COMPRESSION)
+    parser.add_argument("--date-col", default="eom")
+    parser.add_argument("--id-col", default="id")
+    parser.add_argument("--overwrite", action="store_true")
+    parser.add_argument("--data-root", default=None, help="data directory (default: qdl.config / QDL_DATA_PATH)")
+    args = parser.parse_args(argv)
+
+    if args.data_root is not None:
+        _config.set_data_root(args.data_root)
+    vintages = _dataloader.chars_vintages(country=args.country) if args.all else args.vintage
+    for vintage in vintages:
+        info = repartition_chars(
+            country=args.country,
+            vintage=vintage,
+            row_group_rows=args.row_group_rows,
+            compression=args.compression,
+            date_col=args.date_col,
+            id_col=args.id_col,
+            overwrite=args.overwrite,
+        )
+        print(
+            f"{info.source} -> {info.path}: {info.rows} rows, {len(info.years)} years, "
+            f"{info.row_groups} row groups",
+            flush=True,
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
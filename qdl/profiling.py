@@ -0,0 +1,305 @@
+"""
+qdl.profiling
+
+Opt-in instrumentation of the facade's hot paths.
+
+A `Profiler` records one `ProfileEvent` per facade call (stage "call") and
+one per internal stage executed during it:
+
+- `read_csv`, `read_sidecar`, `write_sidecar`   factor CSV / Arrow sidecar
+- `read_parquet`                                Parquet decode (incl. Arrow→pandas)
+- `parse_dates`                                 date/eom parsing
+- `pivot`                                       long → wide
+- `align`, `metrics`, `plot`                    validation
+- `construct`                                   factor construction
+- `cache`                                       facade cache lookups (hit/miss)
+- `panel_store`                                 persistent wide-panel store (hit/miss/write)
+
+Events carry wall time, bytes read (file bytes; for Parquet the compressed
+size of the projected column chunks, before row-group pruning), rows and
+columns decoded or produced, output frame memory and cache hit/miss counts.
+A call's cache counts are the sum of its own `cache` events plus those of
+the facade calls nested in it, so concurrent calls (`QDL.load_many`) never
+see each other's lookups.
+
+Enable it per facade (`QDL(profile=True)` or `QDL(profile=Profiler(...))`,
+events on `q.profiler`) or for a block of code:
+
+    with qdl.profiling.profile() as prof:
+        q.load_char(...)
+    prof.summary()
+
+Sinks are callables receiving each event as it is recorded (e.g.
+`JsonLinesSink(path)` for a job runner). When no profiler is active, `stage`
+costs one context-variable lookup.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Union
+
+import pandas as pd
+
+from qdl.cache import frame_nbytes
+
+
+@dataclass
+class ProfileEvent:
+    """One timed facade call (`stage == "call"`) or internal stage."""
+
+    call_id: int
+    call: str
+    stage: str
+    wall_s: float
+    started_at: float
+    parent_id: Optional[int] = None
+    rows: Optional[int] = None
+    columns: Optional[int] = None
+    bytes_read: Optional[int] = None
+    output_bytes: Optional[int] = None
+    cache_hits: int = 0
+    cache_misses: int = 0
+    detail: Dict[str, Any] = field(default_factory=dict)
+
+    def output(self, obj: Any, *, measure_bytes: bool = True) -> None:
+        """Fill rows/columns (and output_bytes) from a DataFrame, Series or array-like."""
+        shape = getattr(obj, "shape", None)
+        if shape is not None and len(shape) >= 1:
+            self.rows = int(shape[0])
+            self.columns = int(shape[1]) if len(shape) > 1 else 1
+        if measure_bytes:
+            nbytes = frame_nbytes(obj)
+            self.output_bytes = nbytes if nbytes or shape is not None else None
+
+
+Sink = Callable[[ProfileEvent], None]
+
+
+class _Disabled:
+    """Stand-in yielded by `stage` when no profiler is active; ignores all updates."""
+
+    def output(self, obj: Any, *, measure_bytes: bool = True) -> None:
+        pass
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        pass
+
+    @property
+    def detail(self) -> Dict[str, Any]:
+        return {}
+
+
+_DISABLED = _Disabled()
+
+
+@dataclass(frozen=True)
+class _CallContext:
+    profiler: "Profiler"
+    call_id: int
+    call: str
+    event: Optional["ProfileEvent"] = field(default=None, compare=False)
+
+
+_ACTIVE: ContextVar[Optional[_CallContext]] = ContextVar("qdl_profiling_active", default=None)
+
+
+class Profiler:
+    """
+    Collects ProfileEvents and forwards them to sinks.
+
+    Parameters
+    ----------
+    sinks : sequence of callables, optional
+        Called with every event as it is recorded (in the recording thread).
+    keep_events : bool, default True
+        Keep events in memory (`events`, `to_frame`, `summary`). Disable for
+        long-running processes that only stream to sinks.
+    """
+
+    def __init__(self, sinks: Sequence[Sink] = (), *, keep_events: bool = True) -> None:
+        self.sinks: List[Sink] = list(sinks)
+        self.keep_events = keep_events
+        self.events: List[ProfileEvent] = []
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def add_sink(self, sink: Sink) -> None:
+        self.sinks.append(sink)
+
+    def emit(self, event: ProfileEvent) -> None:
+        if self.keep_events:
+            with self._lock:
+                self.events.append(event)
+        for sink in self.sinks:
+            sink(event)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.events.clear()
+
+    @contextmanager
+    def call(self, name: str) -> Iterator[ProfileEvent]:
+        """Time a facade call; stages recorded inside it are attributed to it."""
+        parent = _ACTIVE.get()
+        if parent is not None and parent.profiler is not self:
+            parent = None
+        call_id = next(self._ids)
+        event = ProfileEvent(
+            call_id=call_id,
+            call=name,
+            stage="call",
+            wall_s=0.0,
+            started_at=time.time(),
+            parent_id=parent.call_id if parent is not None else None,
+        )
+        token = _ACTIVE.set(_CallContext(self, call_id, name, event))
+        t0 = time.perf_counter()
+        try:
+            yield event
+        finally:
+            event.wall_s = time.perf_counter() - t0
+            _ACTIVE.reset(token)
+            if parent is not None:
+                _tally(parent, event)
+            self.emit(event)
+
+    def to_frame(self) -> pd.DataFrame:
+        """All recorded events, one row each (`detail` kept as a dict column)."""
+        with self._lock:
+            rows = [asdict(e) for e in self.events]
+        columns = list(ProfileEvent.__dataclass_fields__)
+        return pd.DataFrame(rows, columns=columns)
+
+    def summary(self) -> pd.DataFrame:
+        """Totals per (call, stage): count, wall time, rows, bytes read, output bytes and cache counts."""
+        events = self.to_frame()
+        if events.empty:
+            return pd.DataFrame(
+                columns=["count", "wall_s", "mean_wall_s", "rows", "bytes_read", "output_bytes", "cache_hits", "cache_misses"]
+            )
+        grouped = events.groupby(["call", "stage"], sort=False)
+        return pd.DataFrame(
+            {
+                "count": grouped.size(),
+                "wall_s": grouped["wall_s"].sum(),
+                "mean_wall_s": grouped["wall_s"].mean(),
+                "rows": grouped["rows"].sum(min_count=1),
+                "bytes_read": grouped["bytes_read"].sum(min_count=1),
+                "output_bytes": grouped["output_bytes"].sum(min_count=1),
+                "cache_hits": grouped["cache_hits"].sum(),
+                "cache_misses": grouped["cache_misses"].sum(),
+            }
+        )
+
+
+class JsonLinesSink:
+    """Sink appending each event as one JSON line to `path`."""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def __call__(self, event: ProfileEvent) -> None:
+        line = json.dumps(asdict(event), default=str)
+        with self._lock, self.path.open("a", encoding="utf-8") as fh:
+            fh.write(line + "\n")
+
+
+def _tally(context: _CallContext, event: ProfileEvent) -> None:
+    """Add `event`'s cache counts to the call event of `context`."""
+    if context.event is None or not (event.cache_hits or event.cache_misses):
+        return
+    with context.profiler._lock:
+        context.event.cache_hits += event.cache_hits
+        context.event.cache_misses += event.cache_misses
+
+
+def current() -> Optional[_CallContext]:
+    """The active call context (pass to `stage(context=...)` for deferred work), or None."""
+    return _ACTIVE.get()
+
+
+def enabled() -> bool:
+    return _ACTIVE.get() is not None
+
+
+@contextmanager
+def stage(name: str, *, context: Optional[_CallContext] = None, **fields: Any) -> Iterator[Any]:
+    """
+    Time a stage of the active call and record it on exit.
+
+    Yields the ProfileEvent so callers can fill `rows`, `bytes_read`, ... (or
+    call `.output(frame)`); yields an inert stand-in when profiling is off.
+    `context` attributes deferred work (e.g. lazy plots) to the call that
+    created it.
+    """
+    context = context or _ACTIVE.get()
+    if context is None:
+        yield _DISABLED
+        return
+    event = ProfileEvent(
+        call_id=context.call_id, call=context.call, stage=name, wall_s=0.0, started_at=time.time(), **fields
+    )
+    t0 = time.perf_counter()
+    try:
+        yield event
+    finally:
+        event.wall_s = time.perf_counter() - t0
+        _tally(context, event)
+        context.profiler.emit(event)
+
+
+def record(name: str, **fields: Any) -> None:
+    """Record an instantaneous event (e.g. a cache hit) for the active call."""
+    context = _ACTIVE.get()
+    if context is None:
+        return
+    event = ProfileEvent(call_id=context.call_id, call=context.call, stage=name, wall_s=0.0, started_at=time.time(), **fields)
+    _tally(context, event)
+    context.profiler.emit(event)
+
+
+@contextmanager
+def profile(*sinks: Sink, profiler: Optional[Profiler] = None, name: str = "profile") -> Iterator[Profiler]:
+    """
+    Profile every facade call made inside the block (on any QDL instance).
+
+    Work outside facade calls (e.g. direct `qdl.transformer` use) is attributed
+    to a call named `name`.
+    """
+    profiler = profiler or Profiler(sinks)
+    with profiler.call(name):
+        yield profiler
+
+
+def parquet_projection_nbytes(path: Union[str, Path], columns: Optional[Sequence[str]] = None) -> Optional[int]:
+    """
+    Compressed bytes of the `columns` chunks (all when None) over every row
+    group, from the footer; summed over the files of a partitioned directory.
+    """
+    path = Path(path)
+    files = sorted(path.rglob("*.parquet")) if path.is_dir() else [path]
+    try:
+        import pyarrow.parquet as pq
+
+        metas = [pq.ParquetFile(f).metadata for f in files]
+    except Exception:
+        return None
+    wanted = None if columns is None else set(columns)
+    total = 0
+    for meta in metas:
+        for i in range(meta.num_row_groups):
+            rg = meta.row_group(i)
+            for j in range(rg.num_columns):
+                chunk = rg.column(j)
+                if wanted is None or chunk.path_in_schema in wanted:
+                    total += int(chunk.total_compressed_size)
+    return total
@@ -0,0 +1,612 @@
+"""
+qdl.server
+
+Local panel server: one long-running process loads and pivots panels once and
+serves them to notebook clients as Arrow IPC.
+
+    python -m qdl.server --socket /tmp/qdl.sock          # Unix socket
+    python -m qdl.server --port 8765 --shm-dir /dev/shm  # localhost TCP
+
+    q = QDL(remote="unix:///tmp/qdl.sock")               # or "tcp://127.0.0.1:8765"
+    q.load_char(country="usa", vintage="2000-", char="be_me")
+
+The server wraps one `QDL` instance, so its frame cache and single-flight
+loading are shared by every client. Clients send one JSON line per request
+(a method in `SERVED_METHODS` plus keyword arguments) and receive a JSON
+header line followed by the encoded result. Arguments must be JSON values
+after `encode_kwargs`: arrays, Index, Series and sets travel as lists, dates
+as ISO strings and a `DtypePolicy` as "lean" or its fields (rebuilt on the
+server); anything else (e.g. a pyarrow Expression filter) raises TypeError
+on the client. Errors are re-raised on the
+client with the server's exception type when it is a builtin one.
+
+Encoding:
+- Wide frames with one numeric dtype (`load_char`, `load_factors`, the panels
+  of `load_chars_wide`) travel as a single flat Arrow column of the row-major
+  values, with index and column labels in the schema metadata; the client
+  wraps the received buffer in a 2-D array without copying it.
+- Other frames use `pyarrow.Table.from_pandas` (index preserved).
+
+Transports:
+- "ipc" (default): Arrow IPC streams over the socket (one copy, no parsing).
+- "shm": the server writes each distinct result once as an Arrow IPC file in
+  a shared-memory directory (e.g. /dev/shm) and sends its path; clients
+  memory-map it copy-on-write, so all clients share the same physical pages
+  for wide panels until they write to them. Files are rewritten when the
+  source data file changes and removed when the server closes. Requires
+  client and server on the same host.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import hashlib
+import json
+import mmap
+import os
+import shutil
+import socket
+import socketserver
+import tempfile
+import threading
+import uuid
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Literal, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from qdl import config as _config
+
+
+SERVED_METHODS: Tuple[str, ...] = (
+    "load_factor_dataset",
+    "load_factors",
+    "load_char_dataset",
+    "load_chars",
+    "load_char",
+    "load_chars_wide",
+    "load_char_history",
+    "char_columns",
+    "ping",
+)
+
+Transport = Literal["ipc", "shm"]
+
+_LOOPBACK_HOSTS = ("127.0.0.1", "localhost", "::1")
+# Exceptions re-raised on the client with their original type
+_BUILTIN_ERRORS = {e.__name__: e for e in (KeyError, ValueError, TypeError, FileNotFoundError, NotImplementedError)}
+
+Address = Union[str, Path, Tuple[str, int]]
+
+
+def parse_address(address: Address) -> Tuple[str, Any]:
+    """Return ("unix", path) or ("tcp", (host, port)) for "unix://...", "tcp://host:port", a path or a tuple."""
+    if isinstance(address, tuple):
+        host, port = address
+        kind, target = "tcp", (str(host), int(port))
+    else:
+        text = str(address)
+        if text.startswith("tcp://"):
+            host, _, port = text[len("tcp://"):].rpartition(":")
+            if not host or not port.isdigit():
+                raise ValueError(f"Invalid tcp address: {text} (expected tcp://host:port)")
+            kind, target = "tcp", (host.strip("[]"), int(port))
+        else:
+            kind, target = "unix", text[len("unix://"):] if text.startswith("unix://") else text
+    if kind == "tcp" and target[0] not in _LOOPBACK_HOSTS:
+        raise ValueError(f"The panel server only listens on localhost; got host {target[0]}")
+    return kind, target
+
+
+# ---------------- Frame encoding -----------------
+
+def _labels_to_meta(labels: pd.Index) -> Dict[str, Any]:
+    dtype = labels.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        # e.g. ids under DtypePolicy(id_dtype="category"): keep the categories' own dtype
+        return {
+            "dtype": "category",
+            "name": labels.name,
+            "categories": _labels_to_meta(dtype.categories),
+            "ordered": bool(dtype.ordered),
+            "values": np.asarray(labels.codes).tolist(),
+        }
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        values: List[Any] = labels.asi8.tolist()
+    elif pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_bool_dtype(dtype):
+        values = labels.to_numpy().tolist()
+    else:
+        values = [None if pd.isna(v) else str(v) for v in labels]
+    return {"dtype": str(dtype), "name": labels.name, "values": values}
+
+
+def _labels_from_meta(meta: Dict[str, Any]) -> pd.Index:
+    dtype = meta["dtype"]
+    if dtype == "category" and "categories" in meta:
+        categories = _labels_from_meta(meta["categories"])
+        values = pd.Categorical.from_codes(meta["values"], categories=categories, ordered=meta["ordered"])
+        return pd.CategoricalIndex(values, name=meta["name"])
+    if dtype.startswith("datetime64"):
+        return pd.DatetimeIndex(np.asarray(meta["values"], dtype=np.int64).view(dtype), name=meta["name"])
+    return pd.Index(meta["values"], dtype=dtype, name=meta["name"])
+
+
+def _is_wide_numeric(df: pd.DataFrame) -> bool:
+    if df.shape[1] == 0 or not isinstance(df.columns, pd.Index) or isinstance(df.columns, pd.MultiIndex):
+        return False
+    if isinstance(df.index, pd.MultiIndex):
+        return False
+    dtypes = set(df.dtypes)
+    if len(dtypes) != 1:
+        return False
+    dtype = next(iter(dtypes))
+    return isinstance(dtype, np.dtype) and dtype.kind in "fiu"
+
+
+def frame_to_table(df: pd.DataFrame) -> Any:
+    """Encode a frame as an Arrow table (see module notes); `df.attrs` travel in the metadata."""
+    import pyarrow as pa
+
+    meta: Dict[bytes, bytes] = {}
+    if _is_wide_numeric(df):
+        values = np.ascontiguousarray(df.to_numpy())
+        table = pa.table({"values": pa.array(values.ravel())})
+        meta[b"qdl.kind"] = b"wide"
+        meta[b"qdl.wide"] = json.dumps(
+            {
+                "shape": list(values.shape),
+                "dtype": values.dtype.str,
+                "index": _labels_to_meta(df.index),
+                "columns": _labels_to_meta(df.columns),
+            }
+        ).encode()
+    else:
+        table = pa.Table.from_pandas(df, preserve_index=True)
+        meta.update(table.schema.metadata or {})
+        meta[b"qdl.kind"] = b"table"
+    if df.attrs:
+        meta[b"qdl.attrs"] = json.dumps(df.attrs, default=str).encode()
+    return table.replace_schema_metadata(meta)
+
+
+def _wide_values(table: Any, info: Dict[str, Any], backing: Optional[Any]) -> np.ndarray:
+    """2-D values of a "wide" table, viewing `backing` (the received bytes / mapping) when possible."""
+    dtype = np.dtype(info["dtype"])
+    shape = tuple(info["shape"])
+    count = int(np.prod(shape))
+    chunks = table.column(0).chunks
+    if count == 0:
+        return np.empty(shape, dtype=dtype)
+    if backing is not None and len(chunks) == 1:
+        chunk = chunks[0]
+        buf = chunk.buffers()[1]
+        base = np.frombuffer(backing, dtype=np.uint8)
+        offset = buf.address - base.ctypes.data + chunk.offset * dtype.itemsize
+        if 0 <= offset and offset + count * dtype.itemsize <= base.size:
+            return np.frombuffer(backing, dtype=dtype, count=count, offset=offset).reshape(shape)
+    return table.column(0).to_numpy().reshape(shape)
+
+
+def table_to_frame(table: Any, *, backing: Optional[Any] = None) -> pd.DataFrame:
+    """Decode `frame_to_table` output; wide values are zero-copy views of `backing` when given."""
+    meta = table.schema.metadata or {}
+    if meta.get(b"qdl.kind") == b"wide":
+        info = json.loads(meta[b"qdl.wide"])
+        df = pd.DataFrame(
+            _wide_values(table, info, backing),
+            index=_labels_from_meta(info["index"]),
+            columns=_labels_from_meta(info["columns"]),
+            copy=False,
+        )
+    else:
+        df = table.to_pandas()
+    if b"qdl.attrs" in meta:
+        df.attrs.update(json.loads(meta[b"qdl.attrs"]))
+    return df
+
+
+def _serialize_stream(table: Any) -> Any:
+    import pyarrow as pa
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue()
+
+
+def _write_ipc_file(table: Any, path: Path) -> None:
+    import pyarrow as pa
+
+    tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+    with pa.OSFile(str(tmp), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp, path)
+
+
+def _read_ipc_file(path: str) -> pd.DataFrame:
+    import pyarrow as pa
+
+    # Private copy-on-write mapping: pages stay shared with other clients until written
+    with open(path, "rb") as fh:
+        mapping = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_COPY)
+    table = pa.ipc.open_file(pa.py_buffer(mapping)).read_all()
+    return table_to_frame(table, backing=mapping)
+
+
+# ---------------- Wire helpers -----------------
+
+_DTYPE_POLICY_TAG = "__dtype_policy__"
+
+
+def _encode_value(value: Any, name: str) -> Any:
+    from qdl.dtypes import LEAN, DtypePolicy
+
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, np.generic):
+        return _encode_value(value.item(), name)
+    if isinstance(value, DtypePolicy):
+        if value == LEAN:
+            return "lean"
+        return {_DTYPE_POLICY_TAG: {k: _encode_value(v, name) for k, v in asdict(value).items()}}
+    if isinstance(value, (pd.Timestamp, datetime.date, np.datetime64)):
+        return pd.Timestamp(value).isoformat()
+    if isinstance(value, (set, frozenset)):
+        items = [_encode_value(v, name) for v in value]
+        try:
+            return sorted(items)
+        except TypeError:
+            return items
+    if isinstance(value, (list, tuple, np.ndarray, pd.Index, pd.Series)):
+        return [_encode_value(v, name) for v in (value.tolist() if hasattr(value, "tolist") else value)]
+    if isinstance(value, dict) and all(isinstance(k, str) for k in value):
+        return {k: _encode_value(v, name) for k, v in value.items()}
+    raise TypeError(f"Argument '{name}' cannot be sent to the panel server: {type(value).__name__} is not JSON-encodable")
+
+
+def encode_kwargs(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON-safe copy of a request's keyword arguments (see the module docstring); TypeError otherwise."""
+    return {name: _encode_value(value, name) for name, value in kwargs.items()}
+
+
+def decode_kwargs(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Server-side inverse of `encode_kwargs` for values that are not plain JSON (DtypePolicy)."""
+    from qdl.dtypes import DtypePolicy
+
+    out = dict(kwargs)
+    policy = out.get("dtype_policy")
+    if isinstance(policy, dict) and set(policy) == {_DTYPE_POLICY_TAG}:
+        fields = policy[_DTYPE_POLICY_TAG]
+        out["dtype_policy"] = DtypePolicy(**{k: tuple(v) if isinstance(v, list) else v for k, v in fields.items()})
+    return out
+
+
+def _send_json(wfile: BinaryIO, payload: Dict[str, Any]) -> None:
+    wfile.write(json.dumps(payload).encode() + b"\n")
+
+
+def _read_json(rfile: BinaryIO) -> Optional[Dict[str, Any]]:
+    line = rfile.readline()
+    if not line:
+        return None
+    return json.loads(line)
+
+
+def _read_exact(rfile: BinaryIO, size: int) -> bytearray:
+    buf = bytearray(size)
+    view = memoryview(buf)
+    got = 0
+    while got < size:
+        n = rfile.readinto(view[got:])
+        if not n:
+            raise ConnectionError("Panel server closed the connection mid-response")
+        got += n
+    return buf
+
+
+# ---------------- Server -----------------
+
+class _Handler(socketserver.StreamRequestHandler):
+    server: "_SocketServerMixin"
+
+    def handle(self) -> None:
+        while True:
+            try:
+                request = _read_json(self.rfile)
+            except ValueError:
+                _send_json(self.wfile, {"ok": False, "error": "ValueError", "message": "Malformed request line"})
+                return
+            if request is None:
+                return
+            self.server.panel_server._respond(request, self.wfile)
+            self.wfile.flush()
+
+
+class _SocketServerMixin:
+    panel_server: "PanelServer"
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class _UnixServer(_SocketServerMixin, socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    pass
+
+
+class _TCPServer(_SocketServerMixin, socketserver.ThreadingMixIn, socketserver.TCPServer):
+    pass
+
+
+class PanelServer:
+    """
+    Serve facade loads of one shared `QDL` instance to local clients.
+
+    Parameters
+    ----------
+    address : str, path or (host, port)
+        "unix:///path.sock" (or a plain path) or "tcp://127.0.0.1:<port>"
+        (port 0 picks a free port; see `address`). TCP is loopback-only.
+    qdl : QDL, optional
+        Facade whose cache backs every request; default `QDL()`.
+    shm_dir : path, optional
+        Directory for the "shm" transport (default /dev/shm when present,
+        else the temp directory). A private subdirectory is created in it.
+    """
+
+    def __init__(self, address: Address, *, qdl: Any = None, shm_dir: Optional[Union[str, Path]] = None) -> None:
+        from qdl.facade import QDL
+
+        self.qdl = qdl if qdl is not None else QDL()
+        kind, target = parse_address(address)
+        if kind == "unix":
+            path = Path(target)
+            if path.exists():
+                path.unlink()
+            self._server: socketserver.BaseServer = _UnixServer(str(path), _Handler)
+        else:
+            self._server = _TCPServer(target, _Handler)
+        self._server.panel_server = self  # type: ignore[attr-defined]
+        self._kind = kind
+        base = Path(shm_dir) if shm_dir is not None else Path("/dev/shm") if Path("/dev/shm").is_dir() else Path(tempfile.gettempdir())
+        self.shm_dir = base / f"qdl-panels-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._shm_files: Dict[str, Tuple[Tuple[Any, ...], List[str]]] = {}
+        self._shm_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> str:
+        """Address clients should connect to (resolves port 0)."""
+        if self._kind == "unix":
+            return f"unix://{self._server.server_address}"
+        host, port = self._server.server_address[:2]
+        return f"tcp://{host}:{port}"
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever()
+
+    def start(self) -> "PanelServer":
+        """Serve from a daemon thread (returns immediately)."""
+        self._thread = threading.Thread(target=self._server.serve_forever, name="qdl-panel-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        """Stop serving, remove the socket file and the shared-memory files."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+        if self._kind == "unix":
+            try:
+                Path(self._server.server_address).unlink()
+            except OSError:
+                pass
+        shutil.rmtree(self.shm_dir, ignore_errors=True)
+
+    def __enter__(self) -> "PanelServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    # -- request handling --
+
+    def _call(self, method: str, kwargs: Dict[str, Any]) -> Any:
+        if method not in SERVED_METHODS:
+            raise ValueError(f"Unsupported remote method: {method} (choose from {list(SERVED_METHODS)})")
+        if method == "ping":
+            return "pong"
+        if method == "char_columns":
+            return self.qdl._char_columns(**kwargs)
+        return getattr(self.qdl, method)(**kwargs)
+
+    def _source_fingerprint(self, method: str, kwargs: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Fingerprints of the data files behind a request (keys the shared-memory files)."""
+        from qdl.cache import file_fingerprint
+
+        if method in ("load_factor_dataset", "load_factors"):
+            paths = [
+                self.qdl._resolve_path(
+                    "resolve_factors_path",
+                    country=kwargs.get("country"),
+                    dataset=kwargs.get("dataset"),
+                    weighting=kwargs.get("weighting"),
+                    frequency=kwargs.get("frequency", "monthly"),
+                )
+            ]
+        elif method == "load_char_history":
+            vintage_paths = self.qdl._char_history_paths(
+                country=kwargs.get("country"), precedence=kwargs.get("precedence", "newest")
+            )
+            paths = [p for _, p in vintage_paths] if vintage_paths is not None else [None]
+        elif method in ("load_char_dataset", "load_chars", "load_char", "load_chars_wide"):
+            paths = [self.qdl._chars_path(f"jkp_{kwargs.get('vintage')}_{kwargs.get('country')}.parquet")]
+        else:
+            raise ValueError(f"No source files known for {method}; use transport='ipc'")
+        return tuple(
+            item for path in paths for item in ((str(path), *file_fingerprint(path)) if path is not None else (None,))
+        )
+
+    def _shm_paths(self, method: str, kwargs: Dict[str, Any], frames: Dict[str, pd.DataFrame]) -> List[str]:
+        key = hashlib.sha1(json.dumps([method, kwargs], sort_keys=True).encode()).hexdigest()
+        stamp = self._source_fingerprint(method, kwargs)
+        with self._shm_lock:
+            known = self._shm_files.get(key)
+            if known is not None and known[0] == stamp and all(os.path.exists(p) for p in known[1]):
+                return known[1]
+            self.shm_dir.mkdir(parents=True, exist_ok=True)
+            # A new generation per source fingerprint; clients still mapping old files keep their pages
+            generation = uuid.uuid4().hex[:8]
+            paths = []
+            for i, frame in enumerate(frames.values()):
+                path = self.shm_dir / f"{key}-{generation}-{i}.arrow"
+                _write_ipc_file(frame_to_table(frame), path)
+                paths.append(str(path))
+            if known is not None:
+                for old in known[1]:
+                    try:
+                        os.unlink(old)
+                    except OSError:
+                        pass
+            self._shm_files[key] = (stamp, paths)
+            return paths
+
+    def _respond(self, request: Dict[str, Any], wfile: BinaryIO) -> None:
+        method = request.get("method", "")
+        kwargs = request.get("kwargs") or {}
+        transport = request.get("transport", "ipc")
+        try:
+            if transport not in ("ipc", "shm"):
+                raise ValueError("transport must be one of {'ipc','shm'}")
+            result = self._call(method, decode_kwargs(kwargs))
+            if isinstance(result, pd.DataFrame):
+                kind, frames = "frame", {"": result}
+            elif isinstance(result, dict) and all(isinstance(v, pd.DataFrame) for v in result.values()):
+                kind, frames = "frames", result
+            else:
+                _send_json(wfile, {"ok": True, "result": "value", "value": result})
+                return
+            if transport == "shm":
+                paths = self._shm_paths(method, kwargs, frames)
+                _send_json(wfile, {"ok": True, "result": kind, "keys": list(frames), "paths": paths})
+                return
+            payloads = [_serialize_stream(frame_to_table(f)) for f in frames.values()]
+        except Exception as exc:
+            message = exc.args[0] if len(exc.args) == 1 and isinstance(exc.args[0], str) else str(exc)
+            _send_json(wfile, {"ok": False, "error": type(exc).__name__, "message": message})
+            return
+        _send_json(wfile, {"ok": True, "result": kind, "keys": list(frames), "sizes": [p.size for p in payloads]})
+        for payload in payloads:
+            wfile.write(memoryview(payload))
+
+
+# ---------------- Client -----------------
+
+class RemotePanels:
+    """
+    Client of a PanelServer; one connection per thread.
+
+    `call(method, **kwargs)` returns what the server's facade method returns
+    (DataFrame, dict of DataFrames or a JSON value). `QDL(remote=...)` wraps
+    this so the usual facade API runs against the server.
+    """
+
+    def __init__(self, address: Address, *, transport: Transport = "ipc", timeout: Optional[float] = None) -> None:
+        if transport not in ("ipc", "shm"):
+            raise ValueError("transport must be one of {'ipc','shm'}")
+        self._kind, self._target = parse_address(address)
+        self.address = address
+        self.transport = transport
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self) -> Tuple[socket.socket, BinaryIO]:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            family = socket.AF_UNIX if self._kind == "unix" else socket.AF_INET6 if ":" in self._target[0] else socket.AF_INET
+            sock = socket.socket(family, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            sock.connect(self._target)
+            conn = self._local.conn = (sock, sock.makefile("rwb"))
+        return conn
+
+    def close(self) -> None:
+        """Close this thread's connection (others close when their threads exit)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn[1].close()
+            conn[0].close()
+            self._local.conn = None
+
+    def call(self, method: str, **kwargs: Any) -> Any:
+        import pyarrow as pa
+
+        request = {"method": method, "kwargs": encode_kwargs(kwargs), "transport": self.transport}
+        sock, stream = self._connection()
+        raws: List[bytearray] = []
+        try:
+            _send_json(stream, request)
+            stream.flush()
+            header = _read_json(stream)
+            if header is None:
+                raise ConnectionError("Panel server closed the connection")
+            for size in header.get("sizes", ()):
+                raws.append(_read_exact(stream, size))
+        except OSError:
+            # Transport failure: drop the connection so the next call reconnects
+            self.close()
+            raise
+
+        if not header["ok"]:
+            error = _BUILTIN_ERRORS.get(header["error"])
+            if error is not None:
+                raise error(header["message"])
+            raise RuntimeError(f"{header['error']}: {header['message']}")
+        if header["result"] == "value":
+            return header["value"]
+        if "paths" in header:
+            frames = [_read_ipc_file(p) for p in header["paths"]]
+        else:
+            frames = [table_to_frame(pa.ipc.open_stream(pa.py_buffer(raw)).read_all(), backing=raw) for raw in raws]
+        if header["result"] == "frame":
+            return frames[0]
+        return dict(zip(header["keys"], frames))
+
+    def ping(self) -> bool:
+        return self.call("ping") == "pong"
+
+
+def connect(remote: Union[Address, RemotePanels], *, transport: Transport = "ipc") -> RemotePanels:
+    return remote if isinstance(remote, RemotePanels) else RemotePanels(remote, transport=transport)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m qdl.server", description="Serve qdl panels to local clients.")
+    where = parser.add_mutually_exclusive_group(required=True)
+    where.add_argument("--socket", help="Unix socket path")
+    where.add_argument("--port", type=int, help="localhost TCP port")
+    parser.add_argument("--host", default="127.0.0.1", choices=_LOOPBACK_HOSTS)
+    parser.add_argument("--shm-dir", default=None, help="directory for the shared-memory transport")
+    parser.add_argument("--data-root", default=None, help="data directory (default: qdl.config / QDL_DATA_PATH)")
+    args = parser.parse_args(argv)
+
+    if args.data_root is not None:
+        _config.set_data_root(args.data_root)
+    address: Address = args.socket if args.socket else (args.host, args.port)
+    server = PanelServer(address, shm_dir=args.shm_dir)
+    print(f"qdl panel server listening on {server.address}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,276 @@
+"""
+qdl.synthetic
+
+Synthetic, JKP-shaped data for offline tests and scale benchmarks.
+
+`write_synthetic_data` writes, under a chosen data root,
+
+    <root>/chars/jkp_<vintage>_<country>.parquet
+    <root>/factors/[<country>]_[<dataset token>]_[monthly]_[<weighting>].csv
+    <root>/meta/
+
+following the observed schemas:
+- characteristics: `id`, `permno`, `eom`, `date`, `excntry`, `size_grp`,
+  `gics`, `market_equity`, `me`, `ret_exc` and one float column per
+  characteristic (sorted by `eom`, `id`); `permno` repeats `id` and `me`
+  repeats `market_equity`, as for CRSP stocks in the JKP files;
+- factors: long `date`, `name`, `ret`.
+
+The panel is an unbalanced set of stocks (staggered listing/delisting) whose
+characteristics follow AR(1) processes. Month-t excess returns load on the
+month t-1 characteristics with the signs in `qdl.construction.KNOWN_DIRECTIONS`,
+so constructed factors carry a premium. Size groups come from cross-sectional
+market-equity percentiles (1/20/50/80, standing in for NYSE breakpoints).
+
+Reference factor CSVs are built from the first requested vintage with
+`qdl.construction`, so `QDL.build_factor` on the generated characteristics
+reproduces them (up to duplicate rows, which the reference resolves with the
+first occurrence). Point the loaders at the root with
+`qdl.config.set_data_root(root)` (or `QDL_DATA_PATH`).
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from qdl import construction as _construction
+from qdl import transformer as _transformer
+
+
+DEFAULT_CHARS: Tuple[str, ...] = ("be_me", "ope_be", "at_gr1", "ret_12_1", "ret_1_0")
+
+# Cross-sectional market-equity percentiles separating nano/micro/small/large/mega
+SIZE_BREAKPOINTS: Tuple[float, ...] = (0.01, 0.20, 0.50, 0.80)
+SIZE_GROUPS: Tuple[str, ...] = ("nano", "micro", "small", "large", "mega")
+
+# Theme of each default factor; any other characteristic falls under "other"
+THEMES: Dict[str, str] = {
+    "market_equity": "size",
+    "be_me": "value",
+    "ope_be": "profitability",
+    "at_gr1": "investment",
+    "ret_12_1": "momentum",
+    "ret_1_0": "short_term_reversal",
+}
+
+_DATASET_TOKENS = {"factor": "all_factors", "theme": "all_themes", "mkt": "mkt"}
+_GICS_CODES = np.array([10101010, 15104020, 20201010, 25301040, 30202030, 35101010, 40101015, 45103010, 50101020, 55105010, 60101010])
+
+
+# Identifier, label and duplicate columns that get no reference factor
+_NON_CHAR_COLUMNS = ("id", "permno", "eom", "date", "excntry", "size_grp", "gics", "me", "ret_exc")
+
+
+def _size_groups(me: np.ndarray) -> np.ndarray:
+    """Size group per cell from per-row (month) market-equity percentiles."""
+    with np.errstate(invalid="ignore"):
+        cuts = np.nanquantile(me, SIZE_BREAKPOINTS, axis=1).T  # (months, 4)
+    codes = (me[:, :, None] >= cuts[:, None, :]).sum(axis=2)
+    groups = np.asarray(SIZE_GROUPS, dtype=object)[codes]
+    groups[np.isnan(me)] = None
+    return groups
+
+
+def generate_chars(
+    *,
+    n_stocks: int = 500,
+    n_months: int = 120,
+    start: str = "2000-01-31",
+    country: str = "usa",
+    chars: Sequence[str] = DEFAULT_CHARS,
+    n_extra_chars: int = 0,
+    missing_rate: float = 0.05,
+    duplicate_rate: float = 0.0,
+    seed: int = 0,
+) -> pd.DataFrame:
+    """
+    Simulate one long characteristics panel (one row per live stock-month).
+
+    Parameters
+    ----------
+    chars : sequence of str
+        Characteristic columns besides `market_equity`; `n_extra_chars` more are
+        added as `char_001`, `char_002`, ...
+    missing_rate : float
+        Share of characteristic and `ret_exc` cells set to NaN.
+    duplicate_rate : float
+        Share of rows duplicated on (`id`, `eom`) with perturbed values, placed
+        next to the original.
+    """
+    if n_stocks < 1 or n_months < 2:
+        raise ValueError("n_stocks must be >= 1 and n_months >= 2")
+    if not (0.0 <= missing_rate < 1.0 and 0.0 <= duplicate_rate < 1.0):
+        raise ValueError("missing_rate and duplicate_rate must be in [0, 1)")
+    rng = np.random.default_rng(seed)
+    chars = [c for c in dict.fromkeys(chars) if c != "market_equity"]
+    chars += [f"char_{i:03d}" for i in range(1, n_extra_chars + 1)]
+    eom = pd.date_range(pd.Timestamp(start) + pd.offsets.MonthEnd(0), periods=n_months, freq="ME")
+    T, N = n_months, n_stocks
+
+    # Staggered listing: each stock is live on one contiguous block of months
+    first = rng.integers(0, max(1, T // 3), size=N)
+    last = np.maximum(first + 1, rng.integers(2 * T // 3, T, size=N))
+    t = np.arange(T)[:, None]
+    live = (t >= first) & (t <= last)
+
+    # AR(1) characteristics (standardized)
+    x = np.empty((len(chars), T, N))
+    x[:, 0] = rng.normal(size=(len(chars), N))
+    shocks = rng.normal(size=(len(chars), T, N)) * np.sqrt(1 - 0.9**2)
+    for i in range(1, T):
+        x[:, i] = 0.9 * x[:, i - 1] + shocks[:, i]
+
+    # Returns load on last month's characteristics (and small size)
+    log_me0 = rng.normal(5.0, 1.8, size=N)
+    premia = np.array([0.003 * _construction.KNOWN_DIRECTIONS.get(c, 1) for c in chars])
+    mkt = rng.normal(0.006, 0.045, size=T)
+    beta = rng.normal(1.0, 0.3, size=N)
+    ret = 0.002 + beta * mkt[:, None] + rng.normal(0.0, 0.09, size=(T, N))
+    ret[1:] += np.tensordot(premia, x[:, :-1], axes=1)
+    ret[1:] -= 0.001 * (log_me0 - 5.0)
+    ret = np.clip(ret, -0.95, None)
+    me = np.exp(log_me0) * np.cumprod(1.0 + ret, axis=0)
+
+    me = np.where(live, me, np.nan)
+    size_grp = _size_groups(me)
+    rows, cols = np.nonzero(live)  # row-major: sorted by (eom, id)
+    n = len(rows)
+    df = pd.DataFrame(
+        {
+            "id": (cols + 1).astype(np.int64),
+            "permno": (cols + 1).astype(np.int64),
+            "eom": eom[rows],
+            "date": eom[rows] - pd.to_timedelta(rng.integers(0, 3, size=n), unit="D"),
+            "excntry": country.upper(),
+            "size_grp": size_grp[rows, cols],
+            "gics": _GICS_CODES[cols % len(_GICS_CODES)],
+            "market_equity": me[rows, cols],
+            "me": me[rows, cols],
+            "ret_exc": ret[rows, cols],
+        }
+    )
+    for k, c in enumerate(chars):
+        df[c] = x[k][rows, cols]
+
+    if missing_rate > 0:
+        for c in ["ret_exc", *chars]:
+            df.loc[rng.random(n) < missing_rate, c] = np.nan
+
+    if duplicate_rate > 0:
+        dup = df.loc[rng.random(n) < duplicate_rate].copy()
+        noise = rng.normal(0.0, 0.1, size=(len(dup), len(chars)))
+        dup[chars] = dup[chars].to_numpy() + noise
+        df = pd.concat([df, dup]).sort_index(kind="stable").reset_index(drop=True)
+    return df
+
+
+def _factor_returns(df: pd.DataFrame, chars: Sequence[str], weighting: str) -> Dict[str, pd.Series]:
+    """Reference factor returns per characteristic, plus the market, from a long chars frame."""
+    names = ["ret_exc", "market_equity", "size_grp", *[c for c in chars if c != "market_equity"]]
+    wide = _transformer.to_wide_many(df, index_col="eom", column_col="id", value_cols=names, agg="first")
+    panels = _construction.prepare_sort_panels(
+        ret_exc=wide["ret_exc"],
+        market_equity=wide["market_equity"],
+        size_grp=wide["size_grp"],
+        weightings=(weighting,),
+    )
+    out: Dict[str, pd.Series] = {}
+    for c in ["market_equity", *[c for c in chars if c != "market_equity"]]:
+        returns = _construction.factor_returns_from_panels(
+            wide[c].to_numpy(dtype=np.float64, na_value=np.nan),
+            panels,
+            direction=_construction.resolve_direction(c),
+            weightings=(weighting,),
+        )
+        out[c] = pd.Series(returns[weighting], index=panels.index)
+
+    weights = panels.weights[weighting] if weighting != "ew" else np.ones_like(panels.ret)
+    use = panels.universe & ~np.isnan(panels.ret) & ~np.isnan(weights) & (weights > 0)
+    w = np.where(use, weights, 0.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        market = np.where(use, w * panels.ret, 0.0).sum(axis=1) / w.sum(axis=1)
+    out["market"] = pd.Series(market, index=panels.index)
+    return out
+
+
+def _long_factors(series: Dict[str, pd.Series]) -> pd.DataFrame:
+    frames = [
+        pd.DataFrame({"date": s.index.strftime("%Y-%m-%d"), "name": name, "ret": s.to_numpy()})
+        for name, s in series.items()
+    ]
+    return pd.concat(frames, ignore_index=True).dropna(subset=["ret"]).sort_values(["date", "name"], kind="stable")
+
+
+def write_synthetic_data(
+    root: Union[str, Path],
+    *,
+    countries: Sequence[str] = ("usa",),
+    vintages: Sequence[str] = ("2020-",),
+    datasets: Sequence[str] = ("factor", "theme", "mkt"),
+    weightings: Sequence[str] = _construction.WEIGHTINGS,
+    n_stocks: int = 500,
+    n_months: int = 120,
+    chars: Sequence[str] = DEFAULT_CHARS,
+    n_extra_chars: int = 0,
+    missing_rate: float = 0.05,
+    duplicate_rate: float = 0.0,
+    row_group_size: Optional[int] = None,
+    seed: int = 0,
+) -> List[Path]:
+    """
+    Write a synthetic data root (chars Parquet + factor CSVs) and return the written files.
+
+    Each vintage starts in January of its first year (e.g. "2020-" → 2020-01-31)
+    and spans `n_months`. `row_group_size` (rows) controls Parquet row groups;
+    None uses roughly one row group per 12 months. Existing files are overwritten.
+    """
+    root = Path(root)
+    unknown = [d for d in datasets if d not in _DATASET_TOKENS]
+    if unknown:
+        raise ValueError(f"Unknown datasets: {unknown}")
+    for sub in ("chars", "factors", "meta"):
+        (root / sub).mkdir(parents=True, exist_ok=True)
+
+    written: List[Path] = []
+    for ci, country in enumerate(countries):
+        reference: Optional[pd.DataFrame] = None
+        for vi, vintage in enumerate(vintages):
+            df = generate_chars(
+                n_stocks=n_stocks,
+                n_months=n_months,
+                start=f"{vintage[:4]}-01-31",
+                country=country,
+                chars=chars,
+                n_extra_chars=n_extra_chars,
+                missing_rate=missing_rate,
+                duplicate_rate=duplicate_rate,
+                seed=seed + 1000 * ci + vi,
+            )
+            path = root / "chars" / f"jkp_{vintage}_{country}.parquet"
+            rg_rows = row_group_size or max(1, len(df) * 12 // n_months)
+            df.to_parquet(path, index=False, row_group_size=rg_rows)
+            written.append(path)
+            if reference is None:
+                reference = df
+
+        char_names = [c for c in reference.columns if c not in _NON_CHAR_COLUMNS]
+        for weighting in weightings:
+            returns = _factor_returns(reference, char_names, weighting)
+            market = returns.pop("market")
+            by_dataset = {
+                "factor": returns,
+                "mkt": {"market": market},
+                "theme": {
+                    theme: pd.concat([returns[c] for c in returns if THEMES.get(c, "other") == theme], axis=1).mean(axis=1)
+                    for theme in dict.fromkeys(THEMES.get(c, "other") for c in returns)
+                },
+            }
+            for dataset in datasets:
+                path = root / "factors" / f"[{country}]_[{_DATASET_TOKENS[dataset]}]_[monthly]_[{weighting}].csv"
+                _long_factors(by_dataset[dataset]).to_csv(path, index=False)
+                written.append(path)
+    return written
@@ -7,15 +7,24 @@ This module provides a generic wide pivot function and a
 factors-specific convenience wrapper that defaults to the
 observed factor file schema (`date`, `name`, `ret`).
 
+`to_wide` and `to_wide_many` pivot numeric values by factorizing the
+(index, column) keys once and scattering values into a preallocated array;
+`to_wide_many` shares those keys across several value columns so all outputs
+have identical axes. Other inputs go through pandas.pivot_table.
+
 Note: No schema coercion beyond minimal checks and time parsing.
 """
 
 from __future__ import annotations
 
-from typing import Iterable, Literal
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Literal, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
+from qdl import profiling as _profiling
+
 
 AggKind = Literal["first", "mean", "sum"]
 
@@ -26,24 +35,146 @@ def _ensure_columns_exist(df: pd.DataFrame, required: Iterable[str]) -> None:
         raise KeyError(f"Missing required columns: {missing}")
 
 
-def to_wide(
+def _factorize_axis(values: pd.Series) -> Optional[Tuple[np.ndarray, pd.Index]]:
+    """Sorted factorization of a key column; None when keys are missing or unorderable."""
+    if values.isna().any():
+        return None
+    try:
+        codes, uniques = pd.factorize(values, sort=True)
+    except TypeError:
+        return None
+    return codes, uniques
+
+
+@dataclass
+class _PivotKeys:
+    """Factorized (row, column) keys shared by every value column of a pivot."""
+
+    row_labels: pd.Index
+    col_labels: pd.Index
+    flat: np.ndarray  # row_code * n_cols + col_code, one entry per input row
+    unique: bool
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return (len(self.row_labels), len(self.col_labels))
+
+
+def _pivot_keys(df: pd.DataFrame, *, index_col: str, column_col: str) -> Optional[_PivotKeys]:
+    if df.empty:
+        return None
+    rows = _factorize_axis(df[index_col])
+    if rows is None:
+        return None
+    cols = _factorize_axis(df[column_col])
+    if cols is None:
+        return None
+    row_codes, row_labels = rows
+    col_codes, col_labels = cols
+    if isinstance(row_labels.dtype, pd.CategoricalDtype):
+        # pivot_table keeps a categorical row index with its own category bookkeeping
+        return None
+    if isinstance(col_labels.dtype, pd.CategoricalDtype):
+        # pivot_table's sorted reindex leaves plain labels (e.g. ids under DtypePolicy(id_dtype="category"))
+        col_labels = pd.Index(np.asarray(col_labels))
+    n_cells = len(row_labels) * len(col_labels)
+    flat = row_codes.astype(np.int64) * len(col_labels) + col_codes
+    # One vectorized pass over flat cell ids detects duplicated keys.
+    seen = np.zeros(n_cells, dtype=bool)
+    seen[flat] = True
+    unique = int(seen.sum()) == len(flat)
+    return _PivotKeys(row_labels=row_labels, col_labels=col_labels, flat=flat, unique=unique)
+
+
+def _supports_fast_pivot(dtype: object, agg: AggKind) -> bool:
+    if not isinstance(dtype, np.dtype) or dtype.kind not in "fiu":
+        return False
+    # Integer means may be downcast by some pandas versions; leave to pivot_table.
+    return not (agg == "mean" and dtype.kind != "f")
+
+
+def _reduce_scatter(values: pd.Series, keys: _PivotKeys, agg: AggKind) -> Optional[np.ndarray]:
+    """
+    Reduce `values` per cell with `agg` and place them into a preallocated
+    (rows, cols) array, reproducing pivot_table(aggfunc=agg, dropna=False) dtypes:
+    reduced dtypes are kept when every cell is filled, integers become float64
+    when cells are missing. Returns None for dtypes the fast path does not cover.
+    """
+    dtype = values.dtype
+    if not _supports_fast_pivot(dtype, agg):
+        return None
+
+    if keys.unique:
+        cells = keys.flat
+        reduced = values.to_numpy()
+        if agg == "sum" and dtype.kind == "f":
+            # pivot_table sums a lone NaN to 0 (min_count=0)
+            reduced = np.where(np.isnan(reduced), 0, reduced).astype(dtype, copy=False)
+    else:
+        grouped = pd.Series(values.to_numpy(), copy=False).groupby(keys.flat, sort=False).agg(agg)
+        cells = grouped.index.to_numpy()
+        reduced = grouped.to_numpy()
+
+    n_rows, n_cols = keys.shape
+    if len(cells) == n_rows * n_cols:
+        out = np.empty((n_rows, n_cols), dtype=reduced.dtype)
+    else:
+        fill_dtype = reduced.dtype if reduced.dtype.kind == "f" else np.float64
+        out = np.full((n_rows, n_cols), np.nan, dtype=fill_dtype)
+    out.reshape(-1)[cells] = reduced
+    return out
+
+
+def _frame_from_array(arr: np.ndarray, keys: _PivotKeys, *, index_col: str) -> pd.DataFrame:
+    return pd.DataFrame(
+        arr,
+        index=pd.Index(keys.row_labels, name=index_col),
+        columns=pd.Index(keys.col_labels),
+    )
+
+
+def to_wide_many(
     df: pd.DataFrame,
     *,
-    index_cols: list[str],
+    index_col: str,
     column_col: str,
-    value_col: str,
+    value_cols: List[str],
     agg: AggKind = "first",
-    sort_index: bool = True,
-    sort_columns: bool = True,
-) -> pd.DataFrame:
+) -> Dict[str, pd.DataFrame]:
     """
-    Convert long data to wide by pivoting `column_col` to columns and
-    `index_cols` to the row index, filling values from `value_col`.
+    Pivot several `value_cols` to wide frames sharing one (index, columns) grid.
 
-    When duplicates exist for the same key tuple, aggregate using `agg`.
+    Keys are factorized once; each value column is reduced and scattered into a
+    preallocated array. Results equal `to_wide(df, index_cols=[index_col], ...)`
+    per column, with sorted index and columns.
     """
-    _ensure_columns_exist(df, [*index_cols, column_col, value_col])
+    _ensure_columns_exist(df, [index_col, column_col, *value_cols])
+
+    with _profiling.stage("pivot", detail={"input_rows": len(df), "values": len(value_cols)}) as st:
+        keys = _pivot_keys(df, index_col=index_col, column_col=column_col)
+        result: Dict[str, pd.DataFrame] = {}
+        for value_col in value_cols:
+            arr = _reduce_scatter(df[value_col], keys, agg) if keys is not None else None
+            if arr is None:
+                result[value_col] = _pivot_table_wide(
+                    df, index_cols=[index_col], column_col=column_col, value_col=value_col, agg=agg
+                )
+            else:
+                result[value_col] = _frame_from_array(arr, keys, index_col=index_col)
+        st.output(result)
+    return result
 
+
+def _pivot_table_wide(
+    df: pd.DataFrame,
+    *,
+    index_cols: list[str],
+    column_col: str,
+    value_col: str,
+    agg: AggKind,
+    sort_index: bool = True,
+    sort_columns: bool = True,
+) -> pd.DataFrame:
     # Use pivot_table to handle potential duplicates deterministically.
     aggfunc = {"first": "first", "mean": "mean", "sum": "sum"}[agg]
     wide = pd.pivot_table(
@@ -66,6 +197,53 @@ def to_wide(
     return wide
 
 
+def to_wide(
+    df: pd.DataFrame,
+    *,
+    index_cols: list[str],
+    column_col: str,
+    value_col: str,
+    agg: AggKind = "first",
+    sort_index: bool = True,
+    sort_columns: bool = True,
+) -> pd.DataFrame:
+    """
+    Convert long data to wide by pivoting `column_col` to columns and
+    `index_cols` to the row index, filling values from `value_col`.
+
+    When duplicates exist for the same key tuple, aggregate using `agg`.
+
+    For a single index column with numeric values, keys are factorized and the
+    values scattered into a preallocated array (grouped reduction runs only when
+    duplicated keys exist). Other inputs (multiple index columns, missing or
+    unorderable keys, non-numeric values) use pivot_table. Both paths return
+    the same frame.
+    """
+    _ensure_columns_exist(df, [*index_cols, column_col, value_col])
+
+    with _profiling.stage("pivot", detail={"input_rows": len(df)}) as st:
+        wide: Optional[pd.DataFrame] = None
+        if len(index_cols) == 1 and _supports_fast_pivot(df[value_col].dtype, agg):
+            keys = _pivot_keys(df, index_col=index_cols[0], column_col=column_col)
+            arr = _reduce_scatter(df[value_col], keys, agg) if keys is not None else None
+            if arr is not None:
+                # Factorized labels are already sorted on both axes.
+                wide = _frame_from_array(arr, keys, index_col=index_cols[0])
+
+        if wide is None:
+            wide = _pivot_table_wide(
+                df,
+                index_cols=index_cols,
+                column_col=column_col,
+                value_col=value_col,
+                agg=agg,
+                sort_index=sort_index,
+                sort_columns=sort_columns,
+            )
+        st.output(wide)
+    return wide
+
+
 def to_wide_factors(
     df: pd.DataFrame,
     *,
@@ -9,32 +9,39 @@ Design principles (per PRD v0.2):
   numeric value column name (`value_col`).
 - No silent defaults. Raise clear errors when alignment fails or types are
   incompatible.
-- Keep the core independent of I/O. Plotting is optional and returns a
-  Matplotlib Figure without side effects.
+- Keep the core independent of I/O. Plotting is optional and lazy; the
+  Matplotlib Figure is registered with pyplot only when pyplot is in use.
 """
 
 from __future__ import annotations
 
+import sys
+import threading
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Mapping, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
 
-try:  # Optional: used only for typing the figure return
+from qdl import profiling as _profiling
+
+if TYPE_CHECKING:  # Matplotlib is optional and only imported when a figure is rendered
+    from concurrent.futures import Future
+
     from matplotlib.figure import Figure
-    import matplotlib.pyplot as plt
-except Exception:  # pragma: no cover - plotting is optional
-    Figure = Any  # type: ignore
-    plt = None  # type: ignore
+
+# Points per plotted cumsum line; longer series are evenly downsampled
+DEFAULT_MAX_PLOT_POINTS = 2000
 
 
 @dataclass
 class ValidationReport:
     """Result of a factor validation run.
 
-    Fields are intentionally simple and serializable, except for `figure` which
-    is optional and may be a Matplotlib Figure when plotting is requested.
+    Fields are intentionally simple and serializable, except for `plot` which
+    is an optional LazyFigure when plotting is requested. The Matplotlib figure
+    is drawn only when `figure` (or `plot.figure`) is first accessed.
     """
 
     mse: float
@@ -48,10 +55,18 @@ class ValidationReport:
     pass_thresholds: Optional[bool]
     thresholds: Optional[Dict[str, float]]
     diagnostics: Dict[str, Any]
-    figure: Optional[Figure] = None
+    plot: Optional["LazyFigure"] = None
     # Per-factor breakdown (keyed by factor identifier, typically 'name')
     per_factor_metrics: Dict[str, Dict[str, Optional[float]]] | None = None
     per_factor_n_obs: Dict[str, int] | None = None
+    # Windowed per-factor metrics ({metric: date × factor frame}); see rolling_metrics
+    rolling: Dict[str, pd.DataFrame] | None = None
+    expanding: Dict[str, pd.DataFrame] | None = None
+
+    @property
+    def figure(self) -> Optional[Figure]:
+        """Cumsum figure, rendered on first access; None without plot or Matplotlib."""
+        return self.plot.figure if self.plot is not None else None
 
 
 def _ensure_required_columns(df: pd.DataFrame, required: List[str], *, frame_name: str) -> None:
@@ -78,31 +93,74 @@ def _pick_time_key(on: List[str], merged: pd.DataFrame) -> Optional[str]:
     return None
 
 
-def _compute_metrics(aligned: pd.DataFrame) -> Tuple[float, float, float, Optional[float], Optional[float]]:
-    # Differences in percentage points for scale-aware error metrics
-    diff_pp = 100.0 * (aligned["user_value"] - aligned["ref_value"])  # percentage point differences
-    mse = float(np.mean(np.square(diff_pp)))
-    rmse = float(np.sqrt(mse))
-    mae = float(np.mean(np.abs(diff_pp)))
+def _average_ranks(values: np.ndarray, groups: np.ndarray) -> np.ndarray:
+    """Average ranks (1-based, ties averaged) of `values` within each label of `groups`.
 
-    # Pearson correlation (guard against constant series)
-    if aligned["user_value"].nunique(dropna=True) > 1 and aligned["ref_value"].nunique(dropna=True) > 1:
-        corr = float(aligned["user_value"].corr(aligned["ref_value"], method="pearson"))
-    else:
-        corr = None
-
-    # Information Coefficient (rank correlation). Use rank+pearson to avoid scipy dependency.
-    if aligned["user_value"].notna().any() and aligned["ref_value"].notna().any():
-        user_rank = aligned["user_value"].rank(method="average")
-        ref_rank = aligned["ref_value"].rank(method="average")
-        if user_rank.nunique(dropna=True) > 1 and ref_rank.nunique(dropna=True) > 1:
-            ic = float(user_rank.corr(ref_rank, method="pearson"))
-        else:
-            ic = None
-    else:
-        ic = None
+    Matches `Series.rank(method="average")` applied separately to every group.
+    """
+    n = values.size
+    ranks = np.empty(n, dtype=np.float64)
+    if n == 0:
+        return ranks
+    order = np.lexsort((values, groups))
+    v, g = values[order], groups[order]
+    pos = np.arange(n)
+    new_group = np.r_[True, g[1:] != g[:-1]]
+    new_run = new_group | np.r_[True, v[1:] != v[:-1]]
+    run_start = np.flatnonzero(new_run)
+    run_end = np.r_[run_start[1:], n] - 1
+    run_id = np.cumsum(new_run) - 1
+    group_start = np.maximum.accumulate(np.where(new_group, pos, 0))
+    ranks[order] = (run_start[run_id] + run_end[run_id]) / 2.0 - group_start + 1.0
+    return ranks
+
+
+def _pearson_columns(x: np.ndarray, y: np.ndarray, valid: np.ndarray, n: np.ndarray) -> np.ndarray:
+    """Column-wise Pearson correlation over `valid` cells (NaN where undefined)."""
+    safe_n = np.maximum(n, 1)
+    dx = np.where(valid, x - np.where(valid, x, 0.0).sum(axis=0) / safe_n, 0.0)
+    dy = np.where(valid, y - np.where(valid, y, 0.0).sum(axis=0) / safe_n, 0.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        corr = (dx * dy).sum(axis=0) / np.sqrt((dx * dx).sum(axis=0) * (dy * dy).sum(axis=0))
+    # Same clipping as pandas' nancorr
+    return np.clip(corr, -1.0, 1.0)
+
+
+def _column_metrics(user: np.ndarray, ref: np.ndarray, valid: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    NaN-masked MSE/RMSE/MAE/corr/IC for every column of aligned 2-D arrays.
+
+    Errors are in percentage points. corr/IC are NaN when either side is
+    constant (or empty) over the column's valid cells.
+    """
+    n = valid.sum(axis=0)
+    safe_n = np.maximum(n, 1)
+    diff_pp = np.where(valid, 100.0 * (user - ref), 0.0)
+    mse = (diff_pp * diff_pp).sum(axis=0) / safe_n
+    mae = np.abs(diff_pp).sum(axis=0) / safe_n
+
+    # A column is non-constant iff its max and min over valid cells differ
+    def _varies(a: np.ndarray) -> np.ndarray:
+        hi = np.where(valid, a, -np.inf).max(axis=0, initial=-np.inf)
+        lo = np.where(valid, a, np.inf).min(axis=0, initial=np.inf)
+        return hi > lo
+
+    defined = _varies(user) & _varies(ref)
+    corr = np.where(defined, _pearson_columns(user, ref, valid, n), np.nan)
+
+    rows, cols = np.nonzero(valid)
+    user_rank = np.zeros_like(user, dtype=np.float64)
+    ref_rank = np.zeros_like(ref, dtype=np.float64)
+    user_rank[rows, cols] = _average_ranks(user[rows, cols], cols)
+    ref_rank[rows, cols] = _average_ranks(ref[rows, cols], cols)
+    # Ranks vary exactly when the values do
+    ic = np.where(defined, _pearson_columns(user_rank, ref_rank, valid, n), np.nan)
+
+    return {"n": n, "mse": mse, "rmse": np.sqrt(mse), "mae": mae, "corr": corr, "ic": ic}
 
-    return mse, rmse, mae, corr, ic
+
+def _optional(value: float) -> Optional[float]:
+    return None if np.isnan(value) else float(value)
 
 
 def _evaluate_thresholds(
@@ -141,166 +199,226 @@ def _evaluate_thresholds(
     return all(ok for _, ok in rules)
 
 
-def _maybe_plot_cumsum(
-    aligned: pd.DataFrame,
-    *,
-    time_key: Optional[str],
-    on: List[str],
-    title: str,
-    max_plot_factors: int,
-) -> Optional[Figure]:
-    """Plot cumulative sum returns.
-
-    - If a factor key ("name") is in `on`, plot per-factor subplots (up to `max_plot_factors`).
-    - Otherwise, plot a single overlay of cumsum(user) vs cumsum(reference).
-    """
-    if plt is None:
-        return None
+def _first_valid_order(valid: np.ndarray) -> np.ndarray:
+    """Columns with any valid cell, ordered by first valid row (row-major, as in a long-form groupby)."""
+    present = np.flatnonzero(valid.any(axis=0))
+    first_row = valid.argmax(axis=0)[present]
+    return present[np.lexsort((present, first_row))]
+
+
+def _downsample(n: int, max_points: int) -> np.ndarray:
+    """Evenly spaced positions in range(n), at most `max_points`, always keeping both ends."""
+    if n <= max_points:
+        return np.arange(n)
+    return np.unique(np.linspace(0, n - 1, max(2, max_points)).round().astype(np.int64))
+
+
+def _register_with_pyplot(fig: Figure) -> bool:
+    """Hand `fig` to pyplot's figure manager when pyplot is in use (main thread only)."""
+    pyplot = sys.modules.get("matplotlib.pyplot")
+    if pyplot is None or threading.current_thread() is not threading.main_thread():
+        return False
+    try:
+        pyplot.figure(fig)
+    except (TypeError, ValueError):  # Matplotlib without support for adopting figures
+        return False
+    return True
 
-    has_factor_dim = "name" in on and "name" in aligned.columns
-    x_series = (
-        aligned[time_key]
-        if (time_key is not None and time_key in aligned.columns)
-        else aligned.index
-    )
 
-    if not has_factor_dim:
-        fig, ax = plt.subplots(1, 1, figsize=(10, 4))
-        ax.plot(x_series, aligned["ref_value"].cumsum(), label="reference (cumsum)", color="#1f77b4")
-        ax.plot(x_series, aligned["user_value"].cumsum(), label="user (cumsum)", color="#ff7f0e", alpha=0.85)
-        ax.set_title(title)
-        ax.set_ylabel("cumsum return")
-        ax.grid(True, alpha=0.3)
-        ax.legend(loc="best")
-        if time_key is not None:
-            ax.set_xlabel(time_key)
-        else:
-            ax.set_xlabel("index")
-        fig.tight_layout()
+class LazyFigure:
+    """
+    Deferred per-factor cumsum plot (user vs reference) of aligned wide arrays.
+
+    Nothing is drawn until `figure` is first accessed. Rendering uses the
+    object-oriented Matplotlib API on an Agg canvas (no pyplot, no GUI
+    backend), so it is safe to call from worker threads. When pyplot is
+    already imported, `figure` (accessed from the main thread) also registers
+    the figure with pyplot, so `plt.show()` and inline notebook backends
+    display it; `savefig`/`to_png` never do. Cumulative sums are taken over
+    the full series and then downsampled to at most `max_points` points per
+    line.
+    """
+
+    def __init__(
+        self,
+        *,
+        index: pd.Index,
+        columns: pd.Index,
+        user: np.ndarray,
+        ref: np.ndarray,
+        valid: np.ndarray,
+        title: str,
+        max_plot_factors: int = 8,
+        max_points: int = DEFAULT_MAX_PLOT_POINTS,
+    ) -> None:
+        self.index = index
+        self.columns = columns
+        self.user = user
+        self.ref = ref
+        self.valid = valid
+        self.title = title
+        self.max_plot_factors = max_plot_factors
+        self.max_points = max_points
+        self._figure: Optional[Figure] = None
+        self._rendered = False
+        self._registered = False
+        self._lock = threading.Lock()
+        # Rendering is attributed to the (profiled) call that created the plot
+        self._profile_context = _profiling.current()
+
+    @property
+    def rendered(self) -> bool:
+        return self._rendered
+
+    @property
+    def figure(self) -> Optional[Figure]:
+        """The Matplotlib Figure (rendered once); None when Matplotlib is unavailable."""
+        fig = self._ensure_rendered()
+        with self._lock:
+            if fig is not None and not self._registered and _register_with_pyplot(fig):
+                self._registered = True
         return fig
 
-    # Per-factor: build subplots
-    factors = list(dict.fromkeys(aligned["name"].dropna().astype(str)))
-    if not factors:
-        return None
-    factors = factors[: max(1, max_plot_factors)]
-
-    n = len(factors)
-    ncols = min(3, n)
-    nrows = (n + ncols - 1) // ncols
-    fig, axes = plt.subplots(nrows, ncols, figsize=(5 * ncols, 3.2 * nrows), sharex=True)
-    axes = axes if isinstance(axes, np.ndarray) else np.array([axes])
-    axes = axes.reshape(nrows, ncols)
-
-    for idx, factor in enumerate(factors):
-        r = idx // ncols
-        c = idx % ncols
-        ax = axes[r, c]
-        sub = aligned[aligned["name"].astype(str) == factor]
-        x = sub[time_key] if (time_key is not None and time_key in sub.columns) else sub.index
-        ax.plot(x, sub["ref_value"].cumsum(), label="ref", color="#1f77b4")
-        ax.plot(x, sub["user_value"].cumsum(), label="user", color="#ff7f0e", alpha=0.85)
-        ax.set_title(str(factor))
-        ax.grid(True, alpha=0.3)
-        if r == nrows - 1:
-            ax.set_xlabel(time_key or "index")
-        ax.set_ylabel("cumsum")
-
-    # Hide any unused axes
-    for j in range(n, nrows * ncols):
-        r = j // ncols
-        c = j % ncols
-        fig.delaxes(axes[r, c])
-
-    # Add a global title and legend
-    fig.suptitle(title, y=0.98)
-    handles, labels = axes[0, 0].get_legend_handles_labels()
-    if handles:
-        fig.legend(handles, labels, loc="upper right")
-    fig.tight_layout(rect=[0, 0, 1, 0.96])
-    return fig
+    def _ensure_rendered(self) -> Optional[Figure]:
+        with self._lock:
+            if not self._rendered:
+                with _profiling.stage("plot", context=self._profile_context, columns=len(self.columns)):
+                    self._figure = self._render()
+                self._rendered = True
+        return self._figure
+
+    def savefig(self, fname: Any, **kwargs: Any) -> None:
+        """Render if needed and save via `Figure.savefig`."""
+        fig = self._ensure_rendered()
+        if fig is None:
+            raise RuntimeError("Plotting requires matplotlib")
+        fig.savefig(fname, **kwargs)
+
+    def to_png(self, *, dpi: int = 100) -> bytes:
+        """Render if needed and return PNG bytes."""
+        import io
+
+        buf = io.BytesIO()
+        self.savefig(buf, format="png", dpi=dpi)
+        return buf.getvalue()
+
+    def _render(self) -> Optional[Figure]:
+        try:
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
+        except Exception:  # pragma: no cover - plotting is optional
+            return None
+
+        factors = _first_valid_order(self.valid)[: max(1, self.max_plot_factors)]
+        if len(factors) == 0:
+            return None
+        is_datetime = pd.api.types.is_datetime64_any_dtype(self.index)
+        x_label = (self.index.name or "date") if is_datetime else "index"
+
+        n = len(factors)
+        ncols = min(3, n)
+        nrows = (n + ncols - 1) // ncols
+        fig = Figure(figsize=(5 * ncols, 3.2 * nrows))
+        FigureCanvasAgg(fig)
+        axes = fig.subplots(nrows, ncols, sharex=True, squeeze=False)
+
+        for k, j in enumerate(factors):
+            ax = axes[k // ncols, k % ncols]
+            rows = np.flatnonzero(self.valid[:, j])
+            keep = _downsample(len(rows), self.max_points)
+            x = self.index[rows[keep]] if is_datetime else rows[keep]
+            ax.plot(x, np.cumsum(self.ref[rows, j])[keep], label="ref", color="#1f77b4")
+            ax.plot(x, np.cumsum(self.user[rows, j])[keep], label="user", color="#ff7f0e", alpha=0.85)
+            ax.set_title(str(self.columns[j]))
+            ax.grid(True, alpha=0.3)
+            if k // ncols == nrows - 1:
+                ax.set_xlabel(x_label)
+            ax.set_ylabel("cumsum")
+
+        # Hide any unused axes
+        for k in range(n, nrows * ncols):
+            fig.delaxes(axes[k // ncols, k % ncols])
+
+        fig.suptitle(self.title, y=0.98)
+        handles, labels = axes[0, 0].get_legend_handles_labels()
+        if handles:
+            fig.legend(handles, labels, loc="upper right")
+        fig.tight_layout(rect=[0, 0, 1, 0.96])
+        return fig
 
 
-def validate_factor(
+def render_pngs(
+    reports: Mapping[str, ValidationReport],
     *,
-    user: pd.DataFrame,
-    reference: pd.DataFrame,
-    thresholds: Optional[Dict[str, float]] = None,
-    return_plot: bool = True,
-    plot_title: Optional[str] = None,
-    sort_by_time: bool = True,
-    max_plot_factors: int = 8,
-) -> ValidationReport:
-    """Validate wide-form factor data (date index, factor names as columns)."""
-    if user.empty or reference.empty:
-        raise ValueError("user/reference must be non-empty wide DataFrames")
+    directory: Optional[Union[str, Path]] = None,
+    dpi: int = 100,
+    max_workers: Optional[int] = None,
+) -> Dict[str, "Future[Union[bytes, Path]]"]:
+    """
+    Render the figures of many reports to PNG in a background thread pool.
 
-    # Align by intersection of index (dates) and columns (factor names)
-    common_idx = user.index.intersection(reference.index)
-    common_cols = user.columns.intersection(reference.columns)
-    if len(common_idx) == 0 or len(common_cols) == 0:
-        raise ValueError("No overlap between user and reference on index and/or columns")
+    Returns immediately with one Future per report that has a plot. Each
+    future resolves to the PNG bytes, or to the written `<directory>/<name>.png`
+    path when `directory` is given.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    out_dir = Path(directory) if directory is not None else None
+    if out_dir is not None:
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+    def _render(plot: LazyFigure, name: str) -> Union[bytes, Path]:
+        png = plot.to_png(dpi=dpi)
+        if out_dir is None:
+            return png
+        path = out_dir / f"{name}.png"
+        path.write_bytes(png)
+        return path
+
+    pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="qdl-plot")
+    try:
+        return {
+            str(name): pool.submit(_render, report.plot, str(name))
+            for name, report in reports.items()
+            if report.plot is not None
+        }
+    finally:
+        # Workers finish the submitted renders; the pool is not reused
+        pool.shutdown(wait=False)
 
-    user_aligned = user.loc[common_idx, common_cols]
-    ref_aligned = reference.loc[common_idx, common_cols]
-
-    # Optionally sort by time if index is datetime-like
-    if sort_by_time and pd.api.types.is_datetime64_any_dtype(user_aligned.index):
-        user_aligned = user_aligned.sort_index()
-        ref_aligned = ref_aligned.reindex(user_aligned.index)
-
-    # Build a long aligned frame for metric computation and plotting reuse
-    user_long = user_aligned.stack().rename("user_value").reset_index()
-    ref_long = ref_aligned.stack().rename("ref_value").reset_index()
-    idx_name = user_aligned.index.name or "date"
-    user_long.columns = [idx_name, "name", "user_value"]
-    ref_long.columns = [idx_name, "name", "ref_value"]
-    aligned = pd.merge(user_long, ref_long, on=[idx_name, "name"], how="inner")
-    pre_drop = len(aligned)
-    aligned = aligned.dropna(subset=["user_value", "ref_value"]).copy()
-    if aligned.empty:
-        raise ValueError("After dropping NA values, no overlapping observations remain for comparison")
 
-    mse, rmse, mae, corr, ic = _compute_metrics(aligned)
+def _report_from_arrays(
+    *,
+    index: pd.Index,
+    columns: pd.Index,
+    valid: np.ndarray,
+    overall: Dict[str, float],
+    per_col: Dict[str, np.ndarray],
+    diagnostics: Dict[str, Any],
+    thresholds: Optional[Dict[str, float]],
+    plot: Optional[LazyFigure],
+) -> ValidationReport:
+    """Assemble a ValidationReport from global and column-wise metrics on (index × columns)."""
+    mse, rmse, mae = (float(overall[k]) for k in ("mse", "rmse", "mae"))
+    corr, ic = _optional(overall["corr"]), _optional(overall["ic"])
 
-    # Per-factor metrics
     per_factor_metrics: Dict[str, Dict[str, Optional[float]]] = {}
     per_factor_n_obs: Dict[str, int] = {}
-    for factor_name, sub in aligned.groupby("name", sort=False):
-        fmse, frmse, fmae, fcorr, fic = _compute_metrics(sub)
-        key = str(factor_name)
+    for j in _first_valid_order(valid):
+        key = str(columns[j])
         per_factor_metrics[key] = {
-            "mse": fmse,
-            "rmse": frmse,
-            "mae": fmae,
-            "corr": fcorr,
-            "ic": fic,
+            "mse": float(per_col["mse"][j]),
+            "rmse": float(per_col["rmse"][j]),
+            "mae": float(per_col["mae"][j]),
+            "corr": _optional(per_col["corr"][j]),
+            "ic": _optional(per_col["ic"][j]),
         }
-        per_factor_n_obs[key] = int(len(sub))
-
-    diagnostics: Dict[str, Any] = {
-        "user_rows": int(user_aligned.size),
-        "reference_rows": int(ref_aligned.size),
-        "aligned_rows_before_dropna": int(pre_drop),
-        "aligned_rows": int(len(aligned)),
-        "num_factors": int(len(common_cols)),
-    }
-
-    figure: Optional[Figure] = None
-    if return_plot:
-        time_key = idx_name if idx_name in aligned.columns and pd.api.types.is_datetime64_any_dtype(aligned[idx_name]) else None
-        title = plot_title or "Factor validation (cumsum): user vs reference"
-        figure = _maybe_plot_cumsum(
-            aligned,
-            time_key=time_key,
-            on=[idx_name, "name"],
-            title=title,
-            max_plot_factors=max_plot_factors,
-        )
+        per_factor_n_obs[key] = int(per_col["n"][j])
 
-    if idx_name in aligned.columns and pd.api.types.is_datetime64_any_dtype(aligned[idx_name]):
-        date_start = pd.to_datetime(aligned[idx_name]).min()
-        date_end = pd.to_datetime(aligned[idx_name]).max()
+    if pd.api.types.is_datetime64_any_dtype(index):
+        valid_dates = index[valid.any(axis=1)]
+        date_start = valid_dates.min()
+        date_end = valid_dates.max()
     else:
         date_start = None
         date_end = None
@@ -315,14 +433,368 @@ def validate_factor(
         mae=mae,
         corr=corr,
         ic=ic,
-        n_obs=int(len(aligned)),
+        n_obs=int(valid.sum()),
         date_start=date_start,
         date_end=date_end,
         pass_thresholds=pass_thresholds,
         thresholds=thresholds,
         diagnostics=diagnostics,
-        figure=figure,
+        plot=plot,
         per_factor_metrics=per_factor_metrics or None,
         per_factor_n_obs=per_factor_n_obs or None,
     )
 
+
+def _align_wide(
+    user: pd.DataFrame,
+    reference: pd.DataFrame,
+    *,
+    sort_by_time: bool,
+) -> Tuple[pd.Index, pd.Index, np.ndarray, np.ndarray]:
+    """Intersect index/columns of two wide frames; return (index, columns, user, ref) float arrays."""
+    if user.empty or reference.empty:
+        raise ValueError("user/reference must be non-empty wide DataFrames")
+
+    # Align by intersection of index (dates) and columns (factor names)
+    common_idx = user.index.intersection(reference.index)
+    common_cols = user.columns.intersection(reference.columns)
+    if len(common_idx) == 0 or len(common_cols) == 0:
+        raise ValueError("No overlap between user and reference on index and/or columns")
+
+    with _profiling.stage("align") as st:
+        user_aligned = user.loc[common_idx, common_cols]
+        ref_aligned = reference.loc[common_idx, common_cols]
+
+        # Optionally sort by time if index is datetime-like
+        if sort_by_time and pd.api.types.is_datetime64_any_dtype(user_aligned.index):
+            user_aligned = user_aligned.sort_index()
+            ref_aligned = ref_aligned.reindex(user_aligned.index)
+
+        user_arr = user_aligned.to_numpy(dtype=np.float64, na_value=np.nan)
+        ref_arr = ref_aligned.to_numpy(dtype=np.float64, na_value=np.nan)
+        st.output(user_arr)
+    return user_aligned.index, common_cols, user_arr, ref_arr
+
+
+WINDOW_METRICS: Tuple[str, ...] = ("n_obs", "mse", "rmse", "mae", "corr")
+
+
+def _window_metrics(
+    user: np.ndarray,
+    ref: np.ndarray,
+    valid: np.ndarray,
+    *,
+    window: Optional[int],
+    min_periods: int,
+) -> Dict[str, np.ndarray]:
+    """
+    Trailing-window (or expanding, `window=None`) metrics per column, from cumulative sums.
+
+    Row t covers rows (t - window, t]; only valid cells count. Values are
+    centered on their column mean before accumulating so the moment sums stay
+    well conditioned. Rows with fewer than `min_periods` valid cells are NaN.
+    """
+    def _windowed(a: np.ndarray) -> np.ndarray:
+        c = np.zeros((a.shape[0] + 1, a.shape[1]))
+        np.cumsum(a, axis=0, out=c[1:])
+        if window is None:
+            return c[1:]
+        lag = np.maximum(np.arange(1, a.shape[0] + 1) - window, 0)
+        return c[1:] - c[lag]
+
+    def _centered(a: np.ndarray) -> np.ndarray:
+        a = np.where(valid, a, 0.0)
+        return np.where(valid, a - a.sum(axis=0) / np.maximum(valid.sum(axis=0), 1), 0.0)
+
+    n = _windowed(valid.astype(np.float64))
+    diff_pp = np.where(valid, 100.0 * (user - ref), 0.0)
+    sq = _windowed(diff_pp * diff_pp)
+    ab = _windowed(np.abs(diff_pp))
+    u, r = _centered(user), _centered(ref)
+    su, sr = _windowed(u), _windowed(r)
+    suu, srr, sur = _windowed(u * u), _windowed(r * r), _windowed(u * r)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # Differences of cumulative sums can dip just below zero
+        mse = np.maximum(sq / n, 0.0)
+        mae = np.maximum(ab / n, 0.0)
+        var_u = n * suu - su * su
+        var_r = n * srr - sr * sr
+        corr = (n * sur - su * sr) / np.sqrt(var_u * var_r)
+    # Constant (or single-observation) windows have no correlation; allow for rounding residue
+    tiny = 1e-12
+    corr = np.where((var_u <= tiny * n * suu) | (var_r <= tiny * n * srr), np.nan, np.clip(corr, -1.0, 1.0))
+
+    enough = n >= max(1, min_periods)
+    out = {"n_obs": n, "mse": mse, "rmse": np.sqrt(mse), "mae": mae, "corr": corr}
+    return {k: np.where(enough, v, np.nan) if k != "n_obs" else v for k, v in out.items()}
+
+
+def rolling_metrics(
+    *,
+    user: pd.DataFrame,
+    reference: pd.DataFrame,
+    window: Optional[int],
+    min_periods: Optional[int] = None,
+    sort_by_time: bool = True,
+) -> Dict[str, pd.DataFrame]:
+    """Rolling (`window` rows) or expanding (`window=None`) validation metrics per factor.
+
+    Alignment matches `validate_factor`. Computed in O(T) per factor from
+    cumulative sums. Returns `{metric: wide frame (date × factor)}` for
+    WINDOW_METRICS. `min_periods` defaults to `window` (rolling) or 1
+    (expanding), counted in valid observations. IC is not provided: ranks are
+    not additive over windows.
+    """
+    index, columns, user_arr, ref_arr = _align_wide(user, reference, sort_by_time=sort_by_time)
+    valid = ~(np.isnan(user_arr) | np.isnan(ref_arr))
+    return _window_frames(index, columns, user_arr, ref_arr, valid, window=window, min_periods=min_periods)
+
+
+def _window_frames(
+    index: pd.Index,
+    columns: pd.Index,
+    user_arr: np.ndarray,
+    ref_arr: np.ndarray,
+    valid: np.ndarray,
+    *,
+    window: Optional[int],
+    min_periods: Optional[int],
+) -> Dict[str, pd.DataFrame]:
+    if window is not None and window < 1:
+        raise ValueError("window must be a positive number of rows or None (expanding)")
+    if min_periods is None:
+        min_periods = window if window is not None else 1
+    metrics = _window_metrics(user_arr, ref_arr, valid, window=window, min_periods=min_periods)
+    frames = {k: pd.DataFrame(v, index=index, columns=columns) for k, v in metrics.items()}
+    frames["n_obs"] = frames["n_obs"].astype(np.int64)
+    return frames
+
+
+def validate_factor(
+    *,
+    user: pd.DataFrame,
+    reference: pd.DataFrame,
+    thresholds: Optional[Dict[str, float]] = None,
+    return_plot: bool = True,
+    plot_title: Optional[str] = None,
+    sort_by_time: bool = True,
+    max_plot_factors: int = 8,
+    max_plot_points: int = DEFAULT_MAX_PLOT_POINTS,
+    rolling_window: Optional[int] = None,
+    expanding: bool = False,
+    min_periods: Optional[int] = None,
+) -> ValidationReport:
+    """Validate wide-form factor data (date index, factor names as columns).
+
+    With `return_plot=True` the report carries a LazyFigure; the figure is drawn
+    only when `report.figure` is accessed (see also `render_pngs`).
+    `rolling_window` (rows) and `expanding=True` additionally fill
+    `report.rolling` / `report.expanding` (see `rolling_metrics`).
+    """
+    index, common_cols, user_arr, ref_arr = _align_wide(user, reference, sort_by_time=sort_by_time)
+    valid = ~(np.isnan(user_arr) | np.isnan(ref_arr))
+    n_obs = int(valid.sum())
+    if n_obs == 0:
+        raise ValueError("After dropping NA values, no overlapping observations remain for comparison")
+
+    with _profiling.stage("metrics", rows=len(index), columns=len(common_cols)):
+        # Global metrics: all valid cells as one column
+        overall = _column_metrics(user_arr[valid][:, None], ref_arr[valid][:, None], np.ones((n_obs, 1), dtype=bool))
+        per_col = _column_metrics(user_arr, ref_arr, valid)
+
+    diagnostics: Dict[str, Any] = {
+        "user_rows": int(user_arr.size),
+        "reference_rows": int(ref_arr.size),
+        "aligned_rows_before_dropna": int(valid.size),
+        "aligned_rows": n_obs,
+        "num_factors": int(len(common_cols)),
+    }
+
+    plot: Optional[LazyFigure] = None
+    if return_plot:
+        plot = LazyFigure(
+            index=index,
+            columns=common_cols,
+            user=user_arr,
+            ref=ref_arr,
+            valid=valid,
+            title=plot_title or "Factor validation (cumsum): user vs reference",
+            max_plot_factors=max_plot_factors,
+            max_points=max_plot_points,
+        )
+
+    report = _report_from_arrays(
+        index=index,
+        columns=common_cols,
+        valid=valid,
+        overall={k: v[0] for k, v in overall.items()},
+        per_col=per_col,
+        diagnostics=diagnostics,
+        thresholds=thresholds,
+        plot=plot,
+    )
+    if rolling_window is not None or expanding:
+        with _profiling.stage("metrics", rows=len(index), columns=len(common_cols), detail={"windowed": True}):
+            if rolling_window is not None:
+                report.rolling = _window_frames(
+                    index, common_cols, user_arr, ref_arr, valid, window=rolling_window, min_periods=min_periods
+                )
+            if expanding:
+                report.expanding = _window_frames(
+                    index, common_cols, user_arr, ref_arr, valid, window=None, min_periods=min_periods
+                )
+    return report
+
+
+# Leaderboard metrics where larger is better; the rest are errors (smaller is better)
+_HIGHER_IS_BETTER = ("corr", "ic")
+
+
+@dataclass
+class BatchValidation:
+    """Result of `validate_many`.
+
+    `leaderboard` has one row per candidate (index "candidate") with the global
+    metrics, observation counts, date range and threshold outcome, sorted best
+    first by the requested metric. `reports` holds the full ValidationReport of
+    every candidate, keyed like the input mapping.
+    """
+
+    leaderboard: pd.DataFrame
+    reports: Dict[str, ValidationReport]
+
+
+def validate_many(
+    *,
+    candidates: Mapping[str, pd.DataFrame],
+    reference: pd.DataFrame,
+    thresholds: Optional[Dict[str, float]] = None,
+    rank_by: Literal["mse", "rmse", "mae", "corr", "ic"] = "rmse",
+    return_plot: bool = False,
+    plot_title: Optional[str] = None,
+    sort_by_time: bool = True,
+    max_plot_factors: int = 8,
+    max_plot_points: int = DEFAULT_MAX_PLOT_POINTS,
+) -> BatchValidation:
+    """Validate many wide-form candidate frames against one reference in a single batch.
+
+    The reference is aligned once onto the union of the candidates' overlaps with
+    it (dates sorted when `sort_by_time` and datetime-like). Candidates are
+    stacked on those axes, so cells outside a candidate's own overlap are simply
+    invalid, and all metrics come out of one column-wise pass. Each report equals
+    `validate_factor(user=candidate, reference=reference)` for that candidate.
+    Reports and leaderboard rows are keyed by `str(name)`; names that collide
+    as strings (e.g. `1` and `"1"`) raise ValueError.
+    """
+    if not candidates:
+        raise ValueError("candidates must be a non-empty mapping of name -> wide DataFrame")
+    if reference.empty:
+        raise ValueError("user/reference must be non-empty wide DataFrames")
+    if rank_by not in ("mse", "rmse", "mae", *_HIGHER_IS_BETTER):
+        raise ValueError(f"Unsupported rank_by: {rank_by}")
+
+    ref = reference
+    if sort_by_time and pd.api.types.is_datetime64_any_dtype(ref.index):
+        ref = ref.sort_index()
+
+    names = [str(name) for name in candidates]
+    if len(set(names)) != len(names):
+        clashing = sorted({n for n in names if names.count(n) > 1})
+        raise ValueError(f"Candidate names must be distinct as strings (report/leaderboard keys); clashing: {clashing}")
+    overlaps: List[Tuple[pd.Index, pd.Index]] = []
+    for name, cand in zip(names, candidates.values()):
+        if cand.empty:
+            raise ValueError(f"Candidate '{name}': user/reference must be non-empty wide DataFrames")
+        common_idx = cand.index.intersection(ref.index)
+        common_cols = cand.columns.intersection(ref.columns)
+        if len(common_idx) == 0 or len(common_cols) == 0:
+            raise ValueError(f"Candidate '{name}': no overlap between user and reference on index and/or columns")
+        overlaps.append((common_idx, common_cols))
+
+    # Shared axes: reference labels covered by at least one candidate, in reference order
+    with _profiling.stage("align", detail={"candidates": len(names)}) as st:
+        index = ref.index[ref.index.isin(pd.Index([]).append([o[0] for o in overlaps]))]
+        columns = ref.columns[ref.columns.isin(pd.Index([]).append([o[1] for o in overlaps]))]
+        ref_arr = ref.loc[index, columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        n_dates, n_factors = ref_arr.shape
+        user_arr = np.stack(
+            [c.reindex(index=index, columns=columns).to_numpy(dtype=np.float64, na_value=np.nan) for c in candidates.values()]
+        )
+        st.output(ref_arr)
+    valid = ~(np.isnan(user_arr) | np.isnan(ref_arr)[None])
+    n_obs = valid.sum(axis=(1, 2))
+    empty = [name for name, n in zip(names, n_obs) if n == 0]
+    if empty:
+        raise ValueError(f"After dropping NA values, no overlapping observations remain for comparison: {empty}")
+
+    # One pass per metric family: per-factor columns of every candidate side by side,
+    # then every candidate's valid cells flattened into one column for the global numbers.
+    with _profiling.stage("metrics", rows=n_dates, columns=n_factors * len(names)):
+        ref_tiled = np.broadcast_to(ref_arr[None], user_arr.shape)
+        per_col = _column_metrics(
+            user_arr.transpose(1, 0, 2).reshape(n_dates, -1),
+            ref_tiled.transpose(1, 0, 2).reshape(n_dates, -1),
+            valid.transpose(1, 0, 2).reshape(n_dates, -1),
+        )
+        overall = _column_metrics(
+            user_arr.reshape(len(names), -1).T,
+            ref_tiled.reshape(len(names), -1).T,
+            valid.reshape(len(names), -1).T,
+        )
+
+    reports: Dict[str, ValidationReport] = {}
+    for c, name in enumerate(names):
+        grid = len(overlaps[c][0]) * len(overlaps[c][1])
+        plot: Optional[LazyFigure] = None
+        if return_plot:
+            plot = LazyFigure(
+                index=index,
+                columns=columns,
+                user=user_arr[c],
+                ref=ref_arr,
+                valid=valid[c],
+                title=plot_title or f"Factor validation (cumsum): {name} vs reference",
+                max_plot_factors=max_plot_factors,
+                max_points=max_plot_points,
+            )
+        block = slice(c * n_factors, (c + 1) * n_factors)
+        reports[name] = _report_from_arrays(
+            index=index,
+            columns=columns,
+            valid=valid[c],
+            overall={k: v[c] for k, v in overall.items()},
+            per_col={k: v[block] for k, v in per_col.items()},
+            diagnostics={
+                "user_rows": grid,
+                "reference_rows": grid,
+                "aligned_rows_before_dropna": grid,
+                "aligned_rows": int(n_obs[c]),
+                "num_factors": int(len(overlaps[c][1])),
+            },
+            thresholds=thresholds,
+            plot=plot,
+        )
+
+    leaderboard = pd.DataFrame(
+        [
+            {
+                "candidate": name,
+                "mse": r.mse,
+                "rmse": r.rmse,
+                "mae": r.mae,
+                "corr": r.corr,
+                "ic": r.ic,
+                "n_obs": r.n_obs,
+                "num_factors": r.diagnostics["num_factors"],
+                "date_start": r.date_start,
+                "date_end": r.date_end,
+                "pass_thresholds": r.pass_thresholds,
+            }
+            for name, r in reports.items()
+        ]
+    ).set_index("candidate")
+    leaderboard = leaderboard.sort_values(
+        rank_by, ascending=rank_by not in _HIGHER_IS_BETTER, na_position="last", kind="stable"
+    )
+    return BatchValidation(leaderboard=leaderboard, reports=reports)
@@ -1,5 +1,8 @@
+from pathlib import Path
+
 from qdl import dataloader, transformer, validator
 import numpy as np
+import pandas as pd
 from qdl.facade import QDL
 
 
@@ -70,6 +73,756 @@ def run_validate_factor_facade_tests() -> None:
         raise AssertionError("Expected ValueError for unnamed Series without answer")
 
 
+def run_facade_cache_tests() -> None:
+    q = QDL()
+
+    # Repeated identical loads are served from the cache
+    first = q.load_factors(country="usa", dataset="factor", weighting="ew")
+    stats = q.cache_stats()
+    assert stats is not None and stats.misses == 1 and stats.hits == 0
+    _ = q.load_factors(country="usa", dataset="factor", weighting="ew", factors=["at_gr1"])
+    assert q.cache_stats().hits == 1
+
+    # Mutating a returned frame must not corrupt the cached entry
+    original = float(first.iloc[0, 0])
+    first.iloc[0, 0] = original + 1.0
+    again = q.load_factors(country="usa", dataset="factor", weighting="ew")
+    _assert_close(float(again.iloc[0, 0]), original)
+    print("facade: cache hit + copy-on-write OK")
+
+    # Tiny budget forces evictions; disabled cache exposes no stats
+    q_small = QDL(cache_max_bytes=1)
+    _ = q_small.load_factors(country="usa", dataset="factor", weighting="ew")
+    assert q_small.cache_stats().entries == 0
+    assert QDL(cache=False).cache_stats() is None
+    print("facade: cache budget/disable OK")
+
+
+def run_factor_sidecar_tests() -> None:
+    kwargs = dict(country="usa", dataset="factor", weighting="ew")
+
+    # Sidecar round-trip must be indistinguishable from parsing the CSV
+    from_csv = dataloader.load_factors(**kwargs, sidecar=False)
+    rebuilt = dataloader.load_factors(**kwargs, refresh_sidecar=True)
+    from_sidecar = dataloader.load_factors(**kwargs)
+    assert dataloader._sidecar_path(dataloader.resolve_factors_path(**kwargs)).exists()
+    pd.testing.assert_frame_equal(from_csv, rebuilt)
+    pd.testing.assert_frame_equal(from_csv, from_sidecar)
+    print("dataloader: factor sidecar round-trip OK")
+
+
+def run_load_chars_wide_tests() -> None:
+    q = QDL(cache=False)
+    chars = ["ret_exc", "market_equity", "size_grp"]
+    panel = q.load_chars_wide(country="usa", vintage="2020-", chars=chars)
+    assert list(panel) == chars
+    first = panel[chars[0]]
+    for name in chars:
+        # Shared axes, and identical to the single-characteristic loader
+        assert panel[name].index.equals(first.index)
+        assert panel[name].columns.equals(first.columns)
+        pd.testing.assert_frame_equal(panel[name], q.load_char(country="usa", vintage="2020-", char=name))
+    print("facade: load_chars_wide OK")
+
+
+def run_to_wide_fast_path_tests() -> None:
+    rng = np.random.default_rng(0)
+    dates = pd.date_range("2000-01-31", periods=6, freq="ME")
+    base = pd.DataFrame({"eom": rng.choice(dates, 80), "id": rng.choice([5, 1, 9, 3], 80)})
+    cases = {
+        "unique_float": base.drop_duplicates(["eom", "id"]).assign(v=lambda d: rng.normal(size=len(d))),
+        "dup_float_nan": base.assign(v=np.where(rng.random(80) < 0.3, np.nan, rng.normal(size=80))),
+        "dup_int": base.assign(v=rng.integers(0, 10, 80)),
+        "float32": base.assign(v=rng.normal(size=80).astype("float32")),
+    }
+    for label, df in cases.items():
+        for agg in ("first", "mean", "sum"):
+            fast = transformer.to_wide(df, index_cols=["eom"], column_col="id", value_col="v", agg=agg)
+            slow = transformer._pivot_table_wide(df, index_cols=["eom"], column_col="id", value_col="v", agg=agg)
+            pd.testing.assert_frame_equal(fast, slow, obj=f"{label}/{agg}")
+    # Categorical keys (lean dtype policy ids, unused categories included) give the labels pivot_table gives
+    for categories in ([1, 3, 5, 9, 11], ["a", "b", "c", "d", "e"]):
+        codes = cases["dup_float_nan"]["id"].map(dict(zip([1, 3, 5, 9], categories)))
+        df = cases["dup_float_nan"].assign(id=pd.Categorical(codes, categories=categories))
+        for frame in (df, df.assign(eom=pd.Categorical(df["eom"]))):
+            fast = transformer.to_wide(frame, index_cols=["eom"], column_col="id", value_col="v")
+            slow = transformer._pivot_table_wide(frame, index_cols=["eom"], column_col="id", value_col="v", agg="first")
+            pd.testing.assert_frame_equal(fast, slow)
+            assert type(fast.columns) is pd.Index and fast.index.dtype == slow.index.dtype
+            many = transformer.to_wide_many(frame, index_col="eom", column_col="id", value_cols=["v"])["v"]
+            pd.testing.assert_frame_equal(many, slow)
+    print("transformer: to_wide fast path matches pivot_table OK")
+
+
+def run_row_predicate_tests() -> None:
+    q = QDL(cache=False)
+    kwargs = dict(country="usa", vintage="2020-", columns=["date", "ret_exc", "size_grp"])
+    full = q.load_char_dataset(**kwargs)
+
+    def _check(expected_mask: pd.Series, **predicates) -> pd.DataFrame:
+        got = q.load_char_dataset(**kwargs, **predicates)
+        # Key columns follow `date_col`, so compare on the returned projection
+        expected = full.loc[expected_mask.to_numpy(), list(got.columns)].reset_index(drop=True)
+        assert len(expected) > 0
+        pd.testing.assert_frame_equal(got.reset_index(drop=True), expected, obj=str(sorted(predicates)))
+        return got
+
+    # Inclusive bounds on `eom` (month ends present in the file) and on `date`
+    months = full["eom"].drop_duplicates().sort_values()
+    lo, hi = months.iloc[1], months.iloc[3]
+    got = _check((full["eom"] >= lo) & (full["eom"] <= hi), start=lo, end=hi)
+    assert got["eom"].min() == lo and got["eom"].max() == hi
+    days = full["date"].drop_duplicates().sort_values()
+    lo, hi = days.iloc[5], days.iloc[len(days) // 2]
+    got = _check((full["date"] >= lo) & (full["date"] <= hi), start=lo, end=hi, date_col="date")
+    assert got["date"].min() == lo and got["date"].max() == hi
+    _check(full["eom"] >= months.iloc[-2], start=str(months.iloc[-2].date()))
+
+    ids = full["id"].drop_duplicates().iloc[[0, 3, 7]].tolist()
+    _check(full["id"].isin(ids), ids=ids)
+    groups = ["large", "mega"]
+    _check(full["size_grp"].isin(groups), filters=[("size_grp", "in", groups)])
+    _check(
+        (full["eom"] <= months.iloc[2]) & full["id"].isin(ids) & full["size_grp"].isin(groups),
+        end=months.iloc[2],
+        ids=ids,
+        filters=[("size_grp", "in", groups)],
+    )
+
+    # Predicates are part of the facade cache key
+    cached = QDL()
+    a = cached.load_char_dataset(**kwargs, start=months.iloc[1])
+    b = cached.load_char_dataset(**kwargs, start=months.iloc[2])
+    c = cached.load_char_dataset(**kwargs, start=months.iloc[2], ids=ids)
+    assert len(a) > len(b) > len(c) and cached.cache_stats().misses == 3
+    assert cached.load_char_dataset(**kwargs, start=str(months.iloc[1].date())).equals(a)
+    assert cached.cache_stats().hits == 1
+    print("dataloader: start/end/ids/filters pushdown matches pandas filtering OK")
+
+
+def run_iter_char_batches_tests() -> None:
+    q = QDL(cache=False)
+    kwargs = dict(country="usa", vintage="2020-", columns=["ret_exc"], start="2021-01-01")
+    full = q.load_char_dataset(**kwargs)
+    chunks = list(q.iter_char_batches(**kwargs, by="month", batch_rows=50_000))
+    assert sum(len(c) for c in chunks) == len(full)
+    seen_months = [m for c in chunks for m in c["eom"].dt.to_period("M").unique()]
+    assert len(seen_months) == len(set(seen_months)), "a month was split across chunks"
+    print("facade: iter_char_batches by month OK")
+
+
+def run_dtype_policy_tests() -> None:
+    q = QDL(cache=False)
+    kwargs = dict(country="usa", vintage="2020-", columns=["ret_exc", "market_equity", "size_grp"])
+    default = q.load_char_dataset(**kwargs)
+    lean = q.load_char_dataset(**kwargs, dtype_policy="lean")
+    assert list(lean.columns) == list(default.columns)
+    assert lean["ret_exc"].dtype == np.float32
+    assert isinstance(lean["size_grp"].dtype, pd.CategoricalDtype)
+    assert lean.memory_usage(deep=True).sum() < default.memory_usage(deep=True).sum()
+    np.testing.assert_allclose(lean["ret_exc"].to_numpy(np.float64), default["ret_exc"].to_numpy(), rtol=1e-6)
+    print("dataloader: lean dtype policy OK")
+
+
+def run_factor_construction_tests() -> None:
+    from qdl import construction
+
+    rng = np.random.default_rng(1)
+    dates = pd.date_range("2010-01-31", periods=4, freq="ME")
+    ids = list(range(40))
+    char = pd.DataFrame(rng.normal(size=(4, 40)), index=dates, columns=ids)
+    ret = pd.DataFrame(rng.normal(0.0, 0.05, size=(4, 40)), index=dates, columns=ids)
+    me = pd.DataFrame(rng.lognormal(5.0, 1.0, size=(4, 40)), index=dates, columns=ids)
+    grp = pd.DataFrame(rng.choice(["mega", "large", "small", "micro", "nano"], size=(4, 40)), index=dates, columns=ids)
+    out = construction.build_factor_returns(char, ret_exc=ret, market_equity=me, size_grp=grp, direction=-1)
+    assert list(out.columns) == ["ew", "vw", "vw_cap"] and out.iloc[0].isna().all()
+
+    # Naive per-month reference: JKP ecdf terciles on non-micro breakpoints, capped vw
+    prev, cur = dates[1], dates[2]
+    x, g, w = char.loc[prev], grp.loc[prev], me.loc[prev]
+    bp = x[g.isin(["mega", "large", "small"])]
+    pf = np.maximum(1, np.ceil(3 * x.apply(lambda v: (bp <= v).mean())))
+    w = np.minimum(w, w[g == "mega"].min())
+
+    def _leg(k: int) -> float:
+        m = pf == k
+        return float((w[m] * ret.loc[cur][m]).sum() / w[m].sum())
+
+    _assert_close(float(out.loc[cur, "vw_cap"]), -(_leg(3) - _leg(1)), tol=1e-12)
+    print("construction: vectorized terciles match naive ecdf sort OK")
+
+
+def run_factor_zoo_tests() -> None:
+    q = QDL()
+    chars = ["be_me", "ret_12_1"]
+    zoo = q.build_factors(country="usa", vintage="2020-", chars=chars, weighting="vw", max_workers=2)
+    assert list(zoo.columns) == chars
+    for char in chars:
+        single = q.build_factor(country="usa", vintage="2020-", char=char, weightings=("vw",))
+        np.testing.assert_allclose(zoo[char].to_numpy(), single["vw"].to_numpy(), equal_nan=True)
+
+    # In-process builds from several threads keep their own panels
+    import tempfile
+    from concurrent.futures import ThreadPoolExecutor
+
+    from qdl import server
+
+    def _build(job):
+        weighting, names = job
+        return q.build_factors(country="usa", vintage="2020-", chars=names, weighting=weighting, max_workers=1)
+
+    jobs = [("vw", chars), ("ew", chars[::-1]), ("vw", chars[:1]), ("ew", chars)] * 2
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        built = list(pool.map(_build, jobs))
+    expected = {w: q.build_factors(country="usa", vintage="2020-", chars=chars, weighting=w, max_workers=1) for w in ("ew", "vw")}
+    for (weighting, names), got in zip(jobs, built):
+        pd.testing.assert_frame_equal(got, expected[weighting][list(names)])
+
+    # A remote facade builds from panels fetched in one server scan
+    with tempfile.TemporaryDirectory() as tmp, server.PanelServer(f"unix://{tmp}/qdl.sock") as srv:
+        remote = QDL(remote=srv.address).build_factors(country="usa", vintage="2020-", chars=chars, weighting="vw")
+    pd.testing.assert_frame_equal(remote, expected["vw"])
+    print("build_factors: process-pool zoo matches build_factor OK")
+
+
+def run_validator_core_tests() -> None:
+    from qdl import validator
+
+    rng = np.random.default_rng(2)
+    dates = pd.date_range("2001-01-31", periods=24, freq="ME")
+    user = pd.DataFrame(rng.normal(size=(24, 3)).round(1), index=dates, columns=["a", "b", "c"])
+    ref = (user + rng.normal(scale=0.1, size=(24, 3))).mask(rng.random((24, 3)) < 0.2)
+    user["c"] = 0.5  # constant → corr/IC undefined
+    report = validator.validate_factor(user=user, reference=ref, return_plot=False)
+
+    # Long-form reference computation
+    both = pd.DataFrame({"u": user.stack(), "r": ref.stack()}).dropna()
+    _assert_close(report.mse, float(((100 * (both["u"] - both["r"])) ** 2).mean()), tol=1e-9)
+    _assert_close(report.ic, float(both["u"].rank().corr(both["r"].rank())), tol=1e-12)
+    sub = both.xs("a", level=1)
+    _assert_close(report.per_factor_metrics["a"]["ic"], float(sub["u"].rank().corr(sub["r"].rank())), tol=1e-12)
+    assert report.per_factor_metrics["c"]["corr"] is None and report.n_obs == len(both)
+    print("validator: column-wise metrics match long-form computation OK")
+
+
+def run_validate_many_tests() -> None:
+    q = QDL()
+    ref = q.load_factors(country="usa", dataset="factor", weighting="ew", factors=["be_me", "ret_12_1"])
+    # Errors proportional to the reference, so the ranking holds at any return scale
+    candidates = {"exact": ref, "noisy": ref * 1.01, "value_only": ref[["be_me"]] * 0.5}
+    batch = q.validate_many(candidates=candidates, weighting="ew")
+    assert list(batch.leaderboard.index) == ["exact", "noisy", "value_only"]
+    for name, cand in candidates.items():
+        single = q.validate_factor(user=cand, weighting="ew", return_plot=False)
+        _assert_close(batch.reports[name].rmse, single.rmse, tol=1e-9)
+        assert batch.reports[name].per_factor_n_obs == single.per_factor_n_obs
+    # Keys that collide as strings would overwrite each other's report
+    try:
+        q.validate_many(candidates={1: ref, "1": ref + 0.01}, weighting="ew")
+        raise AssertionError("expected ValueError")
+    except ValueError:
+        pass
+    print("validate_many: leaderboard and reports match validate_factor OK")
+
+
+def run_lazy_plot_tests() -> None:
+    from qdl import validator
+
+    dates = pd.date_range("1990-01-01", periods=5000, freq="D")
+    user = pd.DataFrame(np.random.default_rng(3).normal(size=(5000, 2)), index=dates, columns=["a", "b"])
+    report = validator.validate_factor(user=user, reference=user * 1.01, max_plot_points=500)
+    assert report.plot is not None and not report.plot.rendered
+    fig = report.figure
+    assert report.plot.rendered and report.figure is fig
+    assert len(fig.axes[0].lines[0].get_xdata()) <= 500
+    futures = validator.render_pngs({"x": report})
+    assert futures["x"].result().startswith(b"\x89PNG")
+
+    # With pyplot in use, accessing `figure` hands it to pyplot (plt.show / inline display)
+    import matplotlib.pyplot as plt
+
+    report = validator.validate_factor(user=user, reference=user * 1.01)
+    report.plot.to_png()
+    assert report.figure.number in plt.get_fignums()
+    plt.close(report.figure)
+    print("validator: lazy downsampled figure and background PNG rendering OK")
+
+
+def run_rolling_metrics_tests() -> None:
+    from qdl import validator
+
+    rng = np.random.default_rng(4)
+    dates = pd.date_range("2000-01-31", periods=60, freq="ME")
+    user = pd.DataFrame(rng.normal(0.0, 0.05, size=(60, 2)), index=dates, columns=["a", "b"])
+    ref = (user + rng.normal(0.0, 0.01, size=(60, 2))).mask(rng.random((60, 2)) < 0.1)
+    report = validator.validate_factor(user=user, reference=ref, expanding=True, return_plot=False)
+
+    def _brute_force(window, min_periods: int) -> dict:
+        """Metrics of every trailing window from an explicit loop over its rows."""
+        out = {k: np.full((60, 2), np.nan) for k in validator.WINDOW_METRICS}
+        for t in range(60):
+            rows = slice(0 if window is None else max(0, t - window + 1), t + 1)
+            for j, col in enumerate(["a", "b"]):
+                pair = pd.DataFrame({"u": user[col].iloc[rows], "r": ref[col].iloc[rows]}).dropna()
+                out["n_obs"][t, j] = len(pair)
+                if len(pair) < min_periods:
+                    continue
+                diff = 100 * (pair["u"] - pair["r"])
+                out["mse"][t, j] = (diff**2).mean()
+                out["rmse"][t, j] = np.sqrt((diff**2).mean())
+                out["mae"][t, j] = diff.abs().mean()
+                out["corr"][t, j] = pair["u"].corr(pair["r"]) if len(pair) > 1 else np.nan
+        return out
+
+    # Every rolling window (NaNs leave some below `window` valid rows) and every expanding prefix
+    for window, min_periods, frames in (
+        (12, 8, validator.rolling_metrics(user=user, reference=ref, window=12, min_periods=8)),
+        (12, 12, validator.rolling_metrics(user=user, reference=ref, window=12)),
+        (None, 1, report.expanding),
+    ):
+        expected = _brute_force(window, min_periods)
+        for metric in validator.WINDOW_METRICS:
+            assert frames[metric].shape == (60, 2)
+            np.testing.assert_allclose(frames[metric].to_numpy(), expected[metric], rtol=1e-9, atol=1e-12, equal_nan=True)
+        assert (~np.isnan(expected["corr"])).sum() >= 10
+    # min_periods=8 scores windows with missing rows (the default needs a full window)
+    expected = _brute_force(12, 8)
+    assert ((expected["n_obs"] < 12) & ~np.isnan(expected["mse"])).any()
+    _assert_close(float(report.expanding["rmse"]["b"].iloc[-1]), report.per_factor_metrics["b"]["rmse"], tol=1e-9)
+    print("validator: rolling/expanding metrics OK")
+
+
+def run_catalog_tests() -> None:
+    q = QDL()
+    catalog = q.build_catalog()
+    entry = q.describe_chars(country="usa", vintage="2020-")
+    assert entry is not None and entry.num_rows > 0 and "eom" in entry.columns
+    assert catalog.entry("chars", entry.name) is not None
+
+    # Column validation answered by the catalog, without reading the file
+    misses = q.cache_stats().misses
+    try:
+        q.load_char_dataset(country="usa", vintage="2020-", columns=["__no_such_column__"])
+        raise AssertionError("expected KeyError")
+    except KeyError:
+        pass
+    assert q.cache_stats().misses == misses
+
+    lo, hi = entry.date_range("eom")
+    plan = q.plan_char_query(country="usa", vintage="2020-", columns=["be_me", "__typo__"], start=hi, end=hi)
+    assert plan["missing_columns"] == ["__typo__"] and 0 < plan["estimated_rows"] <= entry.num_rows
+    print("catalog: build, describe, validation and query planning OK")
+
+
+def run_non_strict_projection_tests() -> None:
+    import warnings
+
+    from qdl.facade import MissingColumnsWarning
+
+    q = QDL()
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        df = q.load_char_dataset(country="usa", vintage="2020-", columns=["be_me", "__typo__"], strict=False)
+    assert list(df.columns) == ["be_me", "eom", "id"]
+    assert df.attrs["missing_columns"] == ["__typo__"]
+    assert [w.message.missing for w in caught if issubclass(w.category, MissingColumnsWarning)] == [["__typo__"]]
+    print("facade: non-strict projection reads only existing columns OK")
+
+
+def run_import_budget_tests() -> None:
+    from qdl import benchmark
+
+    timing = benchmark.check_import_budget("qdl.facade", repeat=3)
+    assert "matplotlib" not in timing.loaded
+    print(f"import qdl.facade: {timing.module_ms:.1f} ms on top of numpy/pandas (budget {benchmark.IMPORT_BUDGET_MS:.0f} ms) OK")
+
+
+def run_synthetic_data_tests() -> None:
+    import tempfile
+
+    from qdl import config, synthetic
+
+    with tempfile.TemporaryDirectory() as root, config.data_root(root):
+        synthetic.write_synthetic_data(root, n_stocks=200, n_months=36, datasets=("factor", "mkt"), weightings=("vw",))
+        q = QDL()
+        chars = q.load_char_dataset(country="usa", vintage="2020-")
+        assert {"id", "permno", "eom", "date", "size_grp", "market_equity", "me", "ret_exc", "be_me"} <= set(chars.columns)
+        built = q.build_factor(country="usa", vintage="2020-", char="be_me", weightings=("vw",))
+        report = q.validate_factor(user=built["vw"].rename("be_me"), weighting="vw", return_plot=False)
+        # Self-consistency only: the reference CSVs are themselves built with qdl.construction
+        assert report.rmse < 1e-8
+    assert config.CHARS_PATH != Path(root) / "chars"
+    print("synthetic: generated data root round-trips through build_factor/validate_factor OK")
+
+
+def run_benchmark_suite_tests() -> None:
+    import json
+    from dataclasses import asdict
+
+    from qdl import benchmark
+
+    results = benchmark.run_suite(sizes=("small",), cases=("load_char", "validate_factor", "replicate"), repeat=1)
+    assert [r.case for r in results] == ["load_char", "validate_factor", "replicate"]
+    for r in results:
+        assert r.size == "small" and len(r.times_s) == 1 and r.median_s > 0 and r.tracemalloc_peak_bytes > 0
+        # Fresh interpreter per case: the high-water mark is the case's own, not the suite's
+        assert r.rss_peak_bytes >= r.rss_setup_bytes > 0
+    assert results[-1].extra["rmse"] < 1e-10
+    report = {"results": [asdict(r) for r in results]}
+    rows = benchmark.compare_results(json.loads(json.dumps(report)), report)
+    assert [row["time_ratio"] for row in rows] == [1.0, 1.0, 1.0]
+    (in_process,) = benchmark.run_suite(sizes=("small",), cases=("validate_factor",), repeat=1, isolate=False)
+    assert in_process.rss_peak_bytes is None and in_process.rss_setup_bytes is None
+    print("benchmark: synthetic suite runs and reports comparable JSON OK")
+
+
+def run_profiling_tests() -> None:
+    import json
+    import tempfile
+
+    from qdl import profiling
+
+    q = QDL(profile=True)
+    q.load_factors(country="usa", dataset="factor", weighting="vw")
+    q.load_factors(country="usa", dataset="factor", weighting="vw")
+    q.load_char(country="usa", vintage="2020-", char="be_me")
+    events = q.profile_events()
+    calls = events[events["stage"] == "call"]
+    assert list(calls["call"]) == ["load_factors", "load_factors", "load_char"]
+    assert list(calls["cache_hits"]) == [0, 1, 0] and list(calls["cache_misses"]) == [1, 0, 1]
+    parquet = events[(events["call"] == "load_char") & (events["stage"] == "read_parquet")].iloc[0]
+    assert parquet["rows"] > 0 and parquet["bytes_read"] > 0 and parquet["output_bytes"] > 0
+    assert "pivot" in set(events.loc[events["call_id"] == calls["call_id"].iloc[2], "stage"])
+    summary = q.profile_summary()
+    assert summary.loc[("load_factors", "call"), "count"] == 2
+
+    # Concurrent calls count only their own cache lookups
+    q.profiler.clear()
+    q.load_many(
+        [{"method": "load_factors", "country": "usa", "dataset": "factor", "weighting": w} for w in ("ew", "vw", "ew", "vw")],
+        max_workers=4,
+    )
+    events = q.profile_events()
+    calls = events[events["stage"] == "call"].set_index("call_id")
+    lookups = events[events["stage"] == "cache"].groupby("call_id")[["cache_hits", "cache_misses"]].sum()
+    children = calls[calls["call"] == "load_factors"]
+    assert len(children) == 4
+    assert (children[["cache_hits", "cache_misses"]] == lookups.loc[children.index]).all().all()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sink_path = Path(tmp) / "events.jsonl"
+        with profiling.profile(profiling.JsonLinesSink(sink_path)) as prof:
+            QDL(cache=False).load_char_dataset(country="usa", vintage="2020-", columns=["be_me"])
+        lines = [json.loads(line) for line in sink_path.read_text().splitlines()]
+    assert len(lines) == len(prof.events)
+    assert {"read_parquet", "call"} <= {e["stage"] for e in lines if e["call"] == "load_char_dataset"}
+    # Nothing is recorded outside a profiled call
+    QDL(cache=False).load_factors(country="usa", dataset="factor", weighting="vw")
+    assert len(prof.events) == len(lines)
+    print("profiling: per-call stages, cache hits and JSON-lines sink OK")
+
+
+def run_load_many_tests() -> None:
+    import asyncio
+
+    from qdl.facade import LoadRequest
+
+    requests = [
+        {"method": "load_factors", "country": "usa", "dataset": "factor", "weighting": w} for w in ("ew", "vw")
+    ]
+    requests.append(LoadRequest("load_char", {"country": "usa", "vintage": "2020-", "char": "be_me"}))
+    requests.append(("load_char_dataset", {"country": "usa", "vintage": "1800-"}))
+    q = QDL()
+    results = q.load_many(requests, max_workers=3)
+    assert [r.request.method for r in results] == ["load_factors", "load_factors", "load_char", "load_char_dataset"]
+    assert [r.ok for r in results] == [True, True, True, False]
+    assert isinstance(results[3].error, FileNotFoundError)
+    sequential = QDL(cache=False)
+    assert results[0].value.equals(sequential.load_factors(country="usa", dataset="factor", weighting="ew"))
+    assert results[2].value.equals(sequential.load_char(country="usa", vintage="2020-", char="be_me"))
+
+    async_results = asyncio.run(q.aload_many(requests[:3]))
+    assert all(r.ok for r in async_results) and async_results[1].value.equals(results[1].value)
+    try:
+        q.load_many(requests, raise_errors=True)
+        raise AssertionError("expected FileNotFoundError")
+    except FileNotFoundError:
+        pass
+    print("facade: load_many/aload_many keep request order and per-request errors OK")
+
+
+def run_single_flight_tests() -> None:
+    import asyncio
+    import threading
+    import time
+
+    class SlowLoader:
+        """Delegates to qdl.dataloader, counting (slowed-down) factor loads."""
+
+        def __init__(self) -> None:
+            self.calls = 0
+            self.fail = False
+
+        def __getattr__(self, name: str):
+            return getattr(dataloader, name)
+
+        def load_factors(self, **kwargs):
+            self.calls += 1
+            time.sleep(0.1)
+            if self.fail:
+                raise OSError("simulated read failure")
+            return dataloader.load_factors(**kwargs)
+
+    loader = SlowLoader()
+    q = QDL(loader=loader)
+    results: list = [None] * 8
+    errors: list = []
+
+    def _load(i: int) -> None:
+        try:
+            results[i] = q.load_factors(country="usa", dataset="factor", weighting="ew")
+        except OSError as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=_load, args=(i,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert loader.calls == 1 and not errors
+    assert all(r.equals(results[0]) for r in results)
+    assert q.cache_stats().coalesced == 7
+
+    # A failed load is shared with the waiters and not cached
+    loader.fail = True
+    loader.calls = 0
+    threads = [threading.Thread(target=_load, args=(i,)) for i in range(4)]
+    q.clear_cache()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert loader.calls == 1 and len(errors) == 4 and len(q.cache) == 0
+
+    loader.fail = False
+    loader.calls = 0
+
+    async def _many() -> list:
+        return await asyncio.gather(
+            *(q.aload("load_factors", country="usa", dataset="factor", weighting="vw") for _ in range(5))
+        )
+
+    frames = asyncio.run(_many())
+    assert loader.calls == 1 and all(f.equals(frames[0]) for f in frames)
+    print("cache: single-flight loads across threads and asyncio OK")
+
+
+def run_panel_server_tests() -> None:
+    import tempfile
+
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    from qdl import dtypes, server
+
+    local = QDL()
+    wide = local.load_char(country="usa", vintage="2020-", char="be_me")
+    # Wide numeric panels decode as views of the received buffer
+    raw = bytearray(server._serialize_stream(server.frame_to_table(wide)).to_pybytes())
+    decoded = server.table_to_frame(pa.ipc.open_stream(pa.py_buffer(raw)).read_all(), backing=raw)
+    assert decoded.equals(wide) and decoded.columns.equals(wide.columns)
+    assert np.shares_memory(decoded.to_numpy(), np.frombuffer(raw, dtype=np.uint8))
+
+    some_ids = [int(i) for i in wide.columns[::3]]
+    policy = dtypes.DtypePolicy(float_dtype="float32", id_dtype="category", keep_float64=("be_me",))
+    with tempfile.TemporaryDirectory() as tmp, server.PanelServer(f"unix://{tmp}/qdl.sock", shm_dir=tmp) as srv:
+        for transport in ("ipc", "shm"):
+            q = QDL(remote=srv.address, remote_transport=transport)
+            assert q.load_char(country="usa", vintage="2020-", char="be_me").equals(wide)
+            factors = q.load_factors(country="usa", dataset="factor", weighting="vw")
+            assert factors.equals(local.load_factors(country="usa", dataset="factor", weighting="vw"))
+            chars = q.load_char_dataset(country="usa", vintage="2020-", columns=["be_me", "size_grp"])
+            assert chars.equals(local.load_char_dataset(country="usa", vintage="2020-", columns=["be_me", "size_grp"]))
+            report = q.validate_factor(user=factors, weighting="vw", return_plot=False)
+            assert report.rmse == 0.0
+            # Non-JSON arguments are encoded explicitly (arrays/Index/sets as lists, policies by name or fields)
+            for kwargs in (
+                {"ids": np.array(some_ids), "dtype_policy": policy, "start": pd.Timestamp("2021-01-31")},
+                {"ids": set(some_ids), "dtype_policy": "lean"},
+                {"ids": pd.Index(some_ids), "dtype_policy": dtypes.LEAN, "filters": [("size_grp", "in", ("large", "mega"))]},
+            ):
+                got = q.load_char_dataset(country="usa", vintage="2020-", columns=["be_me", "size_grp"], **kwargs)
+                expected = local.load_char_dataset(country="usa", vintage="2020-", columns=["be_me", "size_grp"], **kwargs)
+                assert len(got) > 0 and got.equals(expected) and list(got.dtypes) == list(expected.dtypes)
+            got = q.load_char(country="usa", vintage="2020-", char="be_me", ids=np.array(some_ids), dtype_policy=policy)
+            expected = local.load_char(country="usa", vintage="2020-", char="be_me", ids=some_ids, dtype_policy=policy)
+            assert got.equals(expected) and got.columns.dtype == expected.columns.dtype  # categorical ids keep int categories
+            try:
+                q.load_char_dataset(country="usa", vintage="2020-", filters=pc.field("be_me") > 0)
+                raise AssertionError("expected TypeError")
+            except TypeError:
+                pass
+            try:
+                q.load_factors(country="usa", dataset="factor", weighting="vw", factors=["__nope__"])
+                raise AssertionError("expected KeyError")
+            except KeyError:
+                pass
+        assert srv.qdl.cache_stats().hits > 0
+    print("server: remote facade over ipc/shm matches local loads OK")
+
+
+def run_panel_store_tests() -> None:
+    import tempfile
+
+    from qdl.panel_store import PanelStore
+
+    expected = QDL().load_char(country="usa", vintage="2020-", char="be_me")
+    with tempfile.TemporaryDirectory() as tmp:
+        store = PanelStore(tmp)
+        QDL(panel_store=store).load_char(country="usa", vintage="2020-", char="be_me")
+        assert [p.char for p in store.list()] == ["be_me"] and store.total_bytes() > expected.to_numpy().nbytes
+
+        # A fresh instance (no in-process cache) serves the memory-mapped panel
+        q = QDL(panel_store=store, cache=False)
+        wide = q.load_char(country="usa", vintage="2020-", char="be_me")
+        assert wide.equals(expected) and wide.index.equals(expected.index) and wide.columns.equals(expected.columns)
+        base = wide._mgr.blocks[0].values
+        while base is not None and not isinstance(base, np.memmap):
+            base = base.base
+        assert base is not None
+        wide.iloc[0, 0] = -1.0  # copy-on-write map: the stored panel is untouched
+        assert q.load_char(country="usa", vintage="2020-", char="be_me").equals(expected)
+
+        panels = q.load_chars_wide(country="usa", vintage="2020-", chars=["be_me", "ret_12_1"])
+        assert panels["be_me"].equals(expected)
+        assert sorted(p.char for p in store.list()) == ["be_me", "ret_12_1"]
+        # Row predicates bypass the store
+        q.load_char(country="usa", vintage="2020-", char="be_me", start="2021-01-01")
+        assert len(store.list()) == 2 and not store.to_frame()["stale"].any()
+
+        assert store.purge(char="ret_12_1") == 1 and store.purge() == 1
+        assert store.list() == [] and store.total_bytes() == 0
+    print("panel store: memory-mapped panels persist across instances, purge OK")
+
+
+def run_char_history_tests() -> None:
+    import tempfile
+
+    from qdl import config, profiling, server, synthetic
+
+    with tempfile.TemporaryDirectory() as root, config.data_root(root):
+        config.CHARS_PATH.mkdir(parents=True)
+        frames = {}
+        # Overlapping vintages; the 2000- vintage drops stock 7
+        for vintage, start, n_months in (("1972-", "2000-01-31", 48), ("2000-", "2001-01-31", 36), ("2020-", "2003-01-31", 24)):
+            df = synthetic.generate_chars(n_stocks=40, n_months=n_months, start=start, seed=len(frames))
+            if vintage == "2000-":
+                df = df[df["id"] != 7]
+            frames[vintage] = df.assign(vintage=vintage)
+            df.to_parquet(config.CHARS_PATH / f"jkp_{vintage}_usa.parquet", index=False, row_group_size=len(df) // n_months * 6)
+
+        q = QDL()
+        cols = ["be_me", "ret_exc"]
+        stitched = q.load_char_history(country="usa", columns=cols, source_col="vintage")
+        expected = (
+            pd.concat([frames[v] for v in ("2020-", "2000-", "1972-")])
+            .drop_duplicates(["eom", "id"], keep="first")
+            .sort_values(["eom", "id"], kind="stable")[["eom", "id", *cols, "vintage"]]
+            .reset_index(drop=True)
+        )
+        pd.testing.assert_frame_equal(stitched.assign(vintage=stitched["vintage"].astype(object)), expected, check_dtype=False)
+        # Stock 7 is missing from 2000-, so the 1972- rows fill its gap
+        assert set(stitched.loc[(stitched["id"] == 7) & (stitched["eom"] < "2003-01-01"), "vintage"]) == {"1972-"}
+
+        # Period precedence: each month comes from exactly one vintage
+        by_period = q.load_char_history(country="usa", columns=cols, resolve="period", source_col="vintage")
+        assert (by_period.groupby("eom")["vintage"].nunique() == 1).all()
+
+        # Date pushdown: a range covered only by the newest vintage touches one file
+        with profiling.profile() as prof:
+            recent = q.load_char_history(country="usa", columns=cols, start="2004-01-01", precedence="oldest")
+        reads = prof.to_frame().query("stage == 'read_parquet'")
+        assert recent["eom"].min() >= pd.Timestamp("2004-01-01") and len(recent) > 0
+        assert reads["detail"].map(lambda d: "skipped" not in d).sum() == 1
+        assert q.load_char_history(country="usa", columns=cols, source_col="vintage") is not stitched
+        assert q.cache_stats().hits >= 1
+
+        # Served over both transports; shm keys its files on every stitched vintage file
+        with server.PanelServer(f"unix://{root}/qdl.sock", shm_dir=Path(root) / "shm") as srv:
+            for transport in ("ipc", "shm"):
+                remote = QDL(remote=srv.address, remote_transport=transport)
+                for precedence in ("newest", ["2000-", "1972-"]):
+                    got = remote.load_char_history(country="usa", columns=cols, precedence=precedence, source_col="vintage")
+                    local = q.load_char_history(country="usa", columns=cols, precedence=precedence, source_col="vintage")
+                    pd.testing.assert_frame_equal(got, local)
+    print("char history: vintages stitched with row/period precedence and date pushdown OK")
+
+
+def run_partition_tests() -> None:
+    import os
+    import tempfile
+
+    from qdl import config, partition, profiling, synthetic
+
+    with tempfile.TemporaryDirectory() as root, config.data_root(root):
+        synthetic.write_synthetic_data(root, n_stocks=300, n_months=30, datasets=("mkt",), weightings=("vw",))
+        source = config.CHARS_PATH / "jkp_2020-_usa.parquet"
+        q = QDL(cache=False)
+        full = q.load_char_dataset(country="usa", vintage="2020-").sort_values(["eom", "id"], kind="stable")
+        window = dict(columns=["be_me"], start="2021-03-01", end="2021-05-31", ids=[5, 6, 7])
+        sliced = q.load_char_dataset(country="usa", vintage="2020-", **window).sort_values(["eom", "id"])
+        q.build_catalog()
+        plan_window = dict(country="usa", vintage="2020-", columns=["be_me"], start=window["start"], end=window["end"])
+        assert not q.plan_char_query(**plan_window)["partitioned"]
+
+        assert partition.partition_info(country="usa", vintage="2020-") is None
+        assert partition.main(["--country", "usa", "--vintage", "2020-", "--row-group-rows", "100"]) == 0
+        info = partition.partition_info(country="usa", vintage="2020-")
+        assert info.rows == len(full) and info.years == [2020, 2021, 2022] and info.row_groups > 30
+        assert dataloader.resolve_chars_path(file_name=source.name) == source.with_suffix("")
+
+        # The catalog entry of the monolithic file goes stale; a rebuild plans against the copy's footers
+        try:
+            q.plan_char_query(**plan_window)
+            raise AssertionError("expected KeyError")
+        except KeyError:
+            pass
+        q.build_catalog()
+        plan = q.plan_char_query(**plan_window)
+        assert plan["partitioned"] and plan["path"] == source.with_suffix("").resolve()
+        assert q.describe_chars(country="usa", vintage="2020-").num_row_groups == info.row_groups
+        assert len(sliced) <= plan["estimated_rows"] < len(full) / 5
+
+        # Loaders read the partitioned copy transparently (rows come back sorted by (eom, id))
+        pd.testing.assert_frame_equal(q.load_char_dataset(country="usa", vintage="2020-"), full.reset_index(drop=True))
+        with profiling.profile() as prof:
+            got = q.load_char_dataset(country="usa", vintage="2020-", **window)
+        pd.testing.assert_frame_equal(got, sliced.reset_index(drop=True))
+        read = prof.to_frame().query("stage == 'read_parquet'").iloc[0]
+        assert read["detail"]["file"] == "jkp_2020-_usa" and read["rows"] == len(sliced)
+        wide = q.load_char(country="usa", vintage="2020-", char="be_me")
+        assert wide.shape == (30, full["id"].nunique())
+        months = list(q.iter_char_batches(country="usa", vintage="2020-", by="month", batch_rows=1000))
+        assert sum(len(m) for m in months) == len(full) and "year" not in months[0].columns
+
+        try:
+            partition.repartition_chars(country="usa", vintage="2020-")
+            raise AssertionError("expected FileExistsError")
+        except FileExistsError:
+            pass
+        # A rewritten source invalidates the copy; a removed source keeps it in use
+        os.utime(source, ns=(source.stat().st_atime_ns, source.stat().st_mtime_ns + 1))
+        assert dataloader.resolve_chars_path(file_name=source.name) == source
+        partition.repartition_chars(country="usa", vintage="2020-", overwrite=True)
+        source.unlink()
+        assert dataloader.chars_vintages(country="usa") == ["2020-"]
+        assert len(q.load_char_dataset(country="usa", vintage="2020-", columns=["be_me"])) == len(full)
+        q.build_catalog()
+        assert q.plan_char_query(**plan_window)["partitioned"]
+        assert partition.remove_partitioned(country="usa", vintage="2020-")
+    print("partition: hive-partitioned copies are read transparently with pruning OK")
+
+
 def main() -> None:
     q = QDL()
 
@@ -158,12 +911,37 @@ def main() -> None:
     if report.figure is not None:
         try:
             import matplotlib.pyplot as plt  # type: ignore
-            plt.show(report.figure)
+            plt.show()
         except Exception:
             pass
 
     # 3) Facade validate_factor API tests
     run_validate_factor_facade_tests()
+    run_facade_cache_tests()
+    run_factor_sidecar_tests()
+    run_load_chars_wide_tests()
+    run_to_wide_fast_path_tests()
+    run_row_predicate_tests()
+    run_iter_char_batches_tests()
+    run_dtype_policy_tests()
+    run_factor_construction_tests()
+    run_factor_zoo_tests()
+    run_validator_core_tests()
+    run_validate_many_tests()
+    run_lazy_plot_tests()
+    run_rolling_metrics_tests()
+    run_catalog_tests()
+    run_non_strict_projection_tests()
+    run_import_budget_tests()
+    run_synthetic_data_tests()
+    run_benchmark_suite_tests()
+    run_profiling_tests()
+    run_load_many_tests()
+    run_single_flight_tests()
+    run_panel_server_tests()
+    run_panel_store_tests()
+    run_char_history_tests()
+    run_partition_tests()
 
     # 특성 데이터 로드(JKP 빈티지/국가 기준)
     chars = q.load_chars(
@@ -179,4 +957,15 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    import sys
+
+    if "--synthetic" in sys.argv:
+        # Run against generated JKP-shaped data instead of the downloaded data root
+        import tempfile
+
+        from qdl import config, synthetic
+
+        root = tempfile.mkdtemp(prefix="qdl_synthetic_")
+        synthetic.write_synthetic_data(root, vintages=("2020-", "2000-", "1972-"), n_months=60, duplicate_rate=0.01)
+        config.set_data_root(root)
     main()
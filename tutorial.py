@@ -109,8 +109,8 @@ if report.per_factor_metrics:
 
 try:
     import matplotlib.pyplot as plt
-    if report.figure is not None:
-        plt.show(report.figure)
+    if report.figure is not None:  # rendered on first access and registered with pyplot
+        plt.show()
 except Exception:
     pass
 